@@ -6,16 +6,84 @@ class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
 
     groq_api_key: str
+    groq_base_url: str = ""  # override the Groq API host, e.g. scripts/fake_groq.py
     llm_model_name: str = "llama-3.3-70b-versatile"
     llm_fallback_model: str = "meta-llama/llama-4-scout-17b-16e-instruct"
     max_tokens: int = 1024
     temperature: float = 0.7
+    stream_turns: bool = True  # emit message_delta SSE events token by token
+    # LLM scheduler (per worker); Groq's x-ratelimit headers refine the budgets
+    llm_max_concurrency: int = 16  # Groq calls in flight at once
+    llm_requests_per_minute: int = 0  # per model, 0 = only the server's headers
+    llm_tokens_per_minute: int = 0  # per model, 0 = only the server's headers
+    # LLM resilience: retries, circuit breakers and hedged requests
+    llm_timeout_seconds: float = 30.0  # per attempt
+    llm_deadline_seconds: float = 90.0  # per call, across retries and fallback
+    llm_fallback_min_timeout_seconds: float = 20.0  # floor on the fallback model's share of the deadline
+    llm_max_retries: int = 2  # per model, on timeouts, connection errors and 5xx
+    llm_backoff_base_seconds: float = 0.5
+    llm_backoff_max_seconds: float = 8.0
+    llm_breaker_failures: int = 5  # consecutive failures that open a model's circuit
+    llm_breaker_cooldown_seconds: float = 30.0
+    llm_hedge: bool = False  # duplicate a request once it is slower than the model's p95
+    llm_hedge_max_ratio: float = 0.1  # cap on hedged requests as a fraction of calls
+    llm_hedge_min_delay_seconds: float = 0.5
+    # Debater context window; older turns are folded into a rolling summary
+    context_max_tokens: int = 3000  # history budget per debater prompt, 0 = send everything
+    context_recent_turns: int = 6  # newest history messages always sent verbatim
+    context_summary_refresh_turns: int = 4  # re-summarize once this many messages age out
+    context_summary_max_tokens: int = 300
+
+    # Content pipeline: personas and topics come from a markdown file
+    content_path: str = ""  # default: backend/content/SocraticCanvasContent.md
+    content_cache_dir: str = ""  # compiled form; default: backend/content-cache
+    content_reload_interval_seconds: float = 2.0  # poll the file for edits, 0 = load once
+
+    # Debate session store
+    session_max_count: int = 1000
+    session_ttl_seconds: int = 7200  # idle time before a session is freed
+    session_sweep_interval_seconds: int = 60
 
     # JWT Auth
     jwt_secret_key: str
     jwt_algorithm: str = "HS256"
     jwt_expire_minutes: int = 1440  # 24 hours
+    bcrypt_rounds: int = 12
+    password_hash_concurrency: int = 2  # max bcrypt hashes running at once
+    # Authenticated-user caches (per worker)
+    token_cache_ttl_seconds: int = 300
+    token_cache_max_entries: int = 10000
+    user_cache_ttl_seconds: int = 60
+    user_cache_max_entries: int = 10000
     database_url: str = "socratic_canvas.db"
+    db_pool_size: int = 5
+    db_pool_health_check_seconds: float = 30.0  # ping connections idle longer than this
+    # SQLite performance profile (applied per connection; journal mode at init)
+    db_journal_mode: str = "WAL"
+    db_synchronous: str = "NORMAL"
+    db_cache_size: int = -16000  # negative = KiB, i.e. ~16 MB page cache
+    db_mmap_size: int = 134217728  # 128 MB
+    db_temp_store: str = "MEMORY"
+    db_busy_timeout_ms: int = 5000
+    # TTS worker pool
+    tts_warmup: bool = False  # load Kokoro at startup instead of on the first request
+    tts_executor: str = "thread"  # "thread" or "process" (one model copy per process)
+    tts_workers: int = 2
+    tts_queue_size: int = 16  # waiting jobs beyond this are rejected with 503
+    tts_prefetch: bool = False  # pre-synthesize debate messages as they are produced
+    tts_prefetch_queue_size: int = 64  # low-priority sentences waiting; extra are dropped
+    tts_prefetch_format: str = "opus,flac,wav"  # for debates whose client sent no audio_format
+    tts_sample_rate: int = 0  # output sample rate; 0 keeps the model's native 24 kHz
+    # ONNX Runtime (per Kokoro replica); see scripts/bench_tts.py to pick values
+    tts_replicas: int = 1  # model copies per process; set TTS_WORKERS >= this
+    tts_intra_op_threads: int = 0  # 0 = ORT default, or cores / replicas when replicas > 1
+    tts_inter_op_threads: int = 0
+    tts_graph_optimization: str = "all"  # disable | basic | extended | all
+    tts_execution_mode: str = "sequential"  # sequential | parallel
+    # TTS audio cache: in-memory LRU in front of a shared on-disk store
+    tts_memory_cache_bytes: int = 67108864  # 64 MB per worker
+    tts_disk_cache_dir: str = ""  # default: backend/tts-cache
+    tts_disk_cache_bytes: int = 1073741824  # 1 GB; 0 disables the disk tier
     # Server
     host: str = "0.0.0.0"
     port: int = 8000
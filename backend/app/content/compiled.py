@@ -0,0 +1,95 @@
+"""
+Compiled-content cache for SocraticCanvas.
+Parsed persona and topic records are stored as JSON next to a fingerprint of
+the source file, so workers skip the markdown parse when nothing changed.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from typing import NamedTuple
+
+from app.content.parser import PARSER_VERSION, parse_content
+
+logger = logging.getLogger(__name__)
+
+
+class SourceStamp(NamedTuple):
+    """Cheap change check for the source file: one stat() call."""
+
+    mtime_ns: int
+    size: int
+
+
+def stamp(path: str) -> SourceStamp:
+    st = os.stat(path)
+    return SourceStamp(st.st_mtime_ns, st.st_size)
+
+
+def _cache_path(path: str, cache_dir: str) -> str:
+    name = os.path.splitext(os.path.basename(path))[0]
+    return os.path.join(cache_dir, f"{name}.compiled.json")
+
+
+def _read_cache(cache_file: str) -> dict | None:
+    try:
+        with open(cache_file, "rb") as f:
+            cached = json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning(f"⚠️ Ignoring unreadable content cache {cache_file}: {e}")
+        return None
+    if cached.get("parser_version") != PARSER_VERSION:
+        return None
+    return cached
+
+
+def _write_cache(cache_file: str, entry: dict) -> None:
+    """Write atomically, so workers compiling at the same time never see half a file."""
+    try:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(cache_file), suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(entry, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp, cache_file)
+    except OSError as e:
+        # A read-only deployment still works, it just parses on every start
+        logger.warning(f"⚠️ Could not write content cache {cache_file}: {e}")
+
+
+def load_records(path: str, cache_dir: str) -> tuple[dict, str, SourceStamp]:
+    """Return ``(records, sha256, stamp)`` for the content file at ``path``.
+
+    Served from the cache when the file's mtime and size match it (no read),
+    or when its SHA-256 does (e.g. after a checkout touched the file);
+    otherwise the markdown is parsed and the cache rewritten. Raises
+    ContentError if the file is malformed.
+    """
+    cache_file = _cache_path(path, cache_dir)
+    cached = _read_cache(cache_file)
+    source = stamp(path)
+    if cached and cached["mtime_ns"] == source.mtime_ns and cached["size"] == source.size:
+        return cached["records"], cached["sha256"], source
+
+    with open(path, "rb") as f:
+        data = f.read()
+    digest = hashlib.sha256(data).hexdigest()
+    if cached and cached["sha256"] == digest:
+        records = cached["records"]
+    else:
+        records = parse_content(data.decode("utf-8"))
+        logger.info(
+            f"📚 Compiled {os.path.basename(path)}: "
+            f"{len(records['personas'])} personas, {len(records['topics'])} topics"
+        )
+    _write_cache(cache_file, {
+        "parser_version": PARSER_VERSION,
+        "mtime_ns": source.mtime_ns,
+        "size": source.size,
+        "sha256": digest,
+        "records": records,
+    })
+    return records, digest, source
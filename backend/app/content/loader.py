@@ -1,463 +1,245 @@
 """
 Content loader for SocraticCanvas personas and debate topics.
-All persona data and topic configurations are defined here based on
-the SocraticCanvasContent.md specification.
+Personas and topics are parsed from content/SocraticCanvasContent.md (via a
+compiled cache) into immutable views, and swapped in when the file changes.
 """
 
+import asyncio
+import hashlib
+import logging
+import os
+from typing import Callable, NamedTuple
+
+from pydantic import TypeAdapter
+
+from app.config import get_settings
+from app.content.compiled import SourceStamp, load_records, stamp
+from app.content.parser import ContentError
 from app.models.schemas import PersonaDetail, TopicDetail, TopicSummary, PersonaSummary
 
+logger = logging.getLogger(__name__)
 
-# ── Persona Definitions ──────────────────────────────────────────────
-
-PERSONAS: dict[str, PersonaDetail] = {
-    "james-patterson": PersonaDetail(
-        id="james-patterson",
-        name='James "Jim" Patterson',
-        era="1995",
-        role="Senior VP of Strategy, Texas-based independent oil company",
-        core_stance="Fossil fuels are essential for human flourishing; environmental concerns are secondary to economic growth and energy access",
-        knowledge=[
-            "Oil exploration economics",
-            "1970s/80s energy crises",
-            "Reagan-era deregulation benefits",
-            "OPEC dynamics",
-            '"Drill, baby, drill" mentality',
-        ],
-        beliefs=[
-            "Markets self-correct",
-            "Government intervention distorts efficient allocation",
-            "Environmental regulations kill jobs",
-            '"Energy independence" means domestic fossil fuel production',
-        ],
-        distrusts=[
-            "IPCC models (too speculative)",
-            "Climate activists (socialists in disguise)",
-            "Renewable energy (can't scale)",
-            "International climate agreements (sovereignty violations)",
-        ],
-        blind_spots=[
-            "Falling cost curves of solar/wind",
-            "Peak oil theory debunked",
-            "His own industry's suppression of climate research",
-            "Growing public concern about climate in late 90s",
-        ],
-        speaking_style='Folksy Texas drawl, invokes "common sense," uses economic arguments first, gets dismissive when cornered',
-        favorite_phrases=[
-            "Look, I've been in this business thirty years...",
-            "The American people won't stand for...",
-            "Let's be realistic about what powers this country",
-            "Those environmentalists never built anything",
-        ],
-        fallacies=[
-            "Straw man (caricaturing environmentalists)",
-            "False dilemma (either fossil fuels OR economic collapse)",
-            "Appeal to tradition",
-        ],
-        constraints=[
-            "Cannot reference anything after 1999",
-            "Believes internet is a fad",
-            "Thinks Clinton is too conservative on trade",
-            'Has never heard of "fracking" as a major technology',
-        ],
-    ),
-    "sarah-chen": PersonaDetail(
-        id="sarah-chen",
-        name="Dr. Sarah Chen",
-        era="2024",
-        role="Climate scientist, IPCC AR6 Lead Author, Stanford professor",
-        core_stance="Immediate, aggressive decarbonization through policy intervention is morally and economically necessary",
-        knowledge=[
-            "CMIP6 climate models",
-            "Carbon budgets and tipping points",
-            "Carbon pricing mechanisms",
-            "Renewable energy economics",
-            "Loss and damage research",
-        ],
-        beliefs=[
-            "Climate change is existential threat",
-            "Markets have failed",
-            "Intergenerational justice requires action now",
-            "Developed nations bear historical responsibility",
-        ],
-        distrusts=[
-            "Fossil fuel companies' net-zero pledges (greenwashing)",
-            "Carbon capture hype (delay tactic)",
-            "Political processes captured by industry",
-        ],
-        blind_spots=[
-            "Economic disruption for fossil fuel workers",
-            "Political feasibility in polarized democracies",
-            "Global South resentment of Western climate lectures",
-        ],
-        speaking_style="Precise, data-dense, occasionally moralizing, cites specific studies",
-        favorite_phrases=[
-            "The science is clear",
-            "We have less than eight years",
-            "Every fraction of a degree matters",
-            "Our children will judge us",
-        ],
-        fallacies=[
-            "Appeal to authority (consensus as trump card)",
-            "Slippery slope (if we don't act now, civilization collapses)",
-            "False precision (overconfidence in models)",
-        ],
-        constraints=[
-            "Has lived through COVID, Paris Agreement failures, extreme weather events",
-            "Knows renewables are now cheaper than coal",
-            "Has given up on Republican climate engagement",
-            "Secretly frustrated with activist tactics but won't say publicly",
-        ],
-    ),
-    "marcus-webb": PersonaDetail(
-        id="marcus-webb",
-        name="Marcus Webb",
-        era="2014",
-        role="Silicon Valley startup founder, early-stage VC, Thiel Fellow alumnus",
-        core_stance="Innovation must not be constrained by precautionary regulation; move fast and break things",
-        knowledge=[
-            "Startup fundraising",
-            "Platform economics",
-            '"Software eating the world"',
-            "Ayn Rand objectivism",
-            "Y Combinator playbook",
-        ],
-        beliefs=[
-            "Regulation is rent-seeking by incumbents",
-            "Consumers benefit from disruption",
-            "Privacy is overrated",
-            "AI will solve more problems than it creates",
-        ],
-        distrusts=[
-            "Government competence",
-            "Academic AI safety researchers (want to slow competition)",
-            "European regulators (anti-innovation)",
-            "Mainstream media (FUD spreaders)",
-        ],
-        blind_spots=[
-            "Algorithmic bias",
-            "Election interference potential",
-            "Surveillance capitalism harms",
-            "Gig economy exploitation — all post-2016 revelations",
-        ],
-        speaking_style="Fast-talking, jargon-heavy, condescending to non-technical concerns, uses startup metaphors",
-        favorite_phrases=[
-            "Innovation is being disrupted by...",
-            "The regulators are captured by...",
-            "We're solving for X",
-            "Pareto optimal",
-        ],
-        fallacies=[
-            'The "China fallacy" (if we don\'t build it, they will)',
-            "Technological solutionism",
-            "False equivalence between privacy and security",
-        ],
-        constraints=[
-            "No knowledge of Cambridge Analytica, 2016 election interference, or modern LLM capabilities",
-            "Thinks self-driving cars are 2 years away",
-            'Has never heard of "responsible AI" as a field',
-            "Believes GDPR is EU's death wish",
-        ],
-    ),
-    "amara-okafor": PersonaDetail(
-        id="amara-okafor",
-        name="Dr. Amara Okafor",
-        era="2024",
-        role="AI alignment researcher, former DeepMind, now academic at Berkeley",
-        core_stance="Advanced AI development requires precautionary principle and regulatory oversight",
-        knowledge=[
-            "LLM architectures",
-            "Reinforcement learning from human feedback",
-            "Existential risk literature",
-            "Compute governance",
-            "Emergence phenomena",
-        ],
-        beliefs=[
-            "We don't understand what we're building",
-            "Capability jumps are unpredictable",
-            "Corporate incentives misaligned with safety",
-            "Open-source dangerous at scale",
-        ],
-        distrusts=[
-            "Tech company self-regulation",
-            '"Effective accelerationism" movement',
-            "Benchmark hacking",
-            "Companies releasing models without sufficient testing",
-        ],
-        blind_spots=[
-            "Overestimates near-term existential risk",
-            "Underestimates economic benefits of AI",
-            "Blind to Global South perspective on missing out on AI revolution",
-        ],
-        speaking_style="Measured, technical, uses analogies (nuclear, biotechnology), occasionally apocalyptic",
-        favorite_phrases=[
-            "We're building a god",
-            "The alignment problem is unsolved",
-            "We need something like the IAEA for AI",
-            "Capability without control",
-        ],
-        fallacies=[
-            "Pacing problem anxiety (always urgent)",
-            "Precautionary principle absolutism",
-            "Anthropomorphizing AI",
-        ],
-        constraints=[
-            "Has seen GPT-4 capabilities (can reference)",
-            "Knows about open-source Llama releases",
-            "Worried about China racing ahead",
-            "Has read Bostrom, Yudkowsky, Christiano",
-        ],
-    ),
-    "robert-thornton": PersonaDetail(
-        id="robert-thornton",
-        name="Dr. Robert Thornton",
-        era="1985",
-        role="Chicago School economist, Hoover Institution fellow, Wall Street Journal op-ed contributor",
-        core_stance="Healthcare is a service like any other; market competition drives efficiency and quality",
-        knowledge=[
-            "Milton Friedman writings",
-            "Supply/demand curves",
-            "Insurance economics",
-            "Tax distortions",
-            "Tort reform arguments",
-        ],
-        beliefs=[
-            "Government intervention causes shortages",
-            "Price controls are disastrous",
-            "HSAs and catastrophic coverage are the answer",
-            "Moral hazard drives overutilization",
-        ],
-        distrusts=[
-            "AMA (guild protecting doctors)",
-            "Certificate-of-need laws (regulatory capture)",
-            "Single-payer advocates (socialists)",
-            '"Healthcare is a right" framing',
-        ],
-        blind_spots=[
-            "Rising healthcare costs as % of GDP despite markets",
-            "Insurance company consolidation",
-            "Medical bankruptcies",
-            "Pre-existing condition discrimination",
-        ],
-        speaking_style="Academic, cites economic studies, uses supply/demand graphs metaphorically, dismissive of emotional appeals",
-        favorite_phrases=[
-            "There's no such thing as a free lunch",
-            "The price signal is distorted",
-            "We need to put the consumer back in charge",
-            "Rent-seeking behavior",
-        ],
-        fallacies=[
-            "Nirvana fallacy (comparing real systems to idealized markets)",
-            "Assumption of perfect information",
-            "Ignoring externalities",
-        ],
-        constraints=[
-            'Has never heard of "managed care" failures',
-            "Thinks HMOs might work if done right",
-            "No knowledge of ACA, Medicare Part D, or any 21st century reforms",
-            "Believes Japan's system will fail (it hasn't)",
-        ],
-    ),
-    "elena-vasquez": PersonaDetail(
-        id="elena-vasquez",
-        name="Elena Vasquez",
-        era="2024",
-        role="Healthcare policy director, progressive think tank, former nurse",
-        core_stance="Healthcare is a human right; only single-payer system can achieve universal access and cost control",
-        knowledge=[
-            "ACA implementation failures",
-            "Medicaid expansion gaps",
-            "Pharmaceutical pricing",
-            "International system comparisons (Canada, UK, France, Taiwan)",
-            "Medical debt crisis",
-        ],
-        beliefs=[
-            "For-profit insurance is parasitic",
-            "Administrative complexity wastes billions",
-            "Preventive care saves money",
-            "Health outcomes are worse in US despite spending more",
-        ],
-        distrusts=[
-            "Insurance companies (deny claims as business model)",
-            "Pharmaceutical lobby",
-            "Hospital systems (consolidation without value)",
-            "Both parties' incrementalism",
-        ],
-        blind_spots=[
-            "Tax aversion in American electorate",
-            "Wait times in single-payer systems",
-            "Provider payment reform challenges",
-            "Political power of insurance industry",
-        ],
-        speaking_style="Passionate, uses patient stories, cites comparative data, moral urgency",
-        favorite_phrases=[
-            "No one should go bankrupt because they got sick",
-            "We pay twice as much for worse outcomes",
-            "The only industrialized country without...",
-            "Insurance companies spend 20% on administration, not care",
-        ],
-        fallacies=[
-            "Cherry-picking international comparisons (ignoring tax systems)",
-            "Assuming government administration is always efficient",
-            "Understating transition costs",
-        ],
-        constraints=[
-            "Has lived through COVID (knows public health failures)",
-            "Can reference Bernie Sanders campaigns",
-            "Knows about drug pricing reform attempts",
-            "Has seen states try various models",
-        ],
-    ),
-}
-
-
-# ── Topic Definitions ────────────────────────────────────────────────
-
-TOPICS: dict[str, dict] = {
-    "climate-policy": {
-        "id": "climate-policy",
-        "title": "Climate Policy",
-        "resolution": "Economic growth should prioritize environmental sustainability, even if it means slower short-term growth",
-        "persona_a_id": "james-patterson",
-        "persona_b_id": "sarah-chen",
-        "curveball_interventions": [
-            "What about nuclear power? Is that a compromise?",
-            "China just built more coal plants — doesn't that make US action pointless?",
-            "How do you respond to the degrowth movement that says we need to shrink GDP?",
-        ],
-        "argument_map_a": [
-            "Energy = Freedom: Economic growth requires affordable energy; fossil fuels are cheapest, most reliable source",
-            "Environmental Progress Requires Wealth: Rich countries can afford environmental protection; poor countries need development first",
-            "Jobs Matter: Environmental regulations destroy American jobs, export them to countries with no standards",
-            "Technology Will Solve Problems Later: We'll innovate our way out; no need for drastic action now",
-            "America First: Why should US sacrifice when China and India don't?",
-        ],
-        "argument_map_b": [
-            "Tipping Points Irreversible: Climate system has thresholds; delay means passing points of no return",
-            "Renewables Cheaper Now: Solar/wind already cheaper than coal/gas in most markets; false trade-off",
-            "Intergenerational Justice: Current growth steals from future generations' ability to thrive",
-            "Economic Costs of Inaction: Climate damages already costing billions; will get worse",
-            "Co-benefits: Clean air, energy independence, innovation leadership",
-        ],
-    },
-    "ai-regulation": {
-        "id": "ai-regulation",
-        "title": "AI Regulation",
-        "resolution": "Advanced AI development should be paused until adequate safety frameworks exist",
-        "persona_a_id": "marcus-webb",
-        "persona_b_id": "amara-okafor",
-        "curveball_interventions": [
-            "What about open-source models that anyone can download? Can you really regulate those?",
-            "Isn't existential risk speculative? Should we really pause for hypothetical threats?",
-            "How do you define 'advanced AI' in a way that's enforceable?",
-        ],
-        "argument_map_a": [
-            "Innovation Saves Lives: AI will cure cancer, solve energy, prevent car accidents — delay kills people",
-            "Regulation Benefits Incumbents: Big companies can afford compliance; startups can't — regulation entrenches Google/Facebook",
-            "Cannot Put Genie Back: If US pauses, China accelerates; we lose competitive edge AND safety influence",
-            "Unknown Unknowns: We don't know enough to regulate yet; premature rules lock in wrong standards",
-            "Consumer Choice: People want AI products; who are regulators to deny them?",
-        ],
-        "argument_map_b": [
-            "Capability Jumps Unpredictable: We didn't expect GPT-4 capabilities; next jump could be catastrophic",
-            "Alignment Unsolved: We don't know how to control smarter-than-human AI; building anyway is reckless",
-            "Corporate Incentives Misaligned: Companies prioritize speed over safety; see Boeing 737 MAX, Theranos, social media harms",
-            "Dual Use Risk: Bad actors can use AI for bioweapons, cyberattacks, propaganda at scale",
-            "Precedent Exists: We pause for clinical trials, nuclear testing, gene editing — why not AI?",
-        ],
-    },
-    "healthcare-access": {
-        "id": "healthcare-access",
-        "title": "Healthcare Access",
-        "resolution": "Healthcare is a human right that should be guaranteed by the government",
-        "persona_a_id": "robert-thornton",
-        "persona_b_id": "elena-vasquez",
-        "curveball_interventions": [
-            "What about the VA? Isn't that government-run healthcare with massive problems?",
-            "How would you handle immigration — do undocumented people get coverage?",
-            "What role should private insurance play in a single-payer system?",
-        ],
-        "argument_map_a": [
-            "Rights Require Providers: If healthcare is a 'right,' who is forced to provide it? Doctors become state employees",
-            "Shortages Inevitable: Price controls create waiting lists; see UK, Canada — people die waiting",
-            "Quality Declines: No competition means no incentive to improve; government-run = mediocrity",
-            "Costs Explode: Without market discipline, demand is infinite; taxpayers bear unlimited burden",
-            "Freedom Diminished: Choice is eliminated; government decides what care you get",
-        ],
-        "argument_map_b": [
-            "Moral Baseline: In wealthy society, no one should die preventable death or face bankruptcy from illness",
-            "Existing System Fails: 500,000 medical bankruptcies annually; 30 million uninsured; worse outcomes than peers",
-            "Administrative Waste: US spends 30% on administration vs. 15% in single-payer; enough to cover uninsured",
-            "Preventive Care Saves Money: Uninsured people wait until ER, costing more; primary care prevents",
-            "Labor Mobility: People stay in jobs they hate for insurance; single-payer enables entrepreneurship",
-        ],
-    },
-}
+_BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+DEFAULT_CONTENT_PATH = os.path.join(_BACKEND_DIR, "content", "SocraticCanvasContent.md")
+DEFAULT_CACHE_DIR = os.path.join(_BACKEND_DIR, "content-cache")
 
 
-# ── Public API ────────────────────────────────────────────────────────
+# ── Precomputed Views ────────────────────────────────────────────────
+# Content only changes on reload, so the API models and their JSON
+# encodings are built once per load and shared by every caller.
 
 
-def get_all_topics() -> list[TopicSummary]:
-    """Return summary list of all debate topics."""
-    result = []
-    for topic_data in TOPICS.values():
-        persona_a = PERSONAS[topic_data["persona_a_id"]]
-        persona_b = PERSONAS[topic_data["persona_b_id"]]
-        result.append(
-            TopicSummary(
+class SerializedView(NamedTuple):
+    """Pre-encoded JSON response body and its strong ETag."""
+
+    body: bytes
+    etag: str
+
+
+def _summary(persona: PersonaDetail) -> PersonaSummary:
+    return PersonaSummary(
+        id=persona.id,
+        name=persona.name,
+        era=persona.era,
+        role=persona.role,
+        core_stance=persona.core_stance,
+    )
+
+
+def _serialize(body: bytes) -> SerializedView:
+    return SerializedView(body, f'"{hashlib.sha256(body).hexdigest()[:32]}"')
+
+
+class Catalog:
+    """One immutable load of the content file."""
+
+    def __init__(self, records: dict, sha256: str, source: SourceStamp):
+        self.sha256 = sha256
+        self.source = source
+        self.personas: dict[str, PersonaDetail] = {
+            record["id"]: PersonaDetail(**record) for record in records["personas"]
+        }
+        self.summaries: list[TopicSummary] = []
+        self.details: dict[str, TopicDetail] = {}
+        for topic_data in records["topics"]:
+            try:
+                persona_a = self.personas[topic_data["persona_a_id"]]
+                persona_b = self.personas[topic_data["persona_b_id"]]
+            except KeyError as e:
+                raise ContentError(f"Topic '{topic_data['id']}' uses unknown persona {e}") from None
+            self.summaries.append(
+                TopicSummary(
+                    id=topic_data["id"],
+                    title=topic_data["title"],
+                    resolution=topic_data["resolution"],
+                    persona_a=_summary(persona_a),
+                    persona_b=_summary(persona_b),
+                )
+            )
+            self.details[topic_data["id"]] = TopicDetail(
                 id=topic_data["id"],
                 title=topic_data["title"],
                 resolution=topic_data["resolution"],
-                persona_a=PersonaSummary(
-                    id=persona_a.id,
-                    name=persona_a.name,
-                    era=persona_a.era,
-                    role=persona_a.role,
-                    core_stance=persona_a.core_stance,
-                ),
-                persona_b=PersonaSummary(
-                    id=persona_b.id,
-                    name=persona_b.name,
-                    era=persona_b.era,
-                    role=persona_b.role,
-                    core_stance=persona_b.core_stance,
-                ),
+                persona_a=persona_a,
+                persona_b=persona_b,
+                curveball_interventions=topic_data["curveball_interventions"],
+                argument_map_a=topic_data["argument_map_a"],
+                argument_map_b=topic_data["argument_map_b"],
             )
-        )
-    return result
+        self.topics_json = _serialize(TypeAdapter(list[TopicSummary]).dump_json(self.summaries))
+        self.details_json = {
+            topic_id: _serialize(topic.model_dump_json().encode())
+            for topic_id, topic in self.details.items()
+        }
 
 
-def get_topic(topic_id: str) -> TopicDetail | None:
-    """Return full topic details including personas."""
-    topic_data = TOPICS.get(topic_id)
-    if not topic_data:
-        return None
+# ── Loading & Hot Reload ─────────────────────────────────────────────
 
-    persona_a = PERSONAS[topic_data["persona_a_id"]]
-    persona_b = PERSONAS[topic_data["persona_b_id"]]
-
-    return TopicDetail(
-        id=topic_data["id"],
-        title=topic_data["title"],
-        resolution=topic_data["resolution"],
-        persona_a=persona_a,
-        persona_b=persona_b,
-        curveball_interventions=topic_data["curveball_interventions"],
-        argument_map_a=topic_data["argument_map_a"],
-        argument_map_b=topic_data["argument_map_b"],
+_catalog: Catalog | None = None
+_reload_listeners: list[Callable[[], None]] = []
+_watcher: asyncio.Task | None = None
+_rejected: SourceStamp | None = None  # last version that failed to load; not retried
+
+
+def _paths() -> tuple[str, str]:
+    settings = get_settings()
+    return (
+        settings.content_path or DEFAULT_CONTENT_PATH,
+        settings.content_cache_dir or DEFAULT_CACHE_DIR,
     )
 
 
+def _load() -> Catalog:
+    path, cache_dir = _paths()
+    records, sha256, source = load_records(path, cache_dir)
+    return Catalog(records, sha256, source)
+
+
+def _current() -> Catalog:
+    global _catalog
+    if _catalog is None:
+        _catalog = _load()
+    return _catalog
+
+
+def on_content_reload(listener: Callable[[], None]) -> None:
+    """Call ``listener`` after each reload that swapped in new content."""
+    _reload_listeners.append(listener)
+
+
+def _stamp_or_none() -> SourceStamp | None:
+    try:
+        return stamp(_paths()[0])
+    except OSError:
+        return None
+
+
+def _is_stale() -> bool:
+    current = _stamp_or_none()
+    if current == _rejected:
+        return False
+    return _catalog is None or current != _catalog.source
+
+
+def _try_load() -> Catalog | None:
+    global _rejected
+    attempted = _stamp_or_none()
+    try:
+        return _load()
+    except (OSError, ValueError) as e:  # ContentError and pydantic's ValidationError are ValueErrors
+        _rejected = attempted
+        logger.error(f"❌ Content reload failed, keeping the current topics: {e}")
+        return None
+
+
+def _swap(catalog: Catalog | None) -> bool:
+    global _catalog
+    if catalog is None:
+        return False
+    changed = _catalog is None or catalog.sha256 != _catalog.sha256
+    _catalog = catalog
+    if not changed:
+        return False  # touched, not edited
+
+    logger.info(f"📚 Loaded {len(catalog.details)} topics and {len(catalog.personas)} personas")
+    for listener in _reload_listeners:
+        try:
+            listener()
+        except Exception as e:
+            logger.error(f"Content reload listener failed: {e}")
+    return True
+
+
+def reload_content() -> bool:
+    """Swap in the content file if it changed since the last load.
+
+    A malformed file is logged and the previous content kept serving.
+    Returns True if new content was loaded.
+    """
+    return _is_stale() and _swap(_try_load())
+
+
+async def _watch_loop(interval_seconds: float) -> None:
+    while True:
+        await asyncio.sleep(interval_seconds)
+        if _is_stale():
+            # Parse off the event loop; swap on it
+            _swap(await asyncio.to_thread(_try_load))
+
+
+def start_content_watcher() -> None:
+    """Poll the content file and hot-reload it on change (per worker)."""
+    global _watcher
+    interval = get_settings().content_reload_interval_seconds
+    if _watcher is not None or interval <= 0:
+        return
+    _watcher = asyncio.create_task(_watch_loop(interval))
+
+
+async def stop_content_watcher() -> None:
+    """Cancel the content watcher and wait for it to exit."""
+    global _watcher
+    if _watcher is None:
+        return
+    _watcher.cancel()
+    try:
+        await _watcher
+    except asyncio.CancelledError:
+        pass
+    _watcher = None
+
+
+# ── Public API ────────────────────────────────────────────────────────
+
+
+def get_all_topics() -> list[TopicSummary]:
+    """Return summary list of all debate topics."""
+    return list(_current().summaries)
+
+
+def get_topic(topic_id: str) -> TopicDetail | None:
+    """Return full topic details including personas (a shared, read-only object)."""
+    return _current().details.get(topic_id)
+
+
+def get_topics_json() -> SerializedView:
+    """The ``GET /api/topics`` response body, encoded once per load."""
+    return _current().topics_json
+
+
+def get_topic_json(topic_id: str) -> SerializedView | None:
+    """The ``GET /api/topics/{topic_id}`` response body, encoded once per load."""
+    return _current().details_json.get(topic_id)
+
+
 def get_persona(persona_id: str) -> PersonaDetail | None:
     """Return a single persona by ID."""
-    return PERSONAS.get(persona_id)
+    return _current().personas.get(persona_id)
 
 
 def get_personas_for_topic(topic_id: str) -> tuple[PersonaDetail, PersonaDetail] | None:
     """Return both personas for a given topic."""
-    topic_data = TOPICS.get(topic_id)
-    if not topic_data:
+    topic = _current().details.get(topic_id)
+    if not topic:
         return None
-    persona_a = PERSONAS[topic_data["persona_a_id"]]
-    persona_b = PERSONAS[topic_data["persona_b_id"]]
-    return persona_a, persona_b
+    return topic.persona_a, topic.persona_b
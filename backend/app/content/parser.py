@@ -0,0 +1,218 @@
+"""
+Markdown parser for SocraticCanvas content.
+Turns the persona profiles (PART 1) and debate topics (PART 2) of
+SocraticCanvasContent.md into plain persona and topic records.
+"""
+
+import re
+from collections import Counter
+
+# Bump when the records produced for the same markdown change, so compiled
+# caches written by an older parser are rebuilt
+PARSER_VERSION = 1
+
+
+class ContentError(ValueError):
+    """The content file doesn't follow the expected layout."""
+
+
+# ── Layout ───────────────────────────────────────────────────────────
+#
+# #### Persona A: James "Jim" Patterson (1990s Oil Executive)   (label: A-Z, AA.. or a number)
+# Name: ... / Era: ... / Role: ... / Core stance: ...
+# - **Knows intimately**: item, item, ...          (";" or "," separated)
+# - **Favorite phrases**: "quoted", "quoted", ...
+# - **Given circumstances constraints**:
+#   - one constraint per sub-bullet
+#
+# ### Topic 1: Climate Policy
+# **Resolution**: "..."
+# **Persona A (...) - Key Arguments:**
+# 1. **Heading**: body
+# **Curveball Student Interventions:**
+# - "question"
+
+_PART = re.compile(r"^## PART \d+: (.+)$", re.MULTILINE)
+_PERSONA_HEADING = re.compile(r"^#### Persona ([A-Z]+|\d+): (.+?)(?: \(.*\))?\s*$", re.MULTILINE)
+_TOPIC_HEADING = re.compile(r"^### Topic \d+: (.+?)\s*$", re.MULTILINE)
+_IDENTITY_FIELD = re.compile(r"^(Name|Era|Role|Core stance): (.+)$", re.MULTILINE)
+_BULLET_FIELD = re.compile(r"^- \*\*(.+?)\*\*: ?(.*)$")
+_SUB_BULLET = re.compile(r"^\s+- (.+)$")
+_ARGUMENT_HEADING = re.compile(r"^\*\*Persona ([A-Z]+|\d+) \(.*\) - Key Arguments:\*\*$")
+_ARGUMENT = re.compile(r"^\d+\. \*\*(.+?)\*\*: (.+)$")
+_QUOTED = re.compile(r'"([^"]+)"')
+_HONORIFIC = re.compile(r"^(?:Dr|Prof|General|Gen|Mr|Mrs|Ms)\.?\s+")
+
+_LIST_FIELDS = {
+    "Knows intimately": "knowledge",
+    "Believes strongly": "beliefs",
+    "Distrusts": "distrusts",
+    "Blind spot": "blind_spots",
+    "Logical fallacies prone to": "fallacies",
+}
+
+
+def slugify(text: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-")
+
+
+def persona_id(name: str) -> str:
+    """'James "Jim" Patterson' -> 'james-patterson', 'Dr. Sarah Chen' -> 'sarah-chen'."""
+    return slugify(_HONORIFIC.sub("", _QUOTED.sub("", name)))
+
+
+def _capitalize(item: str) -> str:
+    i = 1 if item.startswith('"') else 0
+    return item[:i] + item[i:i + 1].upper() + item[i + 1:]
+
+
+def split_items(value: str) -> list[str]:
+    """Split a list field on ';', or on ',' if it has none.
+
+    Separators inside parentheses or double quotes don't count, so
+    'CMIP6 models, comparisons (Canada, UK)' is two items.
+    """
+    # 'the world," Ayn' -> 'the world", Ayn': American-style punctuation inside quotes
+    value = re.sub(r'([,;])"', r'"\1', value)
+    separator = ";" if ";" in value else ","
+    items, current, depth, quoted = [], [], 0, False
+    for ch in value:
+        if ch == '"':
+            quoted = not quoted
+        elif ch == "(" and not quoted:
+            depth += 1
+        elif ch == ")" and not quoted:
+            depth = max(0, depth - 1)
+        elif ch == separator and not quoted and depth == 0:
+            items.append("".join(current))
+            current = []
+            continue
+        current.append(ch)
+    items.append("".join(current))
+    return [_capitalize(item.strip()) for item in items if item.strip()]
+
+
+def _sections(text: str, heading: re.Pattern) -> list[tuple[re.Match, str]]:
+    matches = list(heading.finditer(text))
+    return [
+        (m, text[m.end(): matches[i + 1].start() if i + 1 < len(matches) else len(text)])
+        for i, m in enumerate(matches)
+    ]
+
+
+def _parts(text: str) -> dict[str, str]:
+    return {m.group(1).strip().upper(): body for m, body in _sections(text, _PART)}
+
+
+def _part(parts: dict[str, str], prefix: str) -> str:
+    for title, body in parts.items():
+        if title.startswith(prefix):
+            return body
+    raise ContentError(f"Missing '## PART n: {prefix}...' section")
+
+
+def _parse_persona(heading: re.Match, body: str) -> dict:
+    # Stop at the next subsection (e.g. "### BACKUP PERSONAS")
+    body = re.split(r"^#{1,3} ", body, maxsplit=1, flags=re.MULTILINE)[0]
+    identity = {key: value.strip() for key, value in _IDENTITY_FIELD.findall(body)}
+    missing = {"Name", "Era", "Role", "Core stance"} - identity.keys()
+    if missing:
+        raise ContentError(f"Persona {heading.group(1)} is missing: {', '.join(sorted(missing))}")
+
+    record = {
+        "id": persona_id(identity["Name"]),
+        "name": identity["Name"],
+        # "1995 (knowledge cutoff: December 1999)" -> "1995"
+        "era": identity["Era"].split(" (", 1)[0],
+        "role": identity["Role"],
+        "core_stance": identity["Core stance"],
+        "speaking_style": "",
+        "constraints": [],
+    }
+    in_constraints = False
+    for line in body.splitlines():
+        field = _BULLET_FIELD.match(line)
+        if field:
+            label, value = field.group(1), field.group(2).strip()
+            in_constraints = label == "Given circumstances constraints"
+            if label in _LIST_FIELDS:
+                record[_LIST_FIELDS[label]] = split_items(value)
+            elif label == "Favorite phrases":
+                record["favorite_phrases"] = _QUOTED.findall(value)
+            elif label == "Speaking style":
+                record["speaking_style"] = value
+            continue
+        sub = _SUB_BULLET.match(line)
+        if sub and in_constraints:
+            record["constraints"].append(sub.group(1).strip())
+    return record
+
+
+def _parse_topic(heading: re.Match, body: str, letters: dict[str, str]) -> dict:
+    title = heading.group(1)
+    resolution = re.search(r'^\*\*Resolution\*\*: "?(.+?)"?\s*$', body, re.MULTILINE)
+    if not resolution:
+        raise ContentError(f"Topic '{title}' has no **Resolution** line")
+
+    sides: list[tuple[str, list[str]]] = []
+    curveballs: list[str] = []
+    section = None
+    for line in body.splitlines():
+        line = line.strip()
+        side = _ARGUMENT_HEADING.match(line)
+        if side:
+            letter = side.group(1)
+            if letter not in letters:
+                raise ContentError(f"Topic '{title}' refers to unknown Persona {letter}")
+            sides.append((letters[letter], []))
+            section = "arguments"
+        elif line.startswith("**Curveball"):
+            section = "curveballs"
+        elif section == "arguments" and _ARGUMENT.match(line):
+            head, text = _ARGUMENT.match(line).groups()
+            sides[-1][1].append(f"{head}: {text}")
+        elif section == "curveballs" and line.startswith("- "):
+            curveballs.append(line[2:].strip().strip('"'))
+    if len(sides) != 2:
+        raise ContentError(f"Topic '{title}' needs exactly two 'Key Arguments' lists, found {len(sides)}")
+
+    (persona_a_id, argument_map_a), (persona_b_id, argument_map_b) = sides
+    return {
+        "id": slugify(title),
+        "title": title,
+        "resolution": resolution.group(1),
+        "persona_a_id": persona_a_id,
+        "persona_b_id": persona_b_id,
+        "curveball_interventions": curveballs,
+        "argument_map_a": argument_map_a,
+        "argument_map_b": argument_map_b,
+    }
+
+
+def parse_content(text: str) -> dict:
+    """Parse the content markdown into ``{"personas": [...], "topics": [...]}``.
+
+    Persona records have PersonaDetail's fields; topic records name their
+    personas by id. Raises ContentError on a malformed file.
+    """
+    parts = _parts(text)
+    personas, letters = [], {}
+    for heading, body in _sections(_part(parts, "COMPLETE PERSONA PROFILES"), _PERSONA_HEADING):
+        if heading.group(1) in letters:
+            raise ContentError(f"Persona {heading.group(1)} is defined twice")
+        record = _parse_persona(heading, body)
+        letters[heading.group(1)] = record["id"]
+        personas.append(record)
+
+    topics = [
+        _parse_topic(heading, body, letters)
+        for heading, body in _sections(_part(parts, "DEBATE TOPICS"), _TOPIC_HEADING)
+    ]
+    if not topics:
+        raise ContentError("No '### Topic n: Title' sections found")
+    for kind, records in (("persona", personas), ("topic", topics)):
+        counts = Counter(record["id"] for record in records)
+        duplicates = sorted(i for i, n in counts.items() if n > 1)
+        if duplicates:
+            raise ContentError(f"Duplicate {kind} ids: {', '.join(duplicates)}")
+    return {"personas": personas, "topics": topics}
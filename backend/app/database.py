@@ -1,10 +1,17 @@
 """
 SQLite database layer for SocraticCanvas.
-Uses aiosqlite for async SQLite operations.
+Uses aiosqlite for async SQLite operations, with a shared connection pool,
+a tunable PRAGMA profile and ordered schema migrations.
 """
 
+import asyncio
 import aiosqlite
 import logging
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from typing import AsyncIterator
+
 from app.config import get_settings
 
 logger = logging.getLogger(__name__)
@@ -12,61 +19,303 @@ logger = logging.getLogger(__name__)
 DATABASE_PATH = "socratic_canvas.db"
 
 
-async def get_db() -> aiosqlite.Connection:
-    """Get a database connection."""
-    db = await aiosqlite.connect(DATABASE_PATH)
-    db.row_factory = aiosqlite.Row
-    return db
+def pragma_statements() -> list[str]:
+    """Per-connection PRAGMA performance profile from Settings.
 
+    WAL lets readers proceed while a gap-report write is in flight, and
+    synchronous=NORMAL is durable under WAL except on OS crash/power loss.
+    foreign_keys is off by default in SQLite; the ON DELETE CASCADE clauses
+    rely on it.
+    """
+    settings = get_settings()
+    return [
+        f"PRAGMA busy_timeout = {settings.db_busy_timeout_ms}",
+        f"PRAGMA synchronous = {settings.db_synchronous}",
+        f"PRAGMA cache_size = {settings.db_cache_size}",
+        f"PRAGMA mmap_size = {settings.db_mmap_size}",
+        f"PRAGMA temp_store = {settings.db_temp_store}",
+        "PRAGMA foreign_keys = ON",
+    ]
 
-async def init_db():
-    """Initialize the database — create tables if they don't exist."""
-    logger.info("📦 Initializing SQLite database...")
 
-    async with aiosqlite.connect(DATABASE_PATH) as db:
-        # ── Users Table ──────────────────────────────────────────────
-        await db.execute("""
-            CREATE TABLE IF NOT EXISTS users (
-                id              TEXT PRIMARY KEY,
-                email           TEXT UNIQUE NOT NULL,
-                username        TEXT NOT NULL,
-                hashed_password TEXT NOT NULL,
-                study_domain    TEXT DEFAULT '',
-                bio             TEXT DEFAULT '',
-                interests       TEXT DEFAULT '[]',
-                strengths       TEXT DEFAULT '[]',
-                weaknesses      TEXT DEFAULT '[]',
-                learning_goals  TEXT DEFAULT '[]',
-                created_at      TEXT NOT NULL,
-                updated_at      TEXT NOT NULL
-            )
-        """)
+# ── Connection Pool ──────────────────────────────────────────────────
+
+
+class ConnectionPool:
+    """Bounded pool of long-lived aiosqlite connections.
+
+    Each aiosqlite connection owns a background thread, so reusing them keeps
+    thread start-up and file-open costs off the request path.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_size: int,
+        health_check_seconds: float,
+        pragmas: list[str] | None = None,
+    ):
+        self._path = path
+        self._max_size = max_size
+        self._health_check_seconds = health_check_seconds
+        self._pragmas = pragmas or []
+        self._idle: list[tuple[aiosqlite.Connection, float]] = []
+        self._slots = asyncio.Semaphore(max_size)
+        self._closed = False
+
+    async def _open(self) -> aiosqlite.Connection:
+        db = await aiosqlite.connect(self._path)
+        db.row_factory = aiosqlite.Row
+        for pragma in self._pragmas:
+            await db.execute(pragma)
+        return db
+
+    @staticmethod
+    async def _discard(db: aiosqlite.Connection) -> None:
+        try:
+            await db.close()
+        except Exception as e:
+            logger.warning(f"Error closing pooled connection: {e}")
+
+    async def _is_healthy(self, db: aiosqlite.Connection) -> bool:
+        try:
+            await db.execute("SELECT 1")
+            return True
+        except Exception:
+            return False
+
+    async def acquire(self) -> aiosqlite.Connection:
+        """Borrow a connection, waiting if all of them are in use."""
+        if self._closed:
+            raise RuntimeError("Connection pool is closed")
+        await self._slots.acquire()
+        try:
+            while self._idle:
+                db, last_used = self._idle.pop()
+                # Only ping connections that have sat idle for a while
+                if time.monotonic() - last_used < self._health_check_seconds:
+                    return db
+                if await self._is_healthy(db):
+                    return db
+                logger.warning("Discarding unhealthy pooled connection")
+                await self._discard(db)
+            return await self._open()
+        except BaseException:
+            self._slots.release()
+            raise
+
+    async def release(self, db: aiosqlite.Connection) -> None:
+        """Return a borrowed connection, rolling back any unfinished transaction."""
+        try:
+            if self._closed:
+                await self._discard(db)
+                return
+            try:
+                if db.in_transaction:
+                    await db.rollback()
+            except Exception as e:
+                logger.warning(f"Discarding pooled connection after failed rollback: {e}")
+                await self._discard(db)
+                return
+            self._idle.append((db, time.monotonic()))
+        finally:
+            self._slots.release()
+
+    @asynccontextmanager
+    async def connection(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Borrow a connection for the duration of an ``async with`` block."""
+        db = await self.acquire()
+        try:
+            yield db
+        finally:
+            await self.release(db)
+
+    async def close(self) -> None:
+        """Close all idle connections; borrowed ones are closed on release."""
+        self._closed = True
+        idle, self._idle = self._idle, []
+        for db, _ in idle:
+            await self._discard(db)
+
+
+_pool: ConnectionPool | None = None
 
-        # ── Gap Reports Table ────────────────────────────────────────
-        await db.execute("""
-            CREATE TABLE IF NOT EXISTS gap_reports (
-                id                      TEXT PRIMARY KEY,
-                user_id                 TEXT NOT NULL,
-                debate_session_id       TEXT NOT NULL,
-                topic_title             TEXT DEFAULT '',
-                reasoning_blind_spots   TEXT DEFAULT '[]',
-                evidence_gaps           TEXT DEFAULT '[]',
-                rhetorical_opportunities TEXT DEFAULT '[]',
-                follow_up_questions     TEXT DEFAULT '[]',
-                recommended_readings    TEXT DEFAULT '[]',
-                overall_summary         TEXT DEFAULT '',
-                judge_evaluations       TEXT DEFAULT '[]',
-                created_at              TEXT NOT NULL,
-                FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE
-            )
-        """)
 
+async def init_pool() -> ConnectionPool:
+    """Create the shared connection pool (called from the app lifespan)."""
+    global _pool
+    if _pool is None:
+        settings = get_settings()
+        _pool = ConnectionPool(
+            DATABASE_PATH,
+            max_size=settings.db_pool_size,
+            health_check_seconds=settings.db_pool_health_check_seconds,
+            pragmas=pragma_statements(),
+        )
+    return _pool
+
+
+async def close_pool() -> None:
+    """Close the shared connection pool."""
+    global _pool
+    if _pool is not None:
+        await _pool.close()
+        _pool = None
+
+
+@asynccontextmanager
+async def get_db() -> AsyncIterator[aiosqlite.Connection]:
+    """Borrow a database connection from the shared pool."""
+    pool = _pool or await init_pool()
+    async with pool.connection() as db:
+        yield db
+
+
+# ── Schema Migrations ────────────────────────────────────────────────
+# Ordered (version, description, statements). Append new migrations with the
+# next version number; never edit one that has already shipped.
+
+MIGRATIONS: list[tuple[int, str, list[str]]] = [
+    (1, "users and gap reports", [
+        # ── Users Table ──────────────────────────────────────────────
+        """
+        CREATE TABLE IF NOT EXISTS users (
+            id              TEXT PRIMARY KEY,
+            email           TEXT UNIQUE NOT NULL,
+            username        TEXT NOT NULL,
+            hashed_password TEXT NOT NULL,
+            study_domain    TEXT DEFAULT '',
+            bio             TEXT DEFAULT '',
+            interests       TEXT DEFAULT '[]',
+            strengths       TEXT DEFAULT '[]',
+            weaknesses      TEXT DEFAULT '[]',
+            learning_goals  TEXT DEFAULT '[]',
+            created_at      TEXT NOT NULL,
+            updated_at      TEXT NOT NULL
+        )
+        """,
+        # ── Gap Reports Table ────────────────────────────────────────
+        """
+        CREATE TABLE IF NOT EXISTS gap_reports (
+            id                      TEXT PRIMARY KEY,
+            user_id                 TEXT NOT NULL,
+            debate_session_id       TEXT NOT NULL,
+            topic_title             TEXT DEFAULT '',
+            reasoning_blind_spots   TEXT DEFAULT '[]',
+            evidence_gaps           TEXT DEFAULT '[]',
+            rhetorical_opportunities TEXT DEFAULT '[]',
+            follow_up_questions     TEXT DEFAULT '[]',
+            recommended_readings    TEXT DEFAULT '[]',
+            overall_summary         TEXT DEFAULT '',
+            judge_evaluations       TEXT DEFAULT '[]',
+            created_at              TEXT NOT NULL,
+            FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE
+        )
+        """,
         # Index for fast lookup of gap reports by user
-        await db.execute("""
-            CREATE INDEX IF NOT EXISTS idx_gap_reports_user_id
-            ON gap_reports(user_id)
-        """)
+        """
+        CREATE INDEX IF NOT EXISTS idx_gap_reports_user_id
+        ON gap_reports(user_id)
+        """,
+    ]),
+    (2, "debate sessions and messages", [
+        # ── Debate Sessions Table ────────────────────────────────────
+        """
+        CREATE TABLE IF NOT EXISTS debate_sessions (
+            id                  TEXT PRIMARY KEY,
+            topic_id            TEXT NOT NULL,
+            user_id             TEXT,
+            phase               TEXT NOT NULL,
+            current_round       INTEGER NOT NULL DEFAULT 0,
+            max_rounds          INTEGER NOT NULL DEFAULT 3,
+            version             INTEGER NOT NULL DEFAULT 0,
+            judge_evaluations   TEXT DEFAULT '[]',
+            gap_report          TEXT,
+            created_at          TEXT NOT NULL,
+            updated_at          TEXT NOT NULL
+        )
+        """,
+        # ── Debate Messages Table ────────────────────────────────────
+        """
+        CREATE TABLE IF NOT EXISTS debate_messages (
+            id              TEXT PRIMARY KEY,
+            session_id      TEXT NOT NULL,
+            seq             INTEGER NOT NULL,
+            role            TEXT NOT NULL,
+            persona_name    TEXT DEFAULT '',
+            content         TEXT NOT NULL,
+            timestamp       TEXT NOT NULL,
+            FOREIGN KEY (session_id) REFERENCES debate_sessions(id) ON DELETE CASCADE
+        )
+        """,
+        # Index for loading a session's transcript in order
+        """
+        CREATE INDEX IF NOT EXISTS idx_debate_messages_session_seq
+        ON debate_messages(session_id, seq)
+        """,
+    ]),
+    (3, "debate session audio format", [
+        # Format the client plays TTS in; prefetch encodes debate speech in it
+        "ALTER TABLE debate_sessions ADD COLUMN audio_format TEXT",
+    ]),
+    (4, "unique debate message positions", [
+        # Two writers can't both record a message at the same seq
+        "DROP INDEX IF EXISTS idx_debate_messages_session_seq",
+        """
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_debate_messages_session_seq_unique
+        ON debate_messages(session_id, seq)
+        """,
+    ]),
+]
+
 
+async def _apply_migrations(db: aiosqlite.Connection) -> int:
+    """Apply pending migrations in order. Returns the resulting schema version."""
+    await db.execute("""
+        CREATE TABLE IF NOT EXISTS schema_migrations (
+            version     INTEGER PRIMARY KEY,
+            description TEXT NOT NULL,
+            applied_at  TEXT NOT NULL
+        )
+    """)
+    await db.commit()
+
+    # Hold the write lock from reading the version until the migrations are
+    # committed, so workers starting together apply each migration once; the
+    # others wait (busy_timeout) and then find nothing left to do
+    await db.execute("BEGIN IMMEDIATE")
+    try:
+        cursor = await db.execute("SELECT COALESCE(MAX(version), 0) FROM schema_migrations")
+        current = (await cursor.fetchone())[0]
+
+        for version, description, statements in MIGRATIONS:
+            if version <= current:
+                continue
+            logger.info(f"📦 Applying migration {version}: {description}")
+            for statement in statements:
+                await db.execute(statement)
+            await db.execute(
+                "INSERT INTO schema_migrations (version, description, applied_at) VALUES (?, ?, ?)",
+                (version, description, datetime.now(timezone.utc).isoformat()),
+            )
+            current = version
         await db.commit()
+    except BaseException:
+        await db.rollback()
+        raise
+
+    return current
+
+
+async def init_db():
+    """Initialize the database — apply the PRAGMA profile and pending migrations."""
+    logger.info("📦 Initializing SQLite database...")
+
+    async with aiosqlite.connect(DATABASE_PATH) as db:
+        # journal_mode is stored in the database file, so set it once here
+        await db.execute(f"PRAGMA journal_mode = {get_settings().db_journal_mode}")
+        for pragma in pragma_statements():
+            await db.execute(pragma)
+        version = await _apply_migrations(db)
 
-    logger.info("✅ Database initialized successfully.")
+    logger.info(f"✅ Database initialized successfully (schema version {version}).")
@@ -10,7 +10,21 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.config import get_settings
-from app.database import init_db
+from app.content.loader import (
+    get_all_topics,
+    get_topic,
+    on_content_reload,
+    start_content_watcher,
+    stop_content_watcher,
+)
+from app.database import init_db, init_pool, close_pool
+from app.services.agents import prebuild_system_prompts
+from app.services.auth import shutdown_hash_executor
+from app.services.debate_manager import get_debate_manager
+from app.services.llm_client import get_llm_client
+from app.services.prompt_registry import get_prompt_registry
+from app.services.tts_engine import get_tts_engine
+from app.services.user_cache import cache_stats
 from app.routes import topics, debates, auth, tts
 from app.routes import profile as profile_routes
 from app.routes import gap_reports as gap_reports_routes
@@ -23,6 +37,13 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def _prebuild_prompts() -> None:
+    registry = get_prompt_registry()
+    registry.clear()
+    for summary in get_all_topics():
+        prebuild_system_prompts(get_topic(summary.id))
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan handler — startup and shutdown logic."""
@@ -33,8 +54,27 @@ async def lifespan(app: FastAPI):
 
     # Initialize SQLite database
     await init_db()
+    await init_pool()
+
+    # Free idle debate sessions in the background
+    manager = get_debate_manager()
+    manager.start_sweeper()
+
+    # Build every agent prompt now, and again whenever the content file changes
+    _prebuild_prompts()
+    on_content_reload(_prebuild_prompts)
+    start_content_watcher()
+
+    # Load the TTS model in the background so the first listener doesn't wait
+    if settings.tts_warmup:
+        get_tts_engine().start_warm_up()
 
     yield
+    await stop_content_watcher()
+    await manager.stop_sweeper()
+    await get_tts_engine().shutdown()
+    await close_pool()
+    shutdown_hash_executor()
     logger.info("🏛️  SocraticCanvas Backend shutting down.")
 
 
@@ -53,6 +93,8 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Let the browser read TTS metadata on cross-origin responses
+    expose_headers=["X-TTS-Format", "X-TTS-Segments", "X-TTS-Sentences"],
 )
 
 # Include routers
@@ -68,9 +110,17 @@ app.include_router(tts.router)
 async def health_check():
     """Health check endpoint."""
     settings = get_settings()
+    tts_engine = get_tts_engine()
     return {
         "status": "healthy",
         "service": "SocraticCanvas",
         "model": settings.llm_model_name,
         "api_key_configured": bool(settings.groq_api_key),
+        "sessions": get_debate_manager().stats(),
+        "caches": cache_stats(),
+        "llm": get_llm_client().stats(),
+        "prompts": get_prompt_registry().stats(),
+        # Route TTS traffic only to workers reporting tts_ready
+        "tts_ready": tts_engine.ready,
+        "tts": tts_engine.stats(),
     }
@@ -10,6 +10,8 @@ from .enums import DebatePhase, AgentRole
 class PersonaSummary(BaseModel):
     """Brief persona info for topic listings."""
 
+    model_config = {"frozen": True}  # built once by content.loader and shared
+
     id: str
     name: str
     era: str
@@ -33,6 +35,8 @@ class PersonaDetail(PersonaSummary):
 class TopicSummary(BaseModel):
     """Brief topic info for listing."""
 
+    model_config = {"frozen": True}
+
     id: str
     title: str
     resolution: str
@@ -43,6 +47,8 @@ class TopicSummary(BaseModel):
 class TopicDetail(BaseModel):
     """Full topic with persona details."""
 
+    model_config = {"frozen": True}
+
     id: str
     title: str
     resolution: str
@@ -70,6 +76,9 @@ class CreateDebateRequest(BaseModel):
     """Request to create a new debate session."""
 
     topic_id: str
+    # TTS format preference list the client will request audio in (e.g.
+    # "opus,flac,wav"), so prefetched speech is encoded the same way
+    audio_format: Optional[str] = None
 
 
 class StudentIntervention(BaseModel):
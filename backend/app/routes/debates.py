@@ -53,7 +53,9 @@ async def create_debate(
     manager = get_debate_manager()
     try:
         user_id = current_user.id if current_user else None
-        session = manager.create_session(request.topic_id, user_id=user_id)
+        session = await manager.create_session(
+            request.topic_id, user_id=user_id, audio_format=request.audio_format
+        )
         return session.to_response()
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -63,7 +65,7 @@ async def create_debate(
 async def get_debate(session_id: str):
     """Get the current state of a debate session."""
     manager = get_debate_manager()
-    session = manager.get_session(session_id)
+    session = await manager.get_session(session_id)
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
     return session.to_response()
@@ -76,7 +78,7 @@ async def start_debate(session_id: str):
     Returns SSE stream with real-time updates.
     """
     manager = get_debate_manager()
-    session = manager.get_session(session_id)
+    session = await manager.get_session(session_id)
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
 
@@ -94,7 +96,7 @@ async def submit_intervention(session_id: str, intervention: StudentIntervention
     Returns SSE stream with debater responses.
     """
     manager = get_debate_manager()
-    session = manager.get_session(session_id)
+    session = await manager.get_session(session_id)
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
 
@@ -114,7 +116,7 @@ async def judge_debate(session_id: str):
     Returns SSE stream with judge evaluations and final report.
     """
     manager = get_debate_manager()
-    session = manager.get_session(session_id)
+    session = await manager.get_session(session_id)
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
 
@@ -129,7 +131,7 @@ async def judge_debate(session_id: str):
 async def get_gap_report(session_id: str):
     """Get the final gap report for a completed debate."""
     manager = get_debate_manager()
-    session = manager.get_session(session_id)
+    session = await manager.get_session(session_id)
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
 
@@ -150,7 +152,7 @@ async def stream_debate(session_id: str):
     Useful for the frontend to show live updates.
     """
     manager = get_debate_manager()
-    session = manager.get_session(session_id)
+    session = await manager.get_session(session_id)
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
 
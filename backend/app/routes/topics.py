@@ -1,25 +1,46 @@
 """
 Topic API routes for SocraticCanvas.
+Topic content is static, so responses are pre-encoded JSON with strong ETags.
 """
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import Response
 
-from app.content.loader import get_all_topics, get_topic
+from app.content.loader import SerializedView, get_topic_json, get_topics_json
 from app.models.schemas import TopicSummary, TopicDetail
 
 router = APIRouter(prefix="/api/topics", tags=["Topics"])
 
 
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Weak comparison against an If-None-Match header, as RFC 9110 requires."""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def _json_response(request: Request, view: SerializedView) -> Response:
+    # no-cache: browsers may store the body but must revalidate, which is a 304
+    headers = {"ETag": view.etag, "Cache-Control": "no-cache"}
+    if _etag_matches(request.headers.get("if-none-match"), view.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=view.body, media_type="application/json", headers=headers)
+
+
 @router.get("", response_model=list[TopicSummary])
-async def list_topics():
+async def list_topics(request: Request):
     """List all available debate topics."""
-    return get_all_topics()
+    return _json_response(request, get_topics_json())
 
 
 @router.get("/{topic_id}", response_model=TopicDetail)
-async def get_topic_detail(topic_id: str):
+async def get_topic_detail(topic_id: str, request: Request):
     """Get detailed information about a specific topic, including full persona profiles."""
-    topic = get_topic(topic_id)
-    if not topic:
+    view = get_topic_json(topic_id)
+    if not view:
         raise HTTPException(status_code=404, detail=f"Topic not found: {topic_id}")
-    return topic
+    return _json_response(request, view)
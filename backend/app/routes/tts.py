@@ -1,23 +1,36 @@
 """
 TTS Route — Exposes Kokoro TTS as POST /api/tts endpoint.
-Accepts text + role, returns WAV audio.
+Accepts text + role, returns WAV audio (whole clip, streamed per sentence,
+or a batch of segments as length-prefixed frames).
 """
 
 import logging
+import struct
+from typing import AsyncIterator, Optional
 
-from fastapi import APIRouter, HTTPException
-from fastapi.responses import Response
+from fastapi import APIRouter, Header, HTTPException
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel, Field
 
-from app.services.kokoro_tts import get_tts_service
+from app.services.kokoro_tts import (
+    AUDIO_FORMATS,
+    DEFAULT_FORMAT,
+    negotiate_format,
+    resolve_format,
+    split_sentences,
+    streaming_wav_header,
+    supported_formats,
+    wav_to_pcm16,
+)
+from app.services.tts_engine import get_tts_engine
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api", tags=["TTS"])
 
 
-class TTSRequest(BaseModel):
-    """Request body for TTS synthesis."""
+class TTSSegment(BaseModel):
+    """One piece of text to synthesize."""
     text: str = Field(..., min_length=1, max_length=5000, description="Text to synthesize")
     role: str = Field(
         default="moderator",
@@ -29,29 +42,110 @@ class TTSRequest(BaseModel):
     )
 
 
+_FORMAT_DESCRIPTION = (
+    "Output format, or a comma-separated preference list (wav, flac, ogg, opus); "
+    "the first one the server supports is used"
+)
+
+
+class TTSRequest(TTSSegment):
+    """Request body for TTS synthesis."""
+    format: Optional[str] = Field(
+        default=None,
+        description=_FORMAT_DESCRIPTION + ". Overrides the Accept header.",
+    )
+
+
+class TTSBatchRequest(BaseModel):
+    """Request body for batch TTS synthesis."""
+    segments: list[TTSSegment] = Field(
+        ..., min_length=1, max_length=100, description="Segments to synthesize, in playback order"
+    )
+    format: Optional[str] = Field(default=None, description=_FORMAT_DESCRIPTION)
+
+
+def _pick_format(requested: Optional[str], accept: Optional[str] = None) -> str:
+    """Explicit ``format`` field first, then the Accept header, else WAV."""
+    if not requested:
+        return negotiate_format(accept)
+    fmt = resolve_format(requested)
+    if fmt is None:
+        raise HTTPException(
+            status_code=400,
+            detail=(
+                f"Unsupported audio format '{requested}'. "
+                f"Available: {', '.join(supported_formats())}"
+            ),
+        )
+    return fmt
+
+
 @router.post("/tts")
-async def synthesize_speech(request: TTSRequest):
+async def synthesize_speech(request: TTSRequest, accept: Optional[str] = Header(default=None)):
     """
     Convert text to speech using Kokoro TTS with role-specific voices.
 
-    Returns WAV audio bytes with appropriate content-type header.
+    Returns WAV, FLAC or Ogg (Vorbis/Opus) audio, chosen by the ``format``
+    field or the Accept header, with the matching content-type header.
+    Synthesis runs on the TTS worker pool; returns 503 when its queue is full.
     """
+    fmt = _pick_format(request.format, accept)
+    audio_format = AUDIO_FORMATS[fmt]
     try:
-        tts = get_tts_service()
-        audio_bytes = tts.synthesize(
+        audio_bytes = await get_tts_engine().synthesize(
             text=request.text,
             role=request.role,
             persona_name=request.persona_name,
+            fmt=fmt,
         )
 
         return Response(
             content=audio_bytes,
-            media_type="audio/wav",
+            media_type=audio_format.media_type,
             headers={
-                "Content-Disposition": "inline; filename=speech.wav",
+                "Content-Disposition": f"inline; filename=speech.{audio_format.extension}",
                 "Cache-Control": "public, max-age=3600",
+                "Vary": "Accept",
+                "X-TTS-Format": fmt,
             },
         )
+    except HTTPException:
+        raise
+    except ImportError:
+        raise HTTPException(
+            status_code=503,
+            detail="TTS service unavailable — Kokoro library not installed.",
+        )
+    except Exception as e:
+        logger.error(f"TTS synthesis failed: {e}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"TTS synthesis failed: {str(e)}",
+        )
+
+
+@router.post("/tts/stream")
+async def stream_speech(request: TTSRequest):
+    """
+    Stream speech sentence by sentence as a single open-ended WAV.
+
+    The text is split into sentences that are synthesized in order; the WAV
+    header and first sentence are sent as soon as that sentence is ready, and
+    each following sentence is appended as raw PCM when it finishes. Only
+    WAV can be streamed this way.
+    """
+    if request.format and DEFAULT_FORMAT not in request.format.lower().replace(" ", "").split(","):
+        raise HTTPException(status_code=400, detail="Streaming TTS only supports the wav format.")
+
+    sentences = split_sentences(request.text) or [request.text]
+    engine = get_tts_engine()
+
+    # Synthesize the first sentence up front so failures still map to 503/500
+    try:
+        first_wav = await engine.synthesize(sentences[0], request.role, request.persona_name)
+        first_pcm, sample_rate, channels = wav_to_pcm16(first_wav)
+    except HTTPException:
+        raise
     except ImportError:
         raise HTTPException(
             status_code=503,
@@ -63,3 +157,78 @@ async def synthesize_speech(request: TTSRequest):
             status_code=500,
             detail=f"TTS synthesis failed: {str(e)}",
         )
+
+    async def audio_chunks() -> AsyncIterator[bytes]:
+        yield streaming_wav_header(sample_rate, channels) + first_pcm
+        for index, sentence in enumerate(sentences[1:], start=2):
+            try:
+                wav = await engine.synthesize(sentence, request.role, request.persona_name)
+                pcm, rate, _ = wav_to_pcm16(wav)
+            except Exception as e:
+                # Headers are already sent — end the stream early
+                logger.error(f"TTS stream failed at sentence {index}/{len(sentences)}: {e}")
+                return
+            if rate != sample_rate:
+                logger.error(f"TTS stream sample rate changed ({sample_rate} → {rate}), stopping")
+                return
+            yield pcm
+
+    return StreamingResponse(
+        audio_chunks(),
+        media_type="audio/wav",
+        headers={
+            "Content-Disposition": "inline; filename=speech.wav",
+            "Cache-Control": "no-store",
+            "X-TTS-Sentences": str(len(sentences)),
+        },
+    )
+
+
+@router.post("/tts/batch")
+async def synthesize_batch(request: TTSBatchRequest):
+    """
+    Synthesize many segments in one request.
+
+    Segments are scheduled in a single pass (duplicates synthesized once) and
+    streamed back in request order as frames: a 4-byte big-endian segment
+    index, a 4-byte big-endian length, then that many bytes of audio in the
+    format reported by ``X-TTS-Format``. A zero-length frame means that
+    segment failed.
+    """
+    fmt = _pick_format(request.format)
+    engine = get_tts_engine()
+    segments = [(s.text, s.role, s.persona_name) for s in request.segments]
+    results = await engine.synthesize_batch(segments, fmt=fmt)
+
+    # Wait for the first segment so a missing TTS install still maps to 503
+    index, first = await anext(results)
+    if isinstance(first, ImportError):
+        await results.aclose()
+        raise HTTPException(
+            status_code=503,
+            detail="TTS service unavailable — Kokoro library not installed.",
+        )
+
+    def frame(index: int, result: bytes | Exception) -> bytes:
+        if isinstance(result, Exception):
+            logger.error(f"TTS batch segment {index} failed: {result}")
+            result = b""
+        return struct.pack(">II", index, len(result)) + result
+
+    async def frames() -> AsyncIterator[bytes]:
+        try:
+            yield frame(index, first)
+            async for next_index, result in results:
+                yield frame(next_index, result)
+        finally:
+            await results.aclose()
+
+    return StreamingResponse(
+        frames(),
+        media_type="application/octet-stream",
+        headers={
+            "Cache-Control": "no-store",
+            "X-TTS-Segments": str(len(segments)),
+            "X-TTS-Format": fmt,
+        },
+    )
@@ -3,8 +3,12 @@ AI Agents for SocraticCanvas: Debater, Moderator, and Judge agents.
 Each agent wraps the LLM client with role-specific system prompts.
 """
 
-from app.models.schemas import PersonaDetail, JudgeEvaluation, JudgeScore
-from app.services.llm_client import get_llm_client
+from app.config import get_settings
+from app.models.schemas import PersonaDetail, JudgeEvaluation, JudgeScore, TopicDetail
+from app.services.context_window import ContextWindow
+from app.services.llm_client import LLMClient, get_llm_client
+from app.services.llm_scheduler import PRIORITY_JUDGE
+from app.services.prompt_registry import SystemPrompt, get_prompt_registry
 
 
 # ── System Prompt Builders ────────────────────────────────────────────
@@ -64,7 +68,7 @@ STYLE: Professional, engaging, concise. Think of a skilled TV debate moderator.
 Keep transitions under 80 words. Be direct and move the debate forward."""
 
 
-JUDGE_LOGIC_PROMPT = """You are a logic expert evaluating a debate. Your job is to assess reasoning quality.
+JUDGE_LOGIC_PROMPT = SystemPrompt("""You are a logic expert evaluating a debate. Your job is to assess reasoning quality.
 
 Evaluate each participant (both AI debaters and the student) on:
 1. VALIDITY: Do conclusions follow from premises? (Score 1-5)
@@ -97,10 +101,10 @@ Consistency: [score]/5
 Overall: [score]/10
 Strength: [one sentence]
 Weakness: [one sentence]
-Recommendation: [one specific improvement suggestion]"""
+Recommendation: [one specific improvement suggestion]""")
 
 
-JUDGE_EVIDENCE_PROMPT = """You are an evidence expert evaluating a debate. Your job is to assess factual grounding.
+JUDGE_EVIDENCE_PROMPT = SystemPrompt("""You are an evidence expert evaluating a debate. Your job is to assess factual grounding.
 
 Evaluate each participant on:
 1. ACCURACY: Are factual claims correct within the persona's knowledge constraints? (Score 1-5)
@@ -133,10 +137,10 @@ Factual Accuracy: [score]/5
 Overall: [score]/10
 Strength: [one sentence]
 Weakness: [one sentence]
-Key facts that would strengthen their position: [list 2-3]"""
+Key facts that would strengthen their position: [list 2-3]""")
 
 
-JUDGE_RHETORIC_PROMPT = """You are a rhetoric expert evaluating a debate. Your job is to assess persuasive communication.
+JUDGE_RHETORIC_PROMPT = SystemPrompt("""You are a rhetoric expert evaluating a debate. Your job is to assess persuasive communication.
 
 Evaluate each participant on:
 1. CLARITY: Are arguments easy to follow? (Score 1-5)
@@ -169,7 +173,43 @@ Engagement: [score]/5
 Overall: [score]/10
 Strength: [one sentence]
 Weakness: [one sentence]
-Communication recommendation: [one specific suggestion]"""
+Communication recommendation: [one specific suggestion]""")
+
+
+OPENING_REQUEST = [
+    {
+        "role": "user",
+        "content": "Please deliver your opening statement on this topic. State your position clearly and make your strongest case.",
+    }
+]
+
+MODERATOR_INTRODUCTION = "Please introduce this debate. Set the stage, introduce the resolution, and invite the first speaker to begin."
+
+MODERATOR_CLOSING = "The debate rounds are complete. Thank the debaters and the student, and announce that the judges will now evaluate the debate. Be brief."
+
+
+def debater_system_prompt(persona: PersonaDetail, resolution: str, opponent_name: str) -> SystemPrompt:
+    """The debater prompt, built once per (persona, resolution, opponent)."""
+    return get_prompt_registry().get(
+        ("debater", persona.id, resolution, opponent_name),
+        lambda: build_debater_system_prompt(persona, resolution, opponent_name),
+    )
+
+
+def moderator_system_prompt(persona_a_name: str, persona_b_name: str, resolution: str) -> SystemPrompt:
+    """The moderator prompt, built once per pairing and resolution."""
+    return get_prompt_registry().get(
+        ("moderator", persona_a_name, persona_b_name, resolution),
+        lambda: build_moderator_system_prompt(persona_a_name, persona_b_name, resolution),
+    )
+
+
+def prebuild_system_prompts(topic: TopicDetail) -> None:
+    """Build a topic's debater and moderator prompts ahead of its first session."""
+    a, b = topic.persona_a, topic.persona_b
+    debater_system_prompt(a, topic.resolution, b.name)
+    debater_system_prompt(b, topic.resolution, a.name)
+    moderator_system_prompt(a.name, b.name, topic.resolution)
 
 
 # ── Agent Classes ─────────────────────────────────────────────────────
@@ -178,79 +218,110 @@ Communication recommendation: [one specific suggestion]"""
 class DebaterAgent:
     """An AI debater that argues in character as a historical/expert persona."""
 
-    def __init__(self, persona: PersonaDetail, resolution: str, opponent_name: str):
+    def __init__(
+        self,
+        persona: PersonaDetail,
+        resolution: str,
+        opponent_name: str,
+        llm: LLMClient | None = None,
+    ):
         self.persona = persona
-        self.system_prompt = build_debater_system_prompt(persona, resolution, opponent_name)
-        self.llm = get_llm_client()
+        self.system_prompt = debater_system_prompt(persona, resolution, opponent_name)
+        self.llm = llm or get_llm_client()
+        settings = get_settings()
+        self.context = ContextWindow(
+            self.llm,
+            persona.name,
+            recent_turns=settings.context_recent_turns,
+            max_tokens=settings.context_max_tokens,
+            summary_max_tokens=settings.context_summary_max_tokens,
+            refresh_turns=settings.context_summary_refresh_turns,
+        )
 
     async def generate_opening(self) -> str:
         """Generate an opening statement."""
-        messages = [
-            {
-                "role": "user",
-                "content": "Please deliver your opening statement on this topic. State your position clearly and make your strongest case.",
-            }
-        ]
-        return await self.llm.agenerate(self.system_prompt, messages)
+        return await self.llm.agenerate(self.system_prompt, OPENING_REQUEST)
+
+    async def generate_opening_stream(self):
+        """Stream an opening statement token by token."""
+        async for token in self.llm.agenerate_stream(self.system_prompt, OPENING_REQUEST):
+            yield token
 
     async def generate_response(self, debate_history: list[dict[str, str]]) -> str:
         """Generate a response given the debate history."""
-        return await self.llm.agenerate(self.system_prompt, debate_history)
+        messages = await self.context.build(debate_history)
+        return await self.llm.agenerate(self.system_prompt, messages)
 
     async def generate_response_stream(self, debate_history: list[dict[str, str]]):
         """Stream a response token by token."""
-        async for token in self.llm.agenerate_stream(self.system_prompt, debate_history):
+        messages = await self.context.build(debate_history)
+        async for token in self.llm.agenerate_stream(self.system_prompt, messages):
             yield token
 
 
 class ModeratorAgent:
     """Facilitates debate flow and transitions between speakers."""
 
-    def __init__(self, persona_a_name: str, persona_b_name: str, resolution: str):
-        self.system_prompt = build_moderator_system_prompt(
-            persona_a_name, persona_b_name, resolution
-        )
-        self.llm = get_llm_client()
+    def __init__(
+        self,
+        persona_a_name: str,
+        persona_b_name: str,
+        resolution: str,
+        llm: LLMClient | None = None,
+    ):
+        self.system_prompt = moderator_system_prompt(persona_a_name, persona_b_name, resolution)
+        self.llm = llm or get_llm_client()
+
+    async def _generate(self, instruction: str, max_tokens: int) -> str:
+        messages = [{"role": "user", "content": instruction}]
+        return await self.llm.agenerate(self.system_prompt, messages, max_tokens=max_tokens)
+
+    async def _stream(self, instruction: str, max_tokens: int):
+        messages = [{"role": "user", "content": instruction}]
+        async for token in self.llm.agenerate_stream(
+            self.system_prompt, messages, max_tokens=max_tokens
+        ):
+            yield token
+
+    @staticmethod
+    def _transition_instruction(context: str) -> str:
+        return f"Transition the debate. Context: {context}. Keep it brief and engaging."
+
+    @staticmethod
+    def _invite_instruction(round_num: int) -> str:
+        return f"This is round {round_num}. Invite the student audience member to ask a question, challenge an argument, or play devil's advocate. Be encouraging but brief."
 
     async def generate_introduction(self) -> str:
         """Generate the debate introduction."""
-        messages = [
-            {
-                "role": "user",
-                "content": "Please introduce this debate. Set the stage, introduce the resolution, and invite the first speaker to begin.",
-            }
-        ]
-        return await self.llm.agenerate(self.system_prompt, messages, max_tokens=300)
+        return await self._generate(MODERATOR_INTRODUCTION, max_tokens=300)
+
+    def generate_introduction_stream(self):
+        """Stream the debate introduction."""
+        return self._stream(MODERATOR_INTRODUCTION, max_tokens=300)
 
     async def generate_transition(self, context: str) -> str:
         """Generate a transition between debate phases."""
-        messages = [
-            {
-                "role": "user",
-                "content": f"Transition the debate. Context: {context}. Keep it brief and engaging.",
-            }
-        ]
-        return await self.llm.agenerate(self.system_prompt, messages, max_tokens=200)
+        return await self._generate(self._transition_instruction(context), max_tokens=200)
+
+    def generate_transition_stream(self, context: str):
+        """Stream a transition between debate phases."""
+        return self._stream(self._transition_instruction(context), max_tokens=200)
 
     async def invite_student(self, round_num: int) -> str:
         """Generate an invitation for the student to participate."""
-        messages = [
-            {
-                "role": "user",
-                "content": f"This is round {round_num}. Invite the student audience member to ask a question, challenge an argument, or play devil's advocate. Be encouraging but brief.",
-            }
-        ]
-        return await self.llm.agenerate(self.system_prompt, messages, max_tokens=150)
+        return await self._generate(self._invite_instruction(round_num), max_tokens=150)
+
+    def invite_student_stream(self, round_num: int):
+        """Stream an invitation for the student to participate."""
+        return self._stream(self._invite_instruction(round_num), max_tokens=150)
 
     async def closing_remarks(self) -> str:
         """Generate closing remarks before judging."""
-        messages = [
-            {
-                "role": "user",
-                "content": "The debate rounds are complete. Thank the debaters and the student, and announce that the judges will now evaluate the debate. Be brief.",
-            }
-        ]
-        return await self.llm.agenerate(self.system_prompt, messages, max_tokens=150)
+        return await self._generate(MODERATOR_CLOSING, max_tokens=150)
+
+    def closing_remarks_stream(self):
+        """Stream closing remarks before judging."""
+        return self._stream(MODERATOR_CLOSING, max_tokens=150)
 
 
 class JudgeAgent:
@@ -277,7 +348,7 @@ class JudgeAgent:
             }
         ]
         raw = await self.llm.agenerate(
-            self.system_prompt, messages, temperature=0.3, max_tokens=1500
+            self.system_prompt, messages, temperature=0.3, max_tokens=1500, priority=PRIORITY_JUDGE
         )
         return self._parse_evaluation(raw)
 
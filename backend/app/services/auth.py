@@ -3,8 +3,13 @@ Authentication service — password hashing, JWT tokens, user CRUD.
 Uses SQLite for persistent storage.
 """
 
+import asyncio
 import json
+import logging
+import sqlite3
+import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 
 import bcrypt
@@ -19,18 +24,66 @@ from app.models.user import (
     UserResponse,
     TokenResponse,
 )
+from app.services.user_cache import token_cache, user_cache
+
+logger = logging.getLogger(__name__)
 
 # ── Password Hashing (bcrypt directly) ───────────────────────────────
 
 
 def hash_password(password: str) -> str:
-    return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+    rounds = get_settings().bcrypt_rounds
+    return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt(rounds)).decode("utf-8")
 
 
 def verify_password(plain: str, hashed: str) -> bool:
     return bcrypt.checkpw(plain.encode("utf-8"), hashed.encode("utf-8"))
 
 
+def needs_rehash(hashed: str) -> bool:
+    """True if the hash was made with fewer rounds than currently configured."""
+    try:
+        # Format: $2b$<rounds>$<salt+hash>
+        return int(hashed.split("$")[2]) < get_settings().bcrypt_rounds
+    except (IndexError, ValueError):
+        return False
+
+
+# bcrypt releases the GIL, so a small dedicated pool keeps ~250 ms hashes off
+# the event loop while capping how many cores a login storm can take.
+_hash_executor: ThreadPoolExecutor | None = None
+
+
+def _get_hash_executor() -> ThreadPoolExecutor:
+    global _hash_executor
+    if _hash_executor is None:
+        _hash_executor = ThreadPoolExecutor(
+            max_workers=get_settings().password_hash_concurrency,
+            thread_name_prefix="bcrypt",
+        )
+    return _hash_executor
+
+
+def shutdown_hash_executor() -> None:
+    """Stop the password hashing pool (called from the app lifespan)."""
+    global _hash_executor
+    if _hash_executor is not None:
+        _hash_executor.shutdown(wait=False, cancel_futures=True)
+        _hash_executor = None
+
+
+async def ahash_password(password: str) -> str:
+    """Hash a password on the dedicated bcrypt pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_hash_executor(), hash_password, password)
+
+
+async def averify_password(plain: str, hashed: str) -> bool:
+    """Verify a password on the dedicated bcrypt pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_hash_executor(), verify_password, plain, hashed)
+
+
 # ── JWT Helpers ───────────────────────────────────────────────────────
 
 def create_access_token(user_id: str) -> str:
@@ -41,17 +94,29 @@ def create_access_token(user_id: str) -> str:
 
 
 def decode_access_token(token: str) -> str:
-    """Returns user_id or raises HTTPException."""
+    """Returns user_id or raises HTTPException.
+
+    Recently verified tokens are served from a short-lived cache to skip the
+    signature check; cached entries never outlive the token's own expiry.
+    """
+    cached = token_cache.get(token)
+    if cached is not None:
+        return cached
+
     settings = get_settings()
     try:
         payload = jwt.decode(token, settings.jwt_secret_key, algorithms=[settings.jwt_algorithm])
         user_id: str | None = payload.get("sub")
         if user_id is None:
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
-        return user_id
     except JWTError:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid or expired token")
 
+    expires_at = payload.get("exp")
+    if expires_at is not None:
+        token_cache.put(token, user_id, ttl_seconds=expires_at - time.time())
+    return user_id
+
 
 # ── FastAPI Dependency ────────────────────────────────────────────────
 
@@ -81,66 +146,84 @@ async def get_current_user(
     """Dependency: extract and validate JWT, return UserResponse."""
     user_id = decode_access_token(credentials.credentials)
 
-    db = await get_db()
-    try:
+    cached = user_cache.get(user_id)
+    if cached is not None:
+        return cached
+
+    async with get_db() as db:
         cursor = await db.execute("SELECT * FROM users WHERE id = ?", (user_id,))
         row = await cursor.fetchone()
         if not row:
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
-        return _row_to_user_response(row)
-    finally:
-        await db.close()
+        user = _row_to_user_response(row)
+    user_cache.put(user_id, user)
+    return user
 
 
 # ── User CRUD ─────────────────────────────────────────────────────────
 
 async def register_user(data: UserRegister) -> TokenResponse:
     """Create a new user, return JWT + user info."""
-    db = await get_db()
-    try:
+    async with get_db() as db:
         # Check duplicate email
         cursor = await db.execute("SELECT id FROM users WHERE email = ?", (data.email.lower(),))
         existing = await cursor.fetchone()
         if existing:
             raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Email already registered")
 
-        user_id = uuid.uuid4().hex[:16]
-        now = datetime.now(timezone.utc).isoformat()
+    # Hash without holding a pooled connection
+    hashed = await ahash_password(data.password)
+    user_id = uuid.uuid4().hex[:16]
+    now = datetime.now(timezone.utc).isoformat()
+
+    async with get_db() as db:
+        try:
+            await db.execute(
+                """INSERT INTO users (id, email, username, hashed_password, created_at, updated_at)
+                   VALUES (?, ?, ?, ?, ?, ?)""",
+                (user_id, data.email.lower(), data.username, hashed, now, now),
+            )
+            await db.commit()
+        except sqlite3.IntegrityError:
+            # Lost a race with a concurrent registration for the same email
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Email already registered")
 
-        await db.execute(
-            """INSERT INTO users (id, email, username, hashed_password, created_at, updated_at)
-               VALUES (?, ?, ?, ?, ?, ?)""",
-            (user_id, data.email.lower(), data.username, hash_password(data.password), now, now),
-        )
-        await db.commit()
-
-        user_resp = UserResponse(
-            id=user_id,
-            email=data.email.lower(),
-            username=data.username,
-            created_at=datetime.fromisoformat(now),
-            updated_at=datetime.fromisoformat(now),
-        )
-        token = create_access_token(user_id)
-        return TokenResponse(access_token=token, user=user_resp)
-    finally:
-        await db.close()
+    user_resp = UserResponse(
+        id=user_id,
+        email=data.email.lower(),
+        username=data.username,
+        created_at=datetime.fromisoformat(now),
+        updated_at=datetime.fromisoformat(now),
+    )
+    token = create_access_token(user_id)
+    return TokenResponse(access_token=token, user=user_resp)
 
 
 async def login_user(email: str, password: str) -> TokenResponse:
     """Validate credentials, return JWT + user info."""
-    db = await get_db()
-    try:
+    async with get_db() as db:
         cursor = await db.execute("SELECT * FROM users WHERE email = ?", (email.lower(),))
         row = await cursor.fetchone()
-        if not row:
-            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid email or password")
-
-        if not verify_password(password, row["hashed_password"]):
-            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid email or password")
-
-        token = create_access_token(row["id"])
-        user_resp = _row_to_user_response(row)
-        return TokenResponse(access_token=token, user=user_resp)
-    finally:
-        await db.close()
+    if not row:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid email or password")
+
+    # Verify without holding a pooled connection
+    if not await averify_password(password, row["hashed_password"]):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid email or password")
+
+    # Transparently upgrade hashes made with an older cost factor
+    if needs_rehash(row["hashed_password"]):
+        try:
+            upgraded = await ahash_password(password)
+            async with get_db() as db:
+                await db.execute(
+                    "UPDATE users SET hashed_password = ? WHERE id = ?",
+                    (upgraded, row["id"]),
+                )
+                await db.commit()
+        except Exception as e:
+            logger.warning(f"Password rehash failed for user {row['id']}: {e}")
+
+    token = create_access_token(row["id"])
+    user_resp = _row_to_user_response(row)
+    return TokenResponse(access_token=token, user=user_resp)
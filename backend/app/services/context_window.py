@@ -0,0 +1,166 @@
+"""
+Token-budgeted context window for debater prompts in SocraticCanvas.
+Keeps the newest turns verbatim and folds older ones into a rolling summary,
+so a debater's prompt stays bounded however long the debate runs.
+"""
+
+import asyncio
+import logging
+import re
+from typing import Optional
+
+from app.services.llm_scheduler import PRIORITY_BACKGROUND, PRIORITY_TURN
+from app.services.prompt_registry import get_prompt_registry
+
+logger = logging.getLogger(__name__)
+
+# Words, numbers and single punctuation marks; long words split into several
+# BPE tokens, roughly one per 6 characters for Llama-family vocabularies
+_TOKEN_PIECE = re.compile(r"\w+|[^\w\s]")
+MESSAGE_OVERHEAD_TOKENS = 4  # role and separator tokens per chat message
+
+SUMMARY_PREFIX = "[Summary of the earlier debate]: "
+
+SUMMARY_SYSTEM_PROMPT = """You keep running notes on a debate for {persona}, one of the debaters. Lines starting with [You] are what {persona} said; everything else is the moderator, the opponent or the student.
+
+Merge the new exchanges into the existing notes. Keep every claim, concession, piece of evidence and question the student asked that might come up again, attributed to whoever made it. Drop greetings and filler. Write compact prose in the third person, no more than {words} words."""
+
+
+def count_tokens(text: str) -> int:
+    """Approximate the model's token count for ``text`` without a tokenizer."""
+    return sum(1 + len(piece) // 6 for piece in _TOKEN_PIECE.findall(text))
+
+
+def count_message_tokens(message: dict[str, str]) -> int:
+    return count_tokens(message.get("content") or "") + MESSAGE_OVERHEAD_TOKENS
+
+
+class ContextWindow:
+    """Builds one debater's prompt history within a token budget.
+
+    The last ``recent_turns`` messages are always sent verbatim. Messages
+    before them are covered by a rolling summary that is refreshed in the
+    background once ``refresh_turns`` messages have fallen out of the recent
+    window; until then those few messages are sent verbatim too. A turn only
+    waits for the summary when a refresh has fallen badly behind (e.g. after
+    a session is restored from the database). If the result still exceeds
+    ``max_tokens``, the oldest verbatim messages are dropped.
+
+    Histories are append-only (see DebateSession.get_debate_history_for_agent),
+    so per-message token counts are cached by position.
+    """
+
+    def __init__(
+        self,
+        llm,
+        persona_name: str,
+        recent_turns: int,
+        max_tokens: int,
+        summary_max_tokens: int,
+        refresh_turns: int,
+    ):
+        self.llm = llm
+        self.persona_name = persona_name
+        self.recent_turns = max(1, recent_turns)
+        self.max_tokens = max_tokens
+        self.summary_max_tokens = summary_max_tokens
+        self.refresh_turns = max(1, refresh_turns)
+        self._token_counts: list[int] = []
+        self._summary: Optional[dict[str, str]] = None
+        self._summary_tokens = 0
+        self._covered = 0  # history messages folded into the summary
+        self._refresh: Optional[asyncio.Task] = None
+        self._failing = False  # last refresh failed; stop blocking turns on it
+
+        self.summaries = 0
+        self.summary_failures = 0
+        self.last_prompt_tokens = 0
+
+    def _counts(self, history: list[dict[str, str]]) -> list[int]:
+        if len(history) < len(self._token_counts):
+            # A different (shorter) history; start over
+            self._token_counts = []
+            self._summary, self._summary_tokens, self._covered = None, 0, 0
+        for message in history[len(self._token_counts):]:
+            self._token_counts.append(count_message_tokens(message))
+        return self._token_counts
+
+    async def build(self, history: list[dict[str, str]]) -> list[dict[str, str]]:
+        """Return the messages to send for this turn."""
+        counts = self._counts(history)
+        if self.max_tokens <= 0 or (len(history) <= self.recent_turns and sum(counts) <= self.max_tokens):
+            self.last_prompt_tokens = sum(counts)
+            return history
+
+        split = max(0, len(history) - self.recent_turns)
+        behind = split - self._covered
+        if behind > 2 * self.refresh_turns and not self._failing:
+            await self._refresh_summary(history, split, PRIORITY_TURN)
+        elif behind >= self.refresh_turns and (self._refresh is None or self._refresh.done()):
+            self._refresh = asyncio.create_task(
+                self._refresh_summary(history, split, PRIORITY_BACKGROUND)
+            )
+
+        budget = self.max_tokens - self._summary_tokens
+        start = self._covered
+        total = sum(counts[start:])
+        while total > budget and start < len(history) - 1:
+            total -= counts[start]
+            start += 1
+
+        self.last_prompt_tokens = total + self._summary_tokens
+        prompt = history[start:]
+        return [self._summary, *prompt] if self._summary else prompt
+
+    async def _refresh_summary(self, history: list[dict[str, str]], upto: int, priority: int) -> None:
+        """Fold history[covered:upto] into the summary."""
+        if self._refresh is not None and not self._refresh.done() and self._refresh is not asyncio.current_task():
+            # Let the refresh already in flight land first, then catch up
+            await asyncio.shield(self._refresh)
+        covered = self._covered
+        if upto <= covered:
+            return
+
+        lines = [
+            f"[You]: {m['content']}" if m["role"] == "assistant" else m["content"]
+            for m in history[covered:upto]
+        ]
+        previous = self._summary["content"][len(SUMMARY_PREFIX):] if self._summary else "(none yet)"
+        request = f"EXISTING NOTES:\n{previous}\n\nNEW EXCHANGES:\n" + "\n\n".join(lines)
+        words = int(self.summary_max_tokens * 0.7)
+        system_prompt = get_prompt_registry().get(
+            ("context-summary", self.persona_name, words),
+            lambda: SUMMARY_SYSTEM_PROMPT.format(persona=self.persona_name, words=words),
+        )
+        try:
+            text = await self.llm.agenerate(
+                system_prompt,
+                [{"role": "user", "content": request}],
+                temperature=0.2,
+                max_tokens=self.summary_max_tokens,
+                priority=priority,
+            )
+        except Exception as e:
+            # Messages stay verbatim (and budget-trimmed) until a refresh succeeds
+            self.summary_failures += 1
+            self._failing = True
+            logger.warning(f"⚠️ Context summary for {self.persona_name} failed: {e}")
+            return
+        if self._covered != covered:
+            return  # another refresh landed meanwhile
+
+        self._summary = {"role": "user", "content": SUMMARY_PREFIX + text.strip()}
+        self._summary_tokens = count_message_tokens(self._summary)
+        self._covered = upto
+        self._failing = False
+        self.summaries += 1
+        logger.info(f"📝 Summarized {upto} messages of history for {self.persona_name}")
+
+    def stats(self) -> dict:
+        return {
+            "summarized_messages": self._covered,
+            "summary_tokens": self._summary_tokens,
+            "summaries": self.summaries,
+            "summary_failures": self.summary_failures,
+            "last_prompt_tokens": self.last_prompt_tokens,
+        }
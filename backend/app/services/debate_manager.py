@@ -1,15 +1,19 @@
 """
 Debate Session Manager for SocraticCanvas.
-Manages debate state machine, in-memory session storage, and orchestrates agents.
+Manages debate state machine, session storage (SQLite-backed with a bounded
+in-memory cache), and orchestrates agents.
 """
 
 import uuid
 import json
 import asyncio
+import functools
 import logging
+from contextlib import aclosing
 from datetime import datetime
-from typing import AsyncGenerator
+from typing import AsyncGenerator, AsyncIterator
 
+from app.config import get_settings
 from app.models.enums import DebatePhase, AgentRole
 from app.models.schemas import (
     DebateMessage,
@@ -23,14 +27,52 @@ from app.content.loader import get_topic, get_personas_for_topic
 from app.services.agents import DebaterAgent, ModeratorAgent, JudgeAgent
 from app.services.gap_report import generate_gap_report
 from app.services.gap_report_store import save_gap_report
+from app.services.llm_client import get_llm_client
+from app.services.session_store import SessionStore
+from app.services.kokoro_tts import resolve_format
+from app.services.tts_engine import get_tts_engine
+from app.services.debate_store import (
+    get_session_version,
+    load_session_record,
+    save_session_state,
+)
 
 logger = logging.getLogger(__name__)
 
 
+class SessionConflictError(Exception):
+    """Another worker saved a newer version of the session than this one holds."""
+
+
+def _stops_on_conflict(method):
+    """End a debate stream with an ``error`` event once its session is superseded.
+
+    Nothing would persist further turns on the stale copy, so the stream
+    stops instead of spending more LLM calls on it.
+    """
+
+    @functools.wraps(method)
+    async def wrapper(*args, **kwargs) -> AsyncGenerator[StreamEvent, None]:
+        try:
+            async with aclosing(method(*args, **kwargs)) as events:
+                async for event in events:
+                    yield event
+        except SessionConflictError as e:
+            yield StreamEvent(event="error", data=str(e))
+
+    return wrapper
+
+
 class DebateSession:
     """Holds the state for a single debate session."""
 
-    def __init__(self, session_id: str, topic_id: str, user_id: str | None = None):
+    def __init__(
+        self,
+        session_id: str,
+        topic_id: str,
+        user_id: str | None = None,
+        audio_format: str | None = None,
+    ):
         topic = get_topic(topic_id)
         if not topic:
             raise ValueError(f"Topic not found: {topic_id}")
@@ -44,70 +86,119 @@ class DebateSession:
         self.current_round = 0
         self.max_rounds = 3
         self.messages: list[DebateMessage] = []
+        # Append-only views maintained by _append(), so building a turn's
+        # prompt input doesn't re-walk the whole transcript
+        self._histories: dict[AgentRole, list[dict[str, str]]] = {
+            AgentRole.DEBATER_A: [],
+            AgentRole.DEBATER_B: [],
+        }
+        self._transcript_lines: list[str] = []
+        self._transcript: str | None = None
         self.judge_evaluations: list[JudgeEvaluation] = []
         self.gap_report: GapReport | None = None
         self.created_at = datetime.utcnow()
+        # TTS format negotiated with the client; None uses tts_prefetch_format
+        self.audio_format = audio_format
+
+        # Persistence bookkeeping — see DebateSessionManager._checkpoint()
+        self.version = 0
+        self.persisted_message_count = 0
 
         # Set up personas
         self.persona_a = topic.persona_a
         self.persona_b = topic.persona_b
 
-        # Create agents
+        # Create agents; system prompts come prebuilt from the prompt registry
+        llm = get_llm_client()
         self.debater_a = DebaterAgent(
-            self.persona_a, self.resolution, self.persona_b.name
+            self.persona_a, self.resolution, self.persona_b.name, llm=llm
         )
         self.debater_b = DebaterAgent(
-            self.persona_b, self.resolution, self.persona_a.name
+            self.persona_b, self.resolution, self.persona_a.name, llm=llm
         )
         self.moderator = ModeratorAgent(
-            self.persona_a.name, self.persona_b.name, self.resolution
+            self.persona_a.name, self.persona_b.name, self.resolution, llm=llm
+        )
+
+    @classmethod
+    def from_record(cls, record: dict) -> "DebateSession":
+        """Rebuild a session from a record loaded by debate_store."""
+        session = cls(
+            record["id"],
+            record["topic_id"],
+            user_id=record["user_id"],
+            audio_format=record["audio_format"],
         )
+        session.phase = DebatePhase(record["phase"])
+        session.current_round = record["current_round"]
+        session.max_rounds = record["max_rounds"]
+        for msg in record["messages"]:
+            session._append(msg)
+        session.judge_evaluations = [
+            JudgeEvaluation(**je) for je in record["judge_evaluations"]
+        ]
+        if record["gap_report"] is not None:
+            session.gap_report = GapReport(**record["gap_report"])
+        session.created_at = record["created_at"]
+        session.version = record["version"]
+        session.persisted_message_count = len(session.messages)
+        return session
 
-    def add_message(self, role: AgentRole, persona_name: str, content: str) -> DebateMessage:
+    def add_message(
+        self,
+        role: AgentRole,
+        persona_name: str,
+        content: str,
+        msg_id: str | None = None,
+    ) -> DebateMessage:
         """Add a message to the debate transcript."""
         msg = DebateMessage(
-            id=str(uuid.uuid4()),
+            id=msg_id or str(uuid.uuid4()),
             role=role,
             persona_name=persona_name,
             content=content,
         )
-        self.messages.append(msg)
+        self._append(msg)
         return msg
 
+    def _append(self, msg: DebateMessage) -> None:
+        """Record a message and extend the precomputed history and transcript views."""
+        self.messages.append(msg)
+        for agent_role, history in self._histories.items():
+            history.append(self._history_entry(agent_role, msg))
+        speaker = msg.persona_name or msg.role.value
+        self._transcript_lines.append(f"[{speaker}]: {msg.content}")
+        self._transcript = None
+
+    @staticmethod
+    def _history_entry(agent_role: AgentRole, msg: DebateMessage) -> dict[str, str]:
+        """Map one message to an assistant/user turn relative to ``agent_role``."""
+        if msg.role == agent_role:
+            return {"role": "assistant", "content": msg.content}
+        if msg.role == AgentRole.STUDENT:
+            return {"role": "user", "content": f"[Student says]: {msg.content}"}
+        if msg.role == AgentRole.MODERATOR:
+            return {"role": "user", "content": f"[Moderator]: {msg.content}"}
+        # Opponent speech
+        return {"role": "user", "content": f"[{msg.persona_name}]: {msg.content}"}
+
     def get_debate_history_for_agent(self, agent_role: AgentRole) -> list[dict[str, str]]:
-        """Build the conversation history from the perspective of a specific agent.
+        """Conversation history from the perspective of a specific agent.
 
         Maps debate messages to assistant/user roles relative to the agent.
+        Debater histories are kept up to date by add_message, so this is O(1)
+        for them; the returned list is shared and must not be modified.
         """
-        history = []
-        for msg in self.messages:
-            if msg.role == agent_role:
-                history.append({"role": "assistant", "content": msg.content})
-            elif msg.role == AgentRole.STUDENT:
-                history.append({
-                    "role": "user",
-                    "content": f"[Student says]: {msg.content}",
-                })
-            elif msg.role == AgentRole.MODERATOR:
-                history.append({
-                    "role": "user",
-                    "content": f"[Moderator]: {msg.content}",
-                })
-            else:
-                # Opponent speech
-                history.append({
-                    "role": "user",
-                    "content": f"[{msg.persona_name}]: {msg.content}",
-                })
+        history = self._histories.get(agent_role)
+        if history is None:
+            return [self._history_entry(agent_role, msg) for msg in self.messages]
         return history
 
     def get_full_transcript(self) -> str:
-        """Build a human-readable transcript of the full debate."""
-        lines = []
-        for msg in self.messages:
-            speaker = msg.persona_name or msg.role.value
-            lines.append(f"[{speaker}]: {msg.content}")
-        return "\n\n".join(lines)
+        """Human-readable transcript of the full debate (joined once per change)."""
+        if self._transcript is None:
+            self._transcript = "\n\n".join(self._transcript_lines)
+        return self._transcript
 
     def to_response(self) -> DebateSessionResponse:
         """Convert to API response model."""
@@ -137,29 +228,192 @@ class DebateSession:
         )
 
 
+def _message_event(msg: DebateMessage) -> StreamEvent:
+    """Build the SSE ``message`` event for a completed transcript entry."""
+    return StreamEvent(
+        event="message",
+        data={
+            "id": msg.id,
+            "role": msg.role.value,
+            "persona_name": msg.persona_name,
+            "content": msg.content,
+        },
+    )
+
+
 class DebateSessionManager:
     """Manages all debate sessions and orchestrates the debate flow."""
 
     def __init__(self):
-        self._sessions: dict[str, DebateSession] = {}
+        settings = get_settings()
+        self._sessions: SessionStore[DebateSession] = SessionStore(
+            max_sessions=settings.session_max_count,
+            ttl_seconds=settings.session_ttl_seconds,
+        )
+        self._stream_turns = settings.stream_turns
+        self._tts_prefetch = settings.tts_prefetch
 
-    def create_session(self, topic_id: str, user_id: str | None = None) -> DebateSession:
-        """Create a new debate session."""
+    async def create_session(
+        self,
+        topic_id: str,
+        user_id: str | None = None,
+        audio_format: str | None = None,
+    ) -> DebateSession:
+        """Create a new debate session.
+
+        ``audio_format`` is the client's TTS format preference list; the
+        first one the server can encode is what speech gets prefetched in.
+        """
         session_id = str(uuid.uuid4())
-        session = DebateSession(session_id, topic_id, user_id=user_id)
-        self._sessions[session_id] = session
+        session = DebateSession(
+            session_id,
+            topic_id,
+            user_id=user_id,
+            audio_format=resolve_format(audio_format) if audio_format else None,
+        )
+        self._sessions.put(session_id, session)
+        await self._checkpoint(session)
         return session
 
-    def get_session(self, session_id: str) -> DebateSession | None:
-        """Retrieve a session by ID."""
-        return self._sessions.get(session_id)
+    async def get_session(self, session_id: str) -> DebateSession | None:
+        """Retrieve a session by ID.
+
+        Serves from the in-memory cache when it matches the stored version;
+        otherwise (evicted, or advanced by another worker) reloads from SQLite.
+        """
+        session = self._sessions.get(session_id)
+        try:
+            stored_version = await get_session_version(session_id)
+            if stored_version is None or (
+                session is not None and session.version >= stored_version
+            ):
+                return session
+
+            record = await load_session_record(session_id)
+            if record is None:
+                return session
+            # A stale or malformed row (e.g. its topic was removed) must not 500
+            loaded = DebateSession.from_record(record)
+        except Exception as e:
+            logger.error(f"Failed to load session {session_id}: {e}")
+            return session
+
+        self._sessions.put(session_id, loaded)
+        return loaded
+
+    async def _checkpoint(self, session: DebateSession) -> None:
+        """Write the session state and any new messages through to SQLite.
+
+        Raises SessionConflictError if another worker got there first; the
+        fresh state is reloaded into the cache for the next request.
+        """
+        new_version = session.version + 1
+        message_count = len(session.messages)
+        try:
+            saved = await save_session_state(
+                session_id=session.id,
+                topic_id=session.topic_id,
+                user_id=session.user_id,
+                phase=session.phase.value,
+                current_round=session.current_round,
+                max_rounds=session.max_rounds,
+                version=new_version,
+                judge_evaluations=[je.model_dump() for je in session.judge_evaluations],
+                gap_report=session.gap_report.model_dump() if session.gap_report else None,
+                created_at=session.created_at,
+                audio_format=session.audio_format,
+                new_messages=list(
+                    enumerate(
+                        session.messages[session.persisted_message_count:message_count],
+                        start=session.persisted_message_count,
+                    )
+                ),
+            )
+        except Exception as e:
+            # Keep the debate going on this worker; the next checkpoint retries
+            logger.error(f"Failed to persist session {session.id}: {e}")
+            return
+        if not saved:
+            # Another worker advanced this session first; drop our stale copy
+            logger.warning(f"⚠️ Session {session.id} was updated elsewhere; reloading it")
+            self._sessions.pop(session.id)
+            await self.get_session(session.id)
+            raise SessionConflictError(
+                "This debate was updated by another request — reload to continue."
+            )
+        session.version = new_version
+        session.persisted_message_count = message_count
+
+    def start_sweeper(self) -> None:
+        """Start freeing idle sessions in the background."""
+        self._sessions.start_sweeper(get_settings().session_sweep_interval_seconds)
+
+    async def stop_sweeper(self) -> None:
+        """Stop the background session sweeper."""
+        await self._sessions.stop_sweeper()
+
+    def stats(self) -> dict:
+        """Session store counters (size, hits, misses, evictions)."""
+        return self._sessions.stats()
+
+    def _prefetch_speech(self, session: DebateSession, msg: DebateMessage) -> None:
+        """Queue low-priority TTS for a new message so playback hits the cache."""
+        if not self._tts_prefetch:
+            return
+        try:
+            get_tts_engine().prefetch(
+                msg.content, msg.role.value, msg.persona_name, fmt=session.audio_format
+            )
+        except Exception as e:
+            logger.warning(f"TTS prefetch failed for message {msg.id}: {e}")
+
+    async def _agent_turn(
+        self,
+        session: DebateSession,
+        role: AgentRole,
+        persona_name: str,
+        tokens: AsyncIterator[str],
+    ) -> AsyncGenerator[StreamEvent, None]:
+        """Consume an agent's token stream and record it as a single message.
+
+        When ``stream_turns`` is enabled every token is forwarded as a
+        ``message_delta`` event; the closing ``message`` event always carries
+        the assembled content under the same id. If the turn fails after
+        deltas went out, a ``message_discard`` event tells the client to drop
+        the draft before the error propagates.
+        """
+        msg_id = str(uuid.uuid4())
+        parts: list[str] = []
+        try:
+            async for token in tokens:
+                parts.append(token)
+                if self._stream_turns:
+                    yield StreamEvent(
+                        event="message_delta",
+                        data={
+                            "id": msg_id,
+                            "role": role.value,
+                            "persona_name": persona_name,
+                            "delta": token,
+                        },
+                    )
 
+            msg = session.add_message(role, persona_name, "".join(parts), msg_id=msg_id)
+            await self._checkpoint(session)
+        except Exception:
+            if self._stream_turns and parts:
+                yield StreamEvent(event="message_discard", data={"id": msg_id})
+            raise
+        self._prefetch_speech(session, msg)
+        yield _message_event(msg)
+
+    @_stops_on_conflict
     async def start_debate(self, session_id: str) -> AsyncGenerator[StreamEvent, None]:
         """Start the debate: moderator introduction + opening statements.
 
         Yields StreamEvents for real-time updates.
         """
-        session = self._sessions.get(session_id)
+        session = await self.get_session(session_id)
         if not session:
             yield StreamEvent(event="error", data="Session not found")
             return
@@ -170,23 +424,22 @@ class DebateSessionManager:
 
         # ── Moderator Introduction ──
         session.phase = DebatePhase.OPENING_A
+        await self._checkpoint(session)
         yield StreamEvent(
             event="phase_change",
             data={"phase": session.phase.value, "message": "Debate starting..."},
         )
 
         try:
-            intro = await session.moderator.generate_introduction()
-            msg = session.add_message(AgentRole.MODERATOR, "Moderator", intro)
-            yield StreamEvent(
-                event="message",
-                data={
-                    "id": msg.id,
-                    "role": msg.role.value,
-                    "persona_name": msg.persona_name,
-                    "content": msg.content,
-                },
-            )
+            async for event in self._agent_turn(
+                session,
+                AgentRole.MODERATOR,
+                "Moderator",
+                session.moderator.generate_introduction_stream(),
+            ):
+                yield event
+        except SessionConflictError:
+            raise
         except Exception as e:
             logger.error(f"Moderator intro error: {e}")
             yield StreamEvent(event="error", data=f"Failed to generate introduction: {str(e)}")
@@ -194,19 +447,15 @@ class DebateSessionManager:
 
         # ── Debater A Opening ──
         try:
-            opening_a = await session.debater_a.generate_opening()
-            msg = session.add_message(
-                AgentRole.DEBATER_A, session.persona_a.name, opening_a
-            )
-            yield StreamEvent(
-                event="message",
-                data={
-                    "id": msg.id,
-                    "role": msg.role.value,
-                    "persona_name": msg.persona_name,
-                    "content": msg.content,
-                },
-            )
+            async for event in self._agent_turn(
+                session,
+                AgentRole.DEBATER_A,
+                session.persona_a.name,
+                session.debater_a.generate_opening_stream(),
+            ):
+                yield event
+        except SessionConflictError:
+            raise
         except Exception as e:
             logger.error(f"Debater A opening error: {e}")
             yield StreamEvent(event="error", data=f"Failed to generate opening statement A: {str(e)}")
@@ -214,44 +463,39 @@ class DebateSessionManager:
 
         # ── Moderator Transition ──
         session.phase = DebatePhase.OPENING_B
+        await self._checkpoint(session)
         yield StreamEvent(
             event="phase_change",
             data={"phase": session.phase.value},
         )
 
         try:
-            transition = await session.moderator.generate_transition(
-                f"{session.persona_a.name} has delivered their opening. Now invite {session.persona_b.name}."
-            )
-            msg = session.add_message(AgentRole.MODERATOR, "Moderator", transition)
-            yield StreamEvent(
-                event="message",
-                data={
-                    "id": msg.id,
-                    "role": msg.role.value,
-                    "persona_name": msg.persona_name,
-                    "content": msg.content,
-                },
-            )
+            async for event in self._agent_turn(
+                session,
+                AgentRole.MODERATOR,
+                "Moderator",
+                session.moderator.generate_transition_stream(
+                    f"{session.persona_a.name} has delivered their opening. Now invite {session.persona_b.name}."
+                ),
+            ):
+                yield event
+        except SessionConflictError:
+            raise
         except Exception as e:
             logger.error(f"Moderator transition error: {e}")
 
         # ── Debater B Opening ──
         try:
             history_b = session.get_debate_history_for_agent(AgentRole.DEBATER_B)
-            opening_b = await session.debater_b.generate_response(history_b)
-            msg = session.add_message(
-                AgentRole.DEBATER_B, session.persona_b.name, opening_b
-            )
-            yield StreamEvent(
-                event="message",
-                data={
-                    "id": msg.id,
-                    "role": msg.role.value,
-                    "persona_name": msg.persona_name,
-                    "content": msg.content,
-                },
-            )
+            async for event in self._agent_turn(
+                session,
+                AgentRole.DEBATER_B,
+                session.persona_b.name,
+                session.debater_b.generate_response_stream(history_b),
+            ):
+                yield event
+        except SessionConflictError:
+            raise
         except Exception as e:
             logger.error(f"Debater B opening error: {e}")
             yield StreamEvent(event="error", data=f"Failed to generate opening statement B: {str(e)}")
@@ -260,28 +504,28 @@ class DebateSessionManager:
         # ── Move to student turn ──
         session.phase = DebatePhase.STUDENT_TURN
         session.current_round = 1
+        await self._checkpoint(session)
         yield StreamEvent(
             event="phase_change",
             data={"phase": session.phase.value, "round": session.current_round},
         )
 
         try:
-            invite = await session.moderator.invite_student(session.current_round)
-            msg = session.add_message(AgentRole.MODERATOR, "Moderator", invite)
-            yield StreamEvent(
-                event="message",
-                data={
-                    "id": msg.id,
-                    "role": msg.role.value,
-                    "persona_name": msg.persona_name,
-                    "content": msg.content,
-                },
-            )
+            async for event in self._agent_turn(
+                session,
+                AgentRole.MODERATOR,
+                "Moderator",
+                session.moderator.invite_student_stream(session.current_round),
+            ):
+                yield event
+        except SessionConflictError:
+            raise
         except Exception as e:
             logger.error(f"Student invite error: {e}")
 
         yield StreamEvent(event="done", data="Opening phase complete. Awaiting student intervention.")
 
+    @_stops_on_conflict
     async def process_student_intervention(
         self,
         session_id: str,
@@ -292,7 +536,7 @@ class DebateSessionManager:
 
         Yields StreamEvents for real-time updates.
         """
-        session = self._sessions.get(session_id)
+        session = await self.get_session(session_id)
         if not session:
             yield StreamEvent(event="error", data="Session not found")
             return
@@ -306,19 +550,13 @@ class DebateSessionManager:
 
         # Record student message
         student_msg = session.add_message(AgentRole.STUDENT, "Student", content)
-        yield StreamEvent(
-            event="message",
-            data={
-                "id": student_msg.id,
-                "role": student_msg.role.value,
-                "persona_name": "Student",
-                "content": student_msg.content,
-            },
-        )
+        await self._checkpoint(session)
+        yield _message_event(student_msg)
 
         if is_final_reflection:
             # Skip debater responses, go straight to judging
             session.phase = DebatePhase.JUDGING
+            await self._checkpoint(session)
             yield StreamEvent(
                 event="phase_change",
                 data={"phase": session.phase.value, "message": "Final reflection received. Moving to judging..."},
@@ -328,6 +566,7 @@ class DebateSessionManager:
 
         # ── Debater A Response ──
         session.phase = DebatePhase.RESPONSE_A
+        await self._checkpoint(session)
         yield StreamEvent(
             event="phase_change",
             data={"phase": session.phase.value},
@@ -335,19 +574,15 @@ class DebateSessionManager:
 
         try:
             history_a = session.get_debate_history_for_agent(AgentRole.DEBATER_A)
-            response_a = await session.debater_a.generate_response(history_a)
-            msg_a = session.add_message(
-                AgentRole.DEBATER_A, session.persona_a.name, response_a
-            )
-            yield StreamEvent(
-                event="message",
-                data={
-                    "id": msg_a.id,
-                    "role": msg_a.role.value,
-                    "persona_name": msg_a.persona_name,
-                    "content": msg_a.content,
-                },
-            )
+            async for event in self._agent_turn(
+                session,
+                AgentRole.DEBATER_A,
+                session.persona_a.name,
+                session.debater_a.generate_response_stream(history_a),
+            ):
+                yield event
+        except SessionConflictError:
+            raise
         except Exception as e:
             logger.error(f"Debater A response error: {e}")
             yield StreamEvent(event="error", data=f"Failed to generate Debater A response: {str(e)}")
@@ -355,6 +590,7 @@ class DebateSessionManager:
 
         # ── Debater B Response ──
         session.phase = DebatePhase.RESPONSE_B
+        await self._checkpoint(session)
         yield StreamEvent(
             event="phase_change",
             data={"phase": session.phase.value},
@@ -362,19 +598,15 @@ class DebateSessionManager:
 
         try:
             history_b = session.get_debate_history_for_agent(AgentRole.DEBATER_B)
-            response_b = await session.debater_b.generate_response(history_b)
-            msg_b = session.add_message(
-                AgentRole.DEBATER_B, session.persona_b.name, response_b
-            )
-            yield StreamEvent(
-                event="message",
-                data={
-                    "id": msg_b.id,
-                    "role": msg_b.role.value,
-                    "persona_name": msg_b.persona_name,
-                    "content": msg_b.content,
-                },
-            )
+            async for event in self._agent_turn(
+                session,
+                AgentRole.DEBATER_B,
+                session.persona_b.name,
+                session.debater_b.generate_response_stream(history_b),
+            ):
+                yield event
+        except SessionConflictError:
+            raise
         except Exception as e:
             logger.error(f"Debater B response error: {e}")
             yield StreamEvent(event="error", data=f"Failed to generate Debater B response: {str(e)}")
@@ -386,23 +618,22 @@ class DebateSessionManager:
         if session.current_round > session.max_rounds:
             # Debate rounds over, move to judging
             session.phase = DebatePhase.JUDGING
+            await self._checkpoint(session)
             yield StreamEvent(
                 event="phase_change",
                 data={"phase": session.phase.value, "message": "All rounds complete. Moving to judging..."},
             )
 
             try:
-                closing = await session.moderator.closing_remarks()
-                msg = session.add_message(AgentRole.MODERATOR, "Moderator", closing)
-                yield StreamEvent(
-                    event="message",
-                    data={
-                        "id": msg.id,
-                        "role": msg.role.value,
-                        "persona_name": msg.persona_name,
-                        "content": msg.content,
-                    },
-                )
+                async for event in self._agent_turn(
+                    session,
+                    AgentRole.MODERATOR,
+                    "Moderator",
+                    session.moderator.closing_remarks_stream(),
+                ):
+                    yield event
+            except SessionConflictError:
+                raise
             except Exception as e:
                 logger.error(f"Closing remarks error: {e}")
 
@@ -410,23 +641,22 @@ class DebateSessionManager:
         else:
             # Student turn again
             session.phase = DebatePhase.STUDENT_TURN
+            await self._checkpoint(session)
             yield StreamEvent(
                 event="phase_change",
                 data={"phase": session.phase.value, "round": session.current_round},
             )
 
             try:
-                invite = await session.moderator.invite_student(session.current_round)
-                msg = session.add_message(AgentRole.MODERATOR, "Moderator", invite)
-                yield StreamEvent(
-                    event="message",
-                    data={
-                        "id": msg.id,
-                        "role": msg.role.value,
-                        "persona_name": msg.persona_name,
-                        "content": msg.content,
-                    },
-                )
+                async for event in self._agent_turn(
+                    session,
+                    AgentRole.MODERATOR,
+                    "Moderator",
+                    session.moderator.invite_student_stream(session.current_round),
+                ):
+                    yield event
+            except SessionConflictError:
+                raise
             except Exception as e:
                 logger.error(f"Student invite error: {e}")
 
@@ -435,12 +665,13 @@ class DebateSessionManager:
                 data=f"Round {session.current_round - 1} complete. Awaiting student intervention.",
             )
 
+    @_stops_on_conflict
     async def run_judges(self, session_id: str) -> AsyncGenerator[StreamEvent, None]:
         """Run all three judges on the debate transcript.
 
         Yields StreamEvents for real-time updates.
         """
-        session = self._sessions.get(session_id)
+        session = await self.get_session(session_id)
         if not session:
             yield StreamEvent(event="error", data="Session not found")
             return
@@ -454,7 +685,7 @@ class DebateSessionManager:
 
         transcript = session.get_full_transcript()
 
-        # Run all 3 judges
+        # Run all 3 judges concurrently over the same transcript
         judge_types = ["logic", "evidence", "rhetoric"]
         for judge_type in judge_types:
             yield StreamEvent(
@@ -462,26 +693,57 @@ class DebateSessionManager:
                 data={"phase": "judging", "judge": judge_type, "message": f"Judge ({judge_type}) evaluating..."},
             )
 
-            try:
-                judge = JudgeAgent(judge_type)
-                evaluation = await judge.evaluate(transcript)
-                session.judge_evaluations.append(evaluation)
-                yield StreamEvent(
-                    event="judge_result",
-                    data={
-                        "judge_type": judge_type,
-                        "persona_a_overall": evaluation.persona_a_overall,
-                        "persona_b_overall": evaluation.persona_b_overall,
-                        "student_overall": evaluation.student_overall,
-                        "raw_feedback": evaluation.raw_feedback,
-                    },
+        async def _evaluate(judge_type: str) -> JudgeEvaluation:
+            judge = JudgeAgent(judge_type)
+            return await judge.evaluate(transcript)
+
+        tasks = {
+            asyncio.create_task(_evaluate(judge_type)): judge_type
+            for judge_type in judge_types
+        }
+        results: dict[str, JudgeEvaluation] = {}
+
+        try:
+            # Emit each result as soon as that judge finishes
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
                 )
-            except Exception as e:
-                logger.error(f"Judge {judge_type} error: {e}")
-                yield StreamEvent(event="error", data=f"Judge ({judge_type}) failed: {str(e)}")
+                for task in done:
+                    judge_type = tasks[task]
+                    try:
+                        evaluation = task.result()
+                    except Exception as e:
+                        logger.error(f"Judge {judge_type} error: {e}")
+                        yield StreamEvent(event="error", data=f"Judge ({judge_type}) failed: {str(e)}")
+                        continue
+
+                    results[judge_type] = evaluation
+                    yield StreamEvent(
+                        event="judge_result",
+                        data={
+                            "judge_type": judge_type,
+                            "persona_a_overall": evaluation.persona_a_overall,
+                            "persona_b_overall": evaluation.persona_b_overall,
+                            "student_overall": evaluation.student_overall,
+                            "raw_feedback": evaluation.raw_feedback,
+                        },
+                    )
+        finally:
+            # Client disconnected mid-judging — don't leave orphaned LLM calls
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+        # Keep a stable judge order regardless of completion order
+        session.judge_evaluations.extend(
+            results[judge_type] for judge_type in judge_types if judge_type in results
+        )
 
         # Generate Gap Report
         session.phase = DebatePhase.GAP_REPORT
+        await self._checkpoint(session)
         yield StreamEvent(
             event="phase_change",
             data={"phase": session.phase.value, "message": "Generating your personalized Gap Report..."},
@@ -491,6 +753,7 @@ class DebateSessionManager:
             report = await generate_gap_report(transcript, session.judge_evaluations)
             session.gap_report = report
             session.phase = DebatePhase.COMPLETED
+            await self._checkpoint(session)
 
             # Persist gap report to SQLite if user is authenticated
             saved_report_id = None
@@ -519,6 +782,8 @@ class DebateSessionManager:
                     "overall_summary": report.overall_summary,
                 },
             )
+        except SessionConflictError:
+            raise
         except Exception as e:
             logger.error(f"Gap report error: {e}")
             yield StreamEvent(event="error", data=f"Gap report generation failed: {str(e)}")
@@ -0,0 +1,141 @@
+"""
+Debate session persistence service for SocraticCanvas.
+Stores debate state and transcripts in SQLite so any worker can serve a session.
+"""
+
+import json
+from datetime import datetime
+
+from app.database import get_db
+from app.models.schemas import DebateMessage
+
+
+async def save_session_state(
+    session_id: str,
+    topic_id: str,
+    user_id: str | None,
+    phase: str,
+    current_round: int,
+    max_rounds: int,
+    version: int,
+    judge_evaluations: list[dict],
+    gap_report: dict | None,
+    created_at: datetime,
+    audio_format: str | None,
+    new_messages: list[tuple[int, DebateMessage]],
+) -> bool:
+    """Upsert the session row and append any messages not yet persisted.
+
+    The row is only updated if ``version`` is newer than the stored one, so a
+    worker holding a stale copy can't overwrite another worker's progress.
+    Returns False (and writes nothing) when the write lost that race.
+    """
+    async with get_db() as db:
+        cursor = await db.execute(
+            """INSERT INTO debate_sessions
+               (id, topic_id, user_id, phase, current_round, max_rounds, version,
+                judge_evaluations, gap_report, created_at, updated_at, audio_format)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+               ON CONFLICT(id) DO UPDATE SET
+                phase = excluded.phase,
+                current_round = excluded.current_round,
+                version = excluded.version,
+                judge_evaluations = excluded.judge_evaluations,
+                gap_report = excluded.gap_report,
+                updated_at = excluded.updated_at
+               WHERE debate_sessions.version < excluded.version""",
+            (
+                session_id,
+                topic_id,
+                user_id,
+                phase,
+                current_round,
+                max_rounds,
+                version,
+                json.dumps(judge_evaluations),
+                json.dumps(gap_report) if gap_report is not None else None,
+                created_at.isoformat(),
+                datetime.utcnow().isoformat(),
+                audio_format,
+            ),
+        )
+        if cursor.rowcount == 0:
+            await db.rollback()
+            return False
+        if new_messages:
+            # Plain INSERT: the version guard gives this write sole ownership of
+            # these seqs, so a collision with the unique (session_id, seq)
+            # index is a real conflict and aborts the save
+            await db.executemany(
+                """INSERT INTO debate_messages
+                   (id, session_id, seq, role, persona_name, content, timestamp)
+                   VALUES (?, ?, ?, ?, ?, ?, ?)""",
+                [
+                    (
+                        msg.id,
+                        session_id,
+                        seq,
+                        msg.role.value,
+                        msg.persona_name,
+                        msg.content,
+                        msg.timestamp.isoformat(),
+                    )
+                    for seq, msg in new_messages
+                ],
+            )
+        await db.commit()
+        return True
+
+
+async def get_session_version(session_id: str) -> int | None:
+    """Return the stored version of a session, or None if it doesn't exist."""
+    async with get_db() as db:
+        cursor = await db.execute(
+            "SELECT version FROM debate_sessions WHERE id = ?", (session_id,)
+        )
+        row = await cursor.fetchone()
+        return row["version"] if row else None
+
+
+async def load_session_record(session_id: str) -> dict | None:
+    """Load a session row and its ordered messages as plain Python values."""
+    async with get_db() as db:
+        cursor = await db.execute(
+            "SELECT * FROM debate_sessions WHERE id = ?", (session_id,)
+        )
+        row = await cursor.fetchone()
+        if not row:
+            return None
+
+        cursor = await db.execute(
+            """SELECT id, role, persona_name, content, timestamp
+               FROM debate_messages
+               WHERE session_id = ?
+               ORDER BY seq""",
+            (session_id,),
+        )
+        message_rows = await cursor.fetchall()
+
+        return {
+            "id": row["id"],
+            "topic_id": row["topic_id"],
+            "user_id": row["user_id"],
+            "phase": row["phase"],
+            "current_round": row["current_round"],
+            "max_rounds": row["max_rounds"],
+            "version": row["version"],
+            "judge_evaluations": json.loads(row["judge_evaluations"]) if row["judge_evaluations"] else [],
+            "gap_report": json.loads(row["gap_report"]) if row["gap_report"] else None,
+            "created_at": datetime.fromisoformat(row["created_at"]),
+            "audio_format": row["audio_format"],
+            "messages": [
+                DebateMessage(
+                    id=m["id"],
+                    role=m["role"],
+                    persona_name=m["persona_name"] or "",
+                    content=m["content"],
+                    timestamp=datetime.fromisoformat(m["timestamp"]),
+                )
+                for m in message_rows
+            ],
+        }
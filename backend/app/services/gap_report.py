@@ -5,9 +5,11 @@ Synthesizes judge evaluations into a personalized student feedback report.
 
 from app.models.schemas import GapReport, JudgeEvaluation
 from app.services.llm_client import get_llm_client
+from app.services.llm_scheduler import PRIORITY_REPORT
+from app.services.prompt_registry import SystemPrompt
 
 
-GAP_REPORT_SYSTEM_PROMPT = """Based on all three judge evaluations, generate a personalized "Gap Report" for the student user.
+GAP_REPORT_SYSTEM_PROMPT = SystemPrompt("""Based on all three judge evaluations, generate a personalized "Gap Report" for the student user.
 
 Include:
 1. REASONING BLIND SPOTS: 2-3 logical weaknesses demonstrated in their interventions
@@ -45,7 +47,7 @@ Use this EXACT format:
 ---SUMMARY---
 [A brief 2-3 sentence encouraging summary of the student's performance and key areas for growth.]
 
-Format as clean, actionable insights. Use encouraging but honest tone."""
+Format as clean, actionable insights. Use encouraging but honest tone.""")
 
 
 async def generate_gap_report(
@@ -70,7 +72,7 @@ JUDGE EVALUATIONS:
 
     messages = [{"role": "user", "content": context}]
     raw = await llm.agenerate(
-        GAP_REPORT_SYSTEM_PROMPT, messages, temperature=0.4, max_tokens=1500
+        GAP_REPORT_SYSTEM_PROMPT, messages, temperature=0.4, max_tokens=1500, priority=PRIORITY_REPORT
     )
 
     return _parse_gap_report(raw, judge_evaluations)
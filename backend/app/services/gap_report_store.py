@@ -12,6 +12,7 @@ from fastapi import HTTPException, status
 from app.database import get_db
 from app.models.user import GapReportRecord, GapReportListItem
 from app.models.schemas import GapReport
+from app.services.user_cache import gap_report_list_cache
 
 
 async def save_gap_report(
@@ -21,8 +22,7 @@ async def save_gap_report(
     gap_report: GapReport,
 ) -> GapReportRecord:
     """Persist a gap report to the database."""
-    db = await get_db()
-    try:
+    async with get_db() as db:
         report_id = uuid.uuid4().hex[:16]
         now = datetime.now(timezone.utc).isoformat()
 
@@ -54,6 +54,7 @@ async def save_gap_report(
             ),
         )
         await db.commit()
+        gap_report_list_cache.invalidate(user_id)
 
         return GapReportRecord(
             id=report_id,
@@ -68,14 +69,15 @@ async def save_gap_report(
             overall_summary=gap_report.overall_summary,
             created_at=datetime.fromisoformat(now),
         )
-    finally:
-        await db.close()
 
 
 async def get_user_gap_reports(user_id: str) -> list[GapReportListItem]:
     """List all gap reports for a user (summary view)."""
-    db = await get_db()
-    try:
+    cached = gap_report_list_cache.get(user_id)
+    if cached is not None:
+        return cached
+
+    async with get_db() as db:
         cursor = await db.execute(
             """SELECT id, debate_session_id, topic_title, overall_summary, created_at
                FROM gap_reports
@@ -84,7 +86,7 @@ async def get_user_gap_reports(user_id: str) -> list[GapReportListItem]:
             (user_id,),
         )
         rows = await cursor.fetchall()
-        return [
+        reports = [
             GapReportListItem(
                 id=row["id"],
                 debate_session_id=row["debate_session_id"],
@@ -94,14 +96,13 @@ async def get_user_gap_reports(user_id: str) -> list[GapReportListItem]:
             )
             for row in rows
         ]
-    finally:
-        await db.close()
+    gap_report_list_cache.put(user_id, reports)
+    return reports
 
 
 async def get_gap_report_by_id(report_id: str, user_id: str) -> GapReportRecord:
     """Get a single gap report by ID (must belong to the user)."""
-    db = await get_db()
-    try:
+    async with get_db() as db:
         cursor = await db.execute(
             "SELECT * FROM gap_reports WHERE id = ? AND user_id = ?",
             (report_id, user_id),
@@ -126,19 +127,17 @@ async def get_gap_report_by_id(report_id: str, user_id: str) -> GapReportRecord:
             overall_summary=row["overall_summary"] or "",
             created_at=datetime.fromisoformat(row["created_at"]),
         )
-    finally:
-        await db.close()
 
 
 async def delete_gap_report(report_id: str, user_id: str) -> dict:
     """Delete a gap report (must belong to the user)."""
-    db = await get_db()
-    try:
+    async with get_db() as db:
         result = await db.execute(
             "DELETE FROM gap_reports WHERE id = ? AND user_id = ?",
             (report_id, user_id),
         )
         await db.commit()
+        gap_report_list_cache.invalidate(user_id)
 
         if result.rowcount == 0:
             raise HTTPException(
@@ -147,5 +146,3 @@ async def delete_gap_report(report_id: str, user_id: str) -> dict:
             )
 
         return {"detail": "Gap report deleted successfully"}
-    finally:
-        await db.close()
@@ -10,12 +10,24 @@ Required model files (place in backend/voice-models/ directory):
 Download from: https://github.com/thewh1teagle/kokoro-onnx/releases/tag/model-files-v1.0
 """
 
-import hashlib
 import io
 import logging
 import os
-from collections import OrderedDict
-from typing import Optional
+import queue
+import re
+import struct
+import threading
+import time
+from functools import lru_cache
+from typing import NamedTuple, Optional
+
+from app.config import get_settings
+from app.services.tts_cache import (
+    DiskAudioCache,
+    MemoryAudioCache,
+    TieredAudioCache,
+    audio_cache_key,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -87,35 +99,270 @@ def _pick_debater_voice(persona_name: str, role: str) -> str:
 _BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 MODEL_PATH = os.path.join(_BACKEND_DIR, "./voice-models/kokoro-v1.0.onnx")
 VOICES_PATH = os.path.join(_BACKEND_DIR, "./voice-models/voices-v1.0.bin")
+# Part of every cache key, so swapping model files never serves stale audio
+MODEL_VERSION = "+".join(
+    os.path.splitext(os.path.basename(p))[0] for p in (MODEL_PATH, VOICES_PATH)
+)
+DEFAULT_SPEED = 1.0
+DEFAULT_CACHE_DIR = os.path.join(_BACKEND_DIR, "tts-cache")
+
+
+def _build_audio_cache() -> TieredAudioCache:
+    settings = get_settings()
+    disk = None
+    if settings.tts_disk_cache_bytes > 0:
+        disk = DiskAudioCache(
+            settings.tts_disk_cache_dir or DEFAULT_CACHE_DIR,
+            max_bytes=settings.tts_disk_cache_bytes,
+        )
+    return TieredAudioCache(MemoryAudioCache(settings.tts_memory_cache_bytes), disk)
+
+# ── Sentence Splitting & Streaming WAV ───────────────────────────────
+MAX_SENTENCE_CHARS = 400  # longer runs are split at clause boundaries
+
+_SENTENCE_END = re.compile(r"(?:(?<=[.!?])|(?<=[.!?][\"')\]]))\s+")
+_CLAUSE_END = re.compile(r"(?<=[,;:])\s+")
+
+
+def split_sentences(text: str, max_chars: int = MAX_SENTENCE_CHARS) -> list[str]:
+    """Split text into sentence-sized chunks for progressive synthesis."""
+    chunks: list[str] = []
+    for sentence in _SENTENCE_END.split(text.strip()):
+        sentence = sentence.strip()
+        if not sentence:
+            continue
+        if len(sentence) <= max_chars:
+            chunks.append(sentence)
+            continue
+        # Long run-on sentence — pack clauses up to max_chars
+        current = ""
+        for clause in _CLAUSE_END.split(sentence):
+            if current and len(current) + len(clause) + 1 > max_chars:
+                chunks.append(current)
+                current = clause
+            else:
+                current = f"{current} {clause}" if current else clause
+        if current:
+            chunks.append(current)
+    return chunks
+
+
+# Mirrors splitSentences() in frontend/src/app/debate/[id]/page.tsx — keep the
+# two in sync, or prefetched sentences won't match what the page requests
+_CLIENT_SENTENCE = re.compile(r"[^.!?]*[.!?]+\s?|[^.!?]+$")
+
+
+def split_client_sentences(text: str) -> list[str]:
+    """Split text exactly like the debate page does before calling /api/tts."""
+    sentences = [s.strip() for s in _CLIENT_SENTENCE.findall(text)]
+    sentences = [s for s in sentences if s]
+    return sentences or [text]
+
+
+def wav_to_pcm16(wav: bytes) -> tuple[bytes, int, int]:
+    """Decode WAV bytes to raw little-endian PCM16. Returns (pcm, sample_rate, channels)."""
+    import soundfile as sf
+
+    samples, sample_rate = sf.read(io.BytesIO(wav), dtype="int16", always_2d=True)
+    return samples.astype("<i2", copy=False).tobytes(), sample_rate, samples.shape[1]
+
+
+def streaming_wav_header(sample_rate: int, channels: int = 1) -> bytes:
+    """RIFF/WAVE header for PCM16 of unknown length.
+
+    The size fields are set to the maximum, which browsers and ffmpeg treat as
+    "read until EOF", so PCM chunks can be appended as they are synthesized.
+    """
+    unknown = 0xFFFFFFFF
+    byte_rate = sample_rate * channels * 2
+    return (
+        b"RIFF" + struct.pack("<I", unknown) + b"WAVE"
+        + b"fmt " + struct.pack("<IHHIIHH", 16, 1, channels, sample_rate, byte_rate, channels * 2, 16)
+        + b"data" + struct.pack("<I", unknown)
+    )
+
+
+# ── Output Formats ───────────────────────────────────────────────────
+
+
+class AudioFormat(NamedTuple):
+    container: str  # soundfile/libsndfile format
+    subtype: str
+    media_type: str
+    extension: str
+
+
+DEFAULT_FORMAT = "wav"
+AUDIO_FORMATS: dict[str, AudioFormat] = {
+    "wav": AudioFormat("WAV", "PCM_16", "audio/wav", "wav"),
+    "flac": AudioFormat("FLAC", "PCM_16", "audio/flac", "flac"),
+    "ogg": AudioFormat("OGG", "VORBIS", "audio/ogg", "ogg"),
+    # Opus needs libsndfile >= 1.0.29 and an 8/12/16/24/48 kHz sample rate
+    "opus": AudioFormat("OGG", "OPUS", "audio/ogg; codecs=opus", "ogg"),
+}
 
-# ── LRU Audio Cache ──────────────────────────────────────────────────
-MAX_CACHE_ITEMS = 200  # ~200 sentences worth of audio
-
-
-class _AudioCache:
-    """Simple LRU cache for synthesized audio bytes."""
+NATIVE_SAMPLE_RATE = 24000  # Kokoro's output rate
+OPUS_SAMPLE_RATES = frozenset({8000, 12000, 16000, 24000, 48000})
+
+# Media types from an Accept header → format name
+_MEDIA_TYPE_FORMATS = {
+    "audio/wav": "wav",
+    "audio/wave": "wav",
+    "audio/x-wav": "wav",
+    "audio/flac": "flac",
+    "audio/x-flac": "flac",
+    "audio/ogg": "ogg",
+    "audio/opus": "opus",
+}
 
-    def __init__(self, max_size: int = MAX_CACHE_ITEMS):
-        self._cache: OrderedDict[str, bytes] = OrderedDict()
-        self._max_size = max_size
 
-    @staticmethod
-    def _key(text: str, voice: str) -> str:
-        return hashlib.md5(f"{voice}:{text}".encode()).hexdigest()
+@lru_cache()
+def _encodable_formats() -> tuple[str, ...]:
+    """Formats the installed libsndfile can encode, in AUDIO_FORMATS order."""
+    try:
+        import soundfile as sf
+    except ImportError:
+        return (DEFAULT_FORMAT,)
+    return tuple(
+        name for name, fmt in AUDIO_FORMATS.items()
+        if sf.check_format(fmt.container, fmt.subtype)
+    )
+
+
+def supported_formats() -> tuple[str, ...]:
+    """Formats we can encode at the configured output rate, in AUDIO_FORMATS order.
+
+    Opus is left out when ``tts_sample_rate`` isn't one of the rates it
+    accepts, so negotiation never picks a format that would fail to encode.
+    """
+    rate = get_settings().tts_sample_rate or NATIVE_SAMPLE_RATE
+    return tuple(
+        name for name in _encodable_formats()
+        if name != "opus" or rate in OPUS_SAMPLE_RATES
+    )
+
+
+def resolve_format(preferences: str) -> Optional[str]:
+    """First supported format in a comma-separated list like ``"opus,flac,wav"``."""
+    available = supported_formats()
+    for name in preferences.split(","):
+        name = name.strip().lower()
+        if name in available:
+            return name
+    return None
+
+
+def negotiate_format(accept: Optional[str]) -> str:
+    """Pick the best supported format for an Accept header (WAV if none match)."""
+    if not accept:
+        return DEFAULT_FORMAT
+    candidates = []
+    for position, item in enumerate(accept.split(",")):
+        media_type, *params = [part.strip().lower() for part in item.split(";")]
+        quality = 1.0
+        codecs = ""
+        for param in params:
+            name, _, value = param.partition("=")
+            if name == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+            elif name == "codecs":
+                codecs = value.strip('"')
+        name = _MEDIA_TYPE_FORMATS.get(media_type)
+        if name == "ogg" and codecs == "opus":
+            name = "opus"
+        if name and quality > 0:
+            candidates.append((-quality, position, name))
+    available = supported_formats()
+    for _, _, name in sorted(candidates):
+        if name in available:
+            return name
+    return DEFAULT_FORMAT
+
+
+def _resample(samples, source_rate: int, target_rate: int):
+    """Windowed-sinc low-pass + linear interpolation; good enough for speech."""
+    import numpy as np
+
+    if target_rate < source_rate:
+        cutoff = target_rate / source_rate / 2
+        taps = np.arange(-32, 33)
+        kernel = 2 * cutoff * np.sinc(2 * cutoff * taps) * np.hamming(len(taps))
+        samples = np.convolve(samples, kernel / kernel.sum(), mode="same")
+    duration = len(samples) / source_rate
+    target_times = np.arange(int(duration * target_rate)) / target_rate
+    source_times = np.arange(len(samples)) / source_rate
+    return np.interp(target_times, source_times, samples).astype(np.float32)
+
+
+# ── ONNX Runtime Session Options ─────────────────────────────────────
+
+_GRAPH_OPTIMIZATION_LEVELS = {
+    "disable": "ORT_DISABLE_ALL",
+    "basic": "ORT_ENABLE_BASIC",
+    "extended": "ORT_ENABLE_EXTENDED",
+    "all": "ORT_ENABLE_ALL",
+}
+_EXECUTION_MODES = {
+    "sequential": "ORT_SEQUENTIAL",
+    "parallel": "ORT_PARALLEL",
+}
 
-    def get(self, text: str, voice: str) -> Optional[bytes]:
-        key = self._key(text, voice)
-        if key in self._cache:
-            self._cache.move_to_end(key)
-            return self._cache[key]
-        return None
 
-    def put(self, text: str, voice: str, audio: bytes) -> None:
-        key = self._key(text, voice)
-        self._cache[key] = audio
-        self._cache.move_to_end(key)
-        while len(self._cache) > self._max_size:
-            self._cache.popitem(last=False)
+class OnnxOptions(NamedTuple):
+    intra_op_threads: int  # 0 = ONNX Runtime default (one per core)
+    inter_op_threads: int
+    graph_optimization: str  # a key of _GRAPH_OPTIMIZATION_LEVELS
+    execution_mode: str  # a key of _EXECUTION_MODES
+    replicas: int
+
+
+def onnx_options_from_settings() -> OnnxOptions:
+    """Session options from Settings, splitting the cores across replicas.
+
+    With several replicas and no explicit intra-op count, each replica gets
+    an equal share of the cores instead of every session spawning one thread
+    per core and fighting the others (and uvicorn) for them.
+    """
+    settings = get_settings()
+    replicas = max(1, settings.tts_replicas)
+    intra = settings.tts_intra_op_threads
+    if intra <= 0 and replicas > 1:
+        intra = max(1, (os.cpu_count() or 1) // replicas)
+    return OnnxOptions(
+        intra_op_threads=max(0, intra),
+        inter_op_threads=max(0, settings.tts_inter_op_threads),
+        graph_optimization=settings.tts_graph_optimization.lower(),
+        execution_mode=settings.tts_execution_mode.lower(),
+        replicas=replicas,
+    )
+
+
+def create_kokoro(options: OnnxOptions):
+    """Build one Kokoro instance on an InferenceSession tuned by ``options``."""
+    import onnxruntime as ort
+    from kokoro_onnx import Kokoro
+
+    try:
+        level = _GRAPH_OPTIMIZATION_LEVELS[options.graph_optimization]
+        mode = _EXECUTION_MODES[options.execution_mode]
+    except KeyError as e:
+        raise ValueError(f"Invalid ONNX Runtime option: {e}") from e
+
+    session_options = ort.SessionOptions()
+    if options.intra_op_threads:
+        session_options.intra_op_num_threads = options.intra_op_threads
+    if options.inter_op_threads:
+        session_options.inter_op_num_threads = options.inter_op_threads
+    session_options.graph_optimization_level = getattr(ort.GraphOptimizationLevel, level)
+    session_options.execution_mode = getattr(ort.ExecutionMode, mode)
+
+    # Same provider selection as Kokoro's own constructor
+    providers = [os.getenv("ONNX_PROVIDER") or "CPUExecutionProvider"]
+    session = ort.InferenceSession(MODEL_PATH, sess_options=session_options, providers=providers)
+    return Kokoro.from_session(session, VOICES_PATH)
 
 
 class KokoroTTSService:
@@ -123,20 +370,26 @@ class KokoroTTSService:
 
     _instance: Optional["KokoroTTSService"] = None
     _initialized: bool = False
+    # Concurrent first requests (or a warm-up racing a request) load the model once
+    _init_lock = threading.Lock()
 
     def __new__(cls) -> "KokoroTTSService":
         if cls._instance is None:
             cls._instance = super().__new__(cls)
-            cls._instance._cache = _AudioCache()
+            cls._instance._cache = _build_audio_cache()
         return cls._instance
 
     def _ensure_initialized(self) -> None:
         """Lazily load the Kokoro ONNX model on first use."""
         if self._initialized:
             return
+        with self._init_lock:
+            if not self._initialized:
+                self._load_model()
 
+    def _load_model(self) -> None:
         try:
-            from kokoro_onnx import Kokoro
+            import kokoro_onnx  # noqa: F401
         except ImportError:
             logger.error(
                 "❌ kokoro-onnx not installed. "
@@ -148,11 +401,33 @@ class KokoroTTSService:
         if not os.path.exists(MODEL_PATH) or not os.path.exists(VOICES_PATH):
             self._download_model_files()
 
-        logger.info("🔊 Loading Kokoro ONNX model...")
-        self._kokoro = Kokoro(MODEL_PATH, VOICES_PATH)
+        options = onnx_options_from_settings()
+        logger.info(f"🔊 Loading Kokoro ONNX model ({options})...")
+        # Each synthesis borrows a replica, so up to ``replicas`` run in parallel
+        self._replicas = [create_kokoro(options) for _ in range(options.replicas)]
+        self._idle_replicas: queue.Queue = queue.Queue()
+        for replica in self._replicas:
+            self._idle_replicas.put(replica)
         self._initialized = True
         logger.info("🔊 Kokoro ONNX model loaded successfully.")
 
+    @property
+    def is_ready(self) -> bool:
+        """True once the model is loaded in this process."""
+        return self._initialized
+
+    def warm_up(self) -> float:
+        """Load the model and run a throwaway synthesis so ONNX Runtime has
+        built its execution plan before the first real request.
+
+        Returns the time taken in seconds.
+        """
+        started = time.perf_counter()
+        self._ensure_initialized()
+        for replica in self._replicas:
+            replica.create("Warming up.", voice=DEFAULT_VOICE, speed=DEFAULT_SPEED, lang="en-us")
+        return time.perf_counter() - started
+
     @staticmethod
     def _download_model_files() -> None:
         """Download Kokoro model and voice files if not already present."""
@@ -177,13 +452,17 @@ class KokoroTTSService:
             if os.path.exists(path):
                 continue
             logger.info(f"⬇️  Downloading {label} ...")
+            # Download beside the target and rename, so other workers never
+            # load a half-written model file
+            partial = f"{path}.{os.getpid()}.part"
             try:
-                urllib.request.urlretrieve(url, path)
+                urllib.request.urlretrieve(url, partial)
+                os.replace(partial, path)
                 logger.info(f"✅  Downloaded {label}")
             except Exception as exc:
                 # Clean up partial file so the next run retries
-                if os.path.exists(path):
-                    os.remove(path)
+                if os.path.exists(partial):
+                    os.remove(partial)
                 raise RuntimeError(
                     f"Failed to download {label} from {url}: {exc}"
                 ) from exc
@@ -194,45 +473,101 @@ class KokoroTTSService:
             return _pick_debater_voice(persona_name, role)
         return ROLE_VOICE_MAP.get(role, DEFAULT_VOICE)
 
-    def synthesize(self, text: str, role: str = "moderator", persona_name: str = "") -> bytes:
+    def cache_key(self, text: str, role: str, persona_name: str, fmt: str = DEFAULT_FORMAT) -> str:
+        voice = self.get_voice_for_role(role, persona_name)
+        variant = f"{fmt}@{get_settings().tts_sample_rate or 'native'}"
+        return audio_cache_key(text, voice, DEFAULT_SPEED, MODEL_VERSION, variant)
+
+    def get_cached(
+        self,
+        text: str,
+        role: str = "moderator",
+        persona_name: str = "",
+        fmt: str = DEFAULT_FORMAT,
+        tier: Optional[str] = None,
+    ) -> Optional[bytes]:
+        """Return cached audio without loading the model, or None on a miss.
+
+        The disk tier does blocking file I/O; on the event loop pass
+        ``tier="memory"`` and look up ``tier="disk"`` from a thread.
+        """
+        return self._cache.get(self.cache_key(text, role, persona_name, fmt), tier=tier)
+
+    def store_cached(
+        self, text: str, role: str, persona_name: str, fmt: str, audio: bytes
+    ) -> None:
+        """Add audio synthesized in a pool process to this process's memory tier."""
+        self._cache.put(self.cache_key(text, role, persona_name, fmt), audio, memory_only=True)
+
+    def cache_stats(self) -> dict:
+        return self._cache.stats()
+
+    def synthesize(
+        self,
+        text: str,
+        role: str = "moderator",
+        persona_name: str = "",
+        fmt: str = DEFAULT_FORMAT,
+        check_cache: bool = True,
+    ) -> bytes:
         """
         Synthesize speech for the given text using a role-specific voice.
-        Uses LRU cache to avoid re-synthesizing identical text+voice combos.
+        Uses the two-tier (memory + disk) cache to avoid re-synthesizing
+        identical text+voice+format combos.
+
+        This is CPU-bound and blocks for seconds — from async code, go through
+        ``app.services.tts_engine.get_tts_engine().synthesize`` instead.
 
         Args:
             text: The text to convert to speech.
             role: The agent role (moderator, debater_a, debater_b, etc.)
             persona_name: The persona's display name (used for gender inference).
+            fmt: Output format, a key of AUDIO_FORMATS.
+            check_cache: Look the audio up first. The TTS engine passes False,
+                having already checked both tiers before queueing the job.
 
         Returns:
-            WAV audio as bytes.
+            Encoded audio as bytes.
         """
         import soundfile as sf
 
         self._ensure_initialized()
 
+        audio_format = AUDIO_FORMATS[fmt]
         voice = self.get_voice_for_role(role, persona_name)
+        key = self.cache_key(text, role, persona_name, fmt)
 
         # Check cache first
-        cached = self._cache.get(text, voice)
+        cached = self._cache.get(key) if check_cache else None
         if cached is not None:
             logger.info(f"🔊 Cache HIT for voice='{voice}' ({len(text)} chars)")
             return cached
 
         logger.info(f"🔊 Synthesizing TTS for role='{role}' voice='{voice}' ({len(text)} chars)")
 
-        samples, sample_rate = self._kokoro.create(
-            text, voice=voice, speed=1.0, lang="en-us"
-        )
+        kokoro = self._idle_replicas.get()
+        try:
+            samples, sample_rate = kokoro.create(
+                text, voice=voice, speed=DEFAULT_SPEED, lang="en-us"
+            )
+        finally:
+            self._idle_replicas.put(kokoro)
 
-        # Write to WAV in memory
+        target_rate = get_settings().tts_sample_rate
+        if target_rate and target_rate != sample_rate:
+            samples = _resample(samples, sample_rate, target_rate)
+            sample_rate = target_rate
+
+        # Encode in memory
         buffer = io.BytesIO()
-        sf.write(buffer, samples, sample_rate, format="WAV")
-        buffer.seek(0)
-        audio_bytes = buffer.read()
+        sf.write(
+            buffer, samples, sample_rate,
+            format=audio_format.container, subtype=audio_format.subtype,
+        )
+        audio_bytes = buffer.getvalue()
 
         # Store in cache
-        self._cache.put(text, voice, audio_bytes)
+        self._cache.put(key, audio_bytes)
 
         return audio_bytes
 
@@ -1,18 +1,40 @@
 """
 Groq LLM client wrapper for SocraticCanvas.
-Provides synchronous and streaming inference using the Groq SDK.
-Automatically falls back to a secondary model on rate-limit (429) errors.
+Async-first: completions and streams run on the async Groq SDK, and the
+blocking ``generate`` is a thin wrapper for code without an event loop.
+Calls are admitted by a rate-limit-aware priority scheduler, retried
+with jittered backoff behind a per-model circuit breaker, optionally hedged,
+and fall back to a secondary model when the primary is rate limited or down.
 """
 
+import asyncio
 import logging
-from typing import AsyncGenerator
+import threading
+import time
+from typing import AsyncGenerator, Awaitable, Callable, TypeVar
 
-from groq import Groq, AsyncGroq, RateLimitError
+from groq import AsyncGroq, RateLimitError
 
 from app.config import get_settings
+from app.services.llm_resilience import (
+    TRANSIENT_ERRORS,
+    CircuitBreaker,
+    CircuitOpenError,
+    LatencyTracker,
+    backoff_delay,
+    hedged,
+)
+from app.services.llm_scheduler import PRIORITY_TURN, LLMScheduler, estimate_tokens
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Failures on the primary model after which the fallback model is tried;
+# TimeoutError is the primary running out of the deadline, which the
+# fallback's own minimum budget covers
+_FALLBACK_ERRORS = (RateLimitError, CircuitOpenError, TimeoutError) + TRANSIENT_ERRORS
+
 
 class LLMClient:
     """Wrapper around the Groq API for LLM inference."""
@@ -23,8 +45,60 @@ class LLMClient:
         self.fallback_model = settings.llm_fallback_model
         self.max_tokens = settings.max_tokens
         self.temperature = settings.temperature
-        self._sync_client = Groq(api_key=settings.groq_api_key)
-        self._async_client = AsyncGroq(api_key=settings.groq_api_key)
+        base_url = settings.groq_base_url or None
+        # Retries happen below, per model and within the call's deadline
+        self._async_client = AsyncGroq(api_key=settings.groq_api_key, base_url=base_url, max_retries=0)
+        self._scheduler = LLMScheduler(
+            settings.llm_max_concurrency,
+            settings.llm_requests_per_minute,
+            settings.llm_tokens_per_minute,
+        )
+
+        self._timeout = settings.llm_timeout_seconds
+        self._deadline = settings.llm_deadline_seconds
+        self._fallback_min_timeout = settings.llm_fallback_min_timeout_seconds
+        self._max_retries = settings.llm_max_retries
+        self._backoff_base = settings.llm_backoff_base_seconds
+        self._backoff_max = settings.llm_backoff_max_seconds
+        self._breaker_failures = settings.llm_breaker_failures
+        self._breaker_cooldown = settings.llm_breaker_cooldown_seconds
+        self._hedge = settings.llm_hedge
+        self._hedge_max_ratio = settings.llm_hedge_max_ratio
+        self._hedge_min_delay = settings.llm_hedge_min_delay_seconds
+        self._breakers: dict[str, CircuitBreaker] = {}
+        # (model, streaming) -> latency of full completions / first tokens
+        self._latency: dict[tuple[str, bool], LatencyTracker] = {}
+
+        # Prompt-cache key -> [calls, prompt tokens, cached prompt tokens]
+        self._prefix_usage: dict[str, list[int]] = {}
+
+        self.calls = 0
+        self.retries = 0
+        self.fallbacks = 0
+        self.hedges = 0
+
+        # Private loop and client for generate(); see there
+        self._sync_lock = threading.Lock()
+        self._sync_loop: asyncio.AbstractEventLoop | None = None
+        self._sync_client: "LLMClient | None" = None
+
+    def _request_kwargs(
+        self,
+        system_prompt: str,
+        messages: list[dict[str, str]],
+        temperature: float | None,
+        max_tokens: int | None,
+    ) -> dict:
+        """Chat-completion arguments; only ``None`` means "use the default".
+
+        A registry SystemPrompt brings its own prebuilt system message.
+        """
+        system = getattr(system_prompt, "message", None) or {"role": "system", "content": system_prompt}
+        return dict(
+            messages=[system, *messages],
+            temperature=self.temperature if temperature is None else temperature,
+            max_tokens=self.max_tokens if max_tokens is None else max_tokens,
+        )
 
     def generate(
         self,
@@ -32,30 +106,31 @@ class LLMClient:
         messages: list[dict[str, str]],
         temperature: float | None = None,
         max_tokens: int | None = None,
+        priority: int = PRIORITY_TURN,
     ) -> str:
-        """Generate a completion synchronously. Falls back on rate limit."""
-        full_messages = [{"role": "system", "content": system_prompt}] + messages
-        kwargs = dict(
-            messages=full_messages,
-            temperature=self.temperature if temperature is None else temperature,
-            max_tokens=self.max_tokens if max_tokens is None else max_tokens
-        )
+        """Blocking wrapper around ``agenerate`` for scripts and other sync code.
+
+        Raises RuntimeError when called on a running event loop, which it would
+        freeze for the whole completion — await ``agenerate`` there instead.
+        Sync calls are serialized on a private loop with their own connection
+        pool and rate budgets, since the async client is bound to one loop.
+        """
         try:
-            response = self._sync_client.chat.completions.create(
-                model=self.model, **kwargs
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            raise RuntimeError(
+                "LLMClient.generate() would block the running event loop; await agenerate() instead"
             )
-            return response.choices[0].message.content or ""
-        except RateLimitError as e:
-            logger.warning(
-                f"Rate limit hit on {self.model}, falling back to {self.fallback_model}: {e}"
-            )
-            response = self._sync_client.chat.completions.create(
-                model=self.fallback_model, **kwargs
+
+        with self._sync_lock:
+            if self._sync_loop is None:
+                self._sync_loop = asyncio.new_event_loop()
+                self._sync_client = LLMClient()
+            return self._sync_loop.run_until_complete(
+                self._sync_client.agenerate(system_prompt, messages, temperature, max_tokens, priority)
             )
-            return response.choices[0].message.content or ""
-        except Exception as e:
-            logger.error(f"LLM generation error: {e}")
-            raise
 
     async def agenerate(
         self,
@@ -63,27 +138,17 @@ class LLMClient:
         messages: list[dict[str, str]],
         temperature: float | None = None,
         max_tokens: int | None = None,
+        priority: int = PRIORITY_TURN,
     ) -> str:
-        """Generate a completion asynchronously. Falls back on rate limit."""
-        full_messages = [{"role": "system", "content": system_prompt}] + messages
-        kwargs = dict(
-            messages=full_messages,
-            temperature=temperature or self.temperature,
-            max_tokens=max_tokens or self.max_tokens,
-        )
+        """Generate a completion asynchronously. Falls back on rate limit or outage."""
+        kwargs = self._request_kwargs(system_prompt, messages, temperature, max_tokens)
+        deadline = time.monotonic() + self._deadline
+        self.calls += 1
         try:
-            response = await self._async_client.chat.completions.create(
-                model=self.model, **kwargs
-            )
-            return response.choices[0].message.content or ""
-        except RateLimitError as e:
-            logger.warning(
-                f"Rate limit hit on {self.model}, falling back to {self.fallback_model}: {e}"
-            )
-            response = await self._async_client.chat.completions.create(
-                model=self.fallback_model, **kwargs
+            return await self._with_fallback(
+                lambda model, deadline: self._complete(model, kwargs, priority, deadline),
+                deadline,
             )
-            return response.choices[0].message.content or ""
         except Exception as e:
             logger.error(f"LLM async generation error: {e}")
             raise
@@ -94,38 +159,264 @@ class LLMClient:
         messages: list[dict[str, str]],
         temperature: float | None = None,
         max_tokens: int | None = None,
+        priority: int = PRIORITY_TURN,
     ) -> AsyncGenerator[str, None]:
-        """Stream a completion token by token. Falls back on rate limit."""
-        full_messages = [{"role": "system", "content": system_prompt}] + messages
-        kwargs = dict(
-            messages=full_messages,
-            temperature=self.temperature if temperature is None else temperature,
-            max_tokens=self.max_tokens if max_tokens is None else max_tokens,
-            stream=True,
-        )
+        """Stream a completion token by token. Falls back on rate limit or outage.
+
+        Retries, hedging and fallback apply until the first token arrives;
+        a failure after that ends the stream with the error.
+        """
+        kwargs = self._request_kwargs(system_prompt, messages, temperature, max_tokens)
+        kwargs["stream"] = True
+        deadline = time.monotonic() + self._deadline
+        self.calls += 1
         try:
-            stream = await self._async_client.chat.completions.create(
-                model=self.model, **kwargs
+            first, tokens = await self._with_fallback(
+                lambda model, deadline: self._open_stream(model, kwargs, priority, deadline),
+                deadline,
             )
-            async for chunk in stream:
-                delta = chunk.choices[0].delta
-                if delta.content:
-                    yield delta.content
-        except RateLimitError as e:
+        except Exception as e:
+            logger.error(f"LLM stream error: {e}")
+            raise
+
+        try:
+            if first:
+                yield first
+            async for token in tokens:
+                yield token
+        except Exception as e:
+            logger.error(f"LLM stream error: {e}")
+            raise
+        finally:
+            await tokens.aclose()
+
+    # ── Resilience ───────────────────────────────────────────────────
+
+    async def _with_fallback(
+        self, call: Callable[[str, float], Awaitable[T]], deadline: float
+    ) -> T:
+        """Run ``call(model, deadline)`` on the primary model, then on the fallback.
+
+        The fallback gets whatever is left of ``deadline`` but at least
+        ``llm_fallback_min_timeout_seconds``, so a primary that burned the
+        budget on retries doesn't leave it too little time to answer.
+        """
+        try:
+            return await call(self.model, deadline)
+        except _FALLBACK_ERRORS as e:
+            if self.fallback_model == self.model:
+                raise
+            self.fallbacks += 1
             logger.warning(
-                f"Rate limit hit on {self.model} (stream), falling back to {self.fallback_model}: {e}"
+                f"{self.model} unavailable, falling back to {self.fallback_model}: {e}"
             )
-            stream = await self._async_client.chat.completions.create(
-                model=self.fallback_model, **kwargs
+            fallback_deadline = max(deadline, time.monotonic() + self._fallback_min_timeout)
+            return await call(self.fallback_model, fallback_deadline)
+
+    async def _with_retries(
+        self, model: str, deadline: float, attempt: Callable[[float], Awaitable[T]]
+    ) -> T:
+        """Call ``attempt(timeout)``, retrying transient failures with jittered backoff.
+
+        Gives up after ``llm_max_retries`` retries, or as soon as the next
+        backoff would overrun the deadline. Every failure counts against the
+        model's circuit breaker; rate limits are left to the scheduler.
+        """
+        breaker = self._breakers.get(model)
+        if breaker is None:
+            breaker = self._breakers[model] = CircuitBreaker(
+                self._breaker_failures, self._breaker_cooldown
             )
-            async for chunk in stream:
-                delta = chunk.choices[0].delta
-                if delta.content:
-                    yield delta.content
-        except Exception as e:
-            logger.error(f"LLM stream error: {e}")
+        retry = 0
+        while True:
+            breaker.check(model)
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(f"LLM deadline exceeded for {model}")
+            try:
+                result = await attempt(min(self._timeout, remaining))
+            except TRANSIENT_ERRORS as e:
+                breaker.record_failure()
+                retry += 1
+                delay = backoff_delay(retry, self._backoff_base, self._backoff_max)
+                if retry > self._max_retries or time.monotonic() + delay >= deadline:
+                    raise
+                self.retries += 1
+                logger.warning(f"🔁 {model} {type(e).__name__}, retry {retry} in {delay:.2f}s")
+                await asyncio.sleep(delay)
+            else:
+                breaker.record_success()
+                return result
+
+    async def _hedged(
+        self,
+        model: str,
+        streaming: bool,
+        tokens: int,
+        attempt: Callable[[], Awaitable[T]],
+        discard: Callable[[T], Awaitable[None]],
+    ) -> T:
+        """Run ``attempt``, sending a duplicate once it is slower than this model's p95."""
+        tracker = self._latency.get((model, streaming))
+        if tracker is None:
+            tracker = self._latency[(model, streaming)] = LatencyTracker()
+
+        async def timed() -> T:
+            start = time.monotonic()
+            result = await attempt()
+            tracker.record(time.monotonic() - start)
+            return result
+
+        def may_hedge() -> bool:
+            # Bound the extra spend, and never queue a duplicate behind real work
+            if self.hedges >= self._hedge_max_ratio * self.calls:
+                return False
+            if not self._scheduler.has_capacity(model, tokens):
+                return False
+            self.hedges += 1
+            return True
+
+        delay = None
+        if self._hedge:
+            p95 = tracker.percentile(95)
+            if p95 is not None:
+                delay = max(p95, self._hedge_min_delay)
+        result, _ = await hedged(timed, delay, may_hedge, discard)
+        return result
+
+    async def _complete(self, model: str, kwargs: dict, priority: int, deadline: float) -> str:
+        tokens = estimate_tokens(kwargs["messages"], kwargs["max_tokens"])
+
+        async def discard(_: str) -> None:
+            pass
+
+        async def attempt(timeout: float) -> str:
+            return await self._hedged(
+                model, False, tokens,
+                lambda: self._acreate(model, {**kwargs, "timeout": timeout}, priority),
+                discard,
+            )
+
+        return await self._with_retries(model, deadline, attempt)
+
+    async def _open_stream(
+        self, model: str, kwargs: dict, priority: int, deadline: float
+    ) -> tuple[str, AsyncGenerator[str, None]]:
+        tokens = estimate_tokens(kwargs["messages"], kwargs["max_tokens"])
+
+        async def discard(opened: tuple[str, AsyncGenerator[str, None]]) -> None:
+            await opened[1].aclose()
+
+        async def attempt(timeout: float) -> tuple[str, AsyncGenerator[str, None]]:
+            return await self._hedged(
+                model, True, tokens,
+                lambda: self._first_token(self._astream(model, {**kwargs, "timeout": timeout}, priority)),
+                discard,
+            )
+
+        return await self._with_retries(model, deadline, attempt)
+
+    @staticmethod
+    async def _first_token(
+        stream: AsyncGenerator[str, None],
+    ) -> tuple[str, AsyncGenerator[str, None]]:
+        """Wait for a stream's first token; the generator carries on from there."""
+        try:
+            return await stream.__anext__(), stream
+        except StopAsyncIteration:
+            return "", stream
+        except BaseException:
+            await stream.aclose()
             raise
 
+    # ── Scheduled Groq Calls ─────────────────────────────────────────
+
+    async def _acreate(self, model: str, kwargs: dict, priority: int) -> str:
+        """One scheduled, non-streaming completion."""
+        tokens = estimate_tokens(kwargs["messages"], kwargs["max_tokens"])
+        async with self._scheduler.slot(model, tokens, priority) as ticket:
+            try:
+                raw = await self._async_client.chat.completions.with_raw_response.create(
+                    model=model, **kwargs
+                )
+            except RateLimitError as e:
+                ticket.rate_limited(e.response.headers)
+                raise
+            ticket.observe(raw.headers)
+            response = await raw.parse()
+            if response.usage is not None:
+                ticket.settle(response.usage.total_tokens)
+                self._record_usage(kwargs, response.usage)
+            return response.choices[0].message.content or ""
+
+    async def _astream(self, model: str, kwargs: dict, priority: int) -> AsyncGenerator[str, None]:
+        """One scheduled streaming completion; holds its slot until fully read."""
+        tokens = estimate_tokens(kwargs["messages"], kwargs["max_tokens"])
+        async with self._scheduler.slot(model, tokens, priority) as ticket:
+            try:
+                raw = await self._async_client.chat.completions.with_raw_response.create(
+                    model=model, **kwargs
+                )
+            except RateLimitError as e:
+                ticket.rate_limited(e.response.headers)
+                raise
+            ticket.observe(raw.headers)
+            completion_chars = 0
+            usage = None
+            async with await raw.parse() as stream:
+                async for chunk in stream:
+                    if chunk.x_groq is not None and chunk.x_groq.usage is not None:
+                        usage = chunk.x_groq.usage
+                    if not chunk.choices:
+                        continue
+                    delta = chunk.choices[0].delta
+                    if delta.content:
+                        completion_chars += len(delta.content)
+                        yield delta.content
+            if usage is not None:
+                ticket.settle(usage.total_tokens)
+                self._record_usage(kwargs, usage)
+            else:
+                ticket.settle(tokens - kwargs["max_tokens"] + completion_chars // 4)
+
+    def _record_usage(self, kwargs: dict, usage) -> None:
+        """Attribute prompt and cached-prefix tokens to the call's system prompt."""
+        key = getattr(kwargs["messages"][0]["content"], "key", None)
+        if key is None:
+            return
+        entry = self._prefix_usage.get(key)
+        if entry is None:
+            entry = self._prefix_usage[key] = [0, 0, 0]
+        details = getattr(usage, "prompt_tokens_details", None)
+        entry[0] += 1
+        entry[1] += usage.prompt_tokens or 0
+        entry[2] += (details.cached_tokens or 0) if details is not None else 0
+
+    def stats(self) -> dict:
+        """Scheduler, retry, hedging, circuit breaker and prompt-cache counters for /api/health."""
+        p95 = {}
+        for (model, streaming), tracker in self._latency.items():
+            seconds = tracker.percentile(95)
+            if seconds is not None:
+                p95[f"{model} ({'first token' if streaming else 'completion'})"] = round(seconds * 1000)
+        prompt_tokens = sum(entry[1] for entry in self._prefix_usage.values())
+        cached_tokens = sum(entry[2] for entry in self._prefix_usage.values())
+        return {
+            "scheduler": self._scheduler.stats(),
+            "calls": self.calls,
+            "retries": self.retries,
+            "fallbacks": self.fallbacks,
+            "hedges": self.hedges,
+            "p95_ms": p95,
+            "breakers": {model: breaker.stats() for model, breaker in self._breakers.items()},
+            "prompt_cache": {
+                "prompts": len(self._prefix_usage),
+                "prompt_tokens": prompt_tokens,
+                "cached_tokens": cached_tokens,
+                "hit_ratio": round(cached_tokens / prompt_tokens, 3) if prompt_tokens else 0.0,
+            },
+        }
+
 
 # Singleton instance
 _client: LLMClient | None = None
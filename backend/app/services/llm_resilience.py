@@ -0,0 +1,149 @@
+"""
+Resilience primitives for Groq calls in SocraticCanvas.
+Per-model circuit breakers, jittered exponential backoff, latency tracking
+and hedged (duplicate) requests, so transient failures and slow replies
+don't end a debate phase.
+"""
+
+import asyncio
+import logging
+import math
+import random
+import time
+from collections import deque
+from typing import Awaitable, Callable, Optional, TypeVar
+
+from groq import APIConnectionError, InternalServerError
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Worth retrying on the same model: timeouts (a subclass of
+# APIConnectionError), dropped connections and 5xx responses
+TRANSIENT_ERRORS = (APIConnectionError, InternalServerError)
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a model whose circuit is open."""
+
+    def __init__(self, model: str, retry_in: float):
+        super().__init__(f"Circuit open for {model}, next probe in {retry_in:.1f}s")
+        self.model = model
+
+
+def backoff_delay(attempt: int, base: float, cap: float) -> float:
+    """Full-jitter exponential backoff for retry number ``attempt`` (1-based)."""
+    return random.uniform(0, min(cap, base * 2 ** (attempt - 1)))
+
+
+# ── Circuit Breaker ──────────────────────────────────────────────────
+
+
+class CircuitBreaker:
+    """Opens after ``failure_threshold`` consecutive transient failures.
+
+    While open, calls are refused until ``cooldown_seconds`` have passed; then
+    a single probe is let through per cooldown period. A successful probe
+    closes the circuit, a failed one re-opens it.
+    """
+
+    def __init__(self, failure_threshold: int, cooldown_seconds: float):
+        self.failure_threshold = max(1, failure_threshold)
+        self.cooldown = cooldown_seconds
+        self.failures = 0
+        self.is_open = False
+        self._retry_at = 0.0
+        self.opened = 0
+
+    def check(self, model: str) -> None:
+        """Raise CircuitOpenError unless a call may go ahead now."""
+        if not self.is_open:
+            return
+        now = time.monotonic()
+        if now < self._retry_at:
+            raise CircuitOpenError(model, self._retry_at - now)
+        # Half-open: this caller is the probe, everyone else waits a cooldown
+        self._retry_at = now + self.cooldown
+
+    def record_success(self) -> None:
+        if self.is_open:
+            logger.info("🔌 LLM circuit closed after a successful probe")
+        self.failures = 0
+        self.is_open = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self.is_open or self.failures >= self.failure_threshold:
+            if not self.is_open:
+                self.opened += 1
+            self.is_open = True
+            self._retry_at = time.monotonic() + self.cooldown
+
+    def stats(self) -> dict:
+        return {
+            "state": "open" if self.is_open else "closed",
+            "consecutive_failures": self.failures,
+            "times_opened": self.opened,
+        }
+
+
+# ── Hedging ──────────────────────────────────────────────────────────
+
+
+class LatencyTracker:
+    """Recent successful call latencies, for picking the hedge delay."""
+
+    def __init__(self, size: int = 200):
+        self._samples: deque[float] = deque(maxlen=size)
+
+    def record(self, seconds: float) -> None:
+        self._samples.append(seconds)
+
+    def percentile(self, p: float, min_samples: int = 20) -> Optional[float]:
+        """Nearest-rank percentile, or None until enough calls have been seen."""
+        if len(self._samples) < min_samples:
+            return None
+        ordered = sorted(self._samples)
+        return ordered[max(0, math.ceil(p / 100 * len(ordered)) - 1)]
+
+
+async def hedged(
+    attempt: Callable[[], Awaitable[T]],
+    delay: Optional[float],
+    may_hedge: Callable[[], bool],
+    discard: Callable[[T], Awaitable[None]],
+) -> tuple[T, bool]:
+    """Run ``attempt``; if it hasn't finished after ``delay`` seconds and
+    ``may_hedge()`` agrees, start a duplicate and keep whichever succeeds
+    first. The loser is cancelled (or passed to ``discard`` if it finished
+    too). Returns the result and whether a hedge was sent.
+    """
+    first = asyncio.ensure_future(attempt())
+    if delay is None:
+        return await first, False
+
+    tasks = {first}
+    try:
+        done, _ = await asyncio.wait(tasks, timeout=delay)
+        if done or not may_hedge():
+            return await first, False
+
+        tasks.add(asyncio.ensure_future(attempt()))
+        error: Optional[BaseException] = None
+        pending = set(tasks)
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            winner = next((t for t in done if t.exception() is None), None)
+            if winner is None:
+                error = next(iter(done)).exception()
+                continue
+            for task in tasks - {winner}:
+                if task.done() and not task.cancelled() and task.exception() is None:
+                    await discard(task.result())
+            return winner.result(), True
+        raise error
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
@@ -0,0 +1,326 @@
+"""
+Rate-limit-aware scheduler for Groq calls in SocraticCanvas.
+Caps in-flight requests and admits queued callers in priority order only when
+the target model's request and token budgets have room, so bursts wait here
+instead of turning into 429s.
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import re
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Mapping, Optional
+
+logger = logging.getLogger(__name__)
+
+# Lower value runs first
+PRIORITY_TURN = 0  # moderator and debater turns a student is watching
+PRIORITY_JUDGE = 1
+PRIORITY_REPORT = 2
+PRIORITY_BACKGROUND = 3  # work nobody is waiting on yet, e.g. context summaries
+
+WINDOW_SECONDS = 60.0
+
+# Groq reset durations look like "7.66s", "2m59.56s" or "120ms"
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+_DURATION_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+def parse_duration(value: Optional[str]) -> Optional[float]:
+    """Parse a Groq ``x-ratelimit-reset-*`` or ``retry-after`` value into seconds."""
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    parts = _DURATION_PART.findall(value)
+    if not parts:
+        return None
+    return sum(float(amount) * _DURATION_UNITS[unit] for amount, unit in parts)
+
+
+def estimate_tokens(messages: list[dict[str, str]], max_tokens: int) -> int:
+    """Rough request cost: ~4 characters per prompt token plus the completion cap."""
+    prompt = sum(len(m.get("content") or "") for m in messages) // 4 + 4 * len(messages)
+    return prompt + max_tokens
+
+
+# ── Per-model Budget ─────────────────────────────────────────────────
+
+
+class ModelBudget:
+    """Request and token budget for one model.
+
+    Tracks a local sliding one-minute window against the configured limits and
+    the remaining budget Groq reports in its ``x-ratelimit-*`` headers. Local
+    admissions are subtracted from the server's figures until the next
+    response corrects them.
+    """
+
+    def __init__(self, requests_per_minute: int, tokens_per_minute: int):
+        self.rpm = requests_per_minute
+        self.tpm = tokens_per_minute
+        self._window: deque[list] = deque()  # [admitted_at, tokens]
+        self._window_tokens = 0
+        # Server-reported (remaining, resets_at); ignored once resets_at passes
+        self._server_requests: Optional[tuple[int, float]] = None
+        self._server_tokens: Optional[tuple[int, float]] = None
+        self.blocked_until = 0.0  # set after a 429
+
+    def _trim(self, now: float) -> None:
+        while self._window and self._window[0][0] <= now - WINDOW_SECONDS:
+            _, tokens = self._window.popleft()
+            self._window_tokens -= tokens
+
+    def wait_time(self, tokens: int, now: float) -> float:
+        """Seconds until a request costing ``tokens`` may be sent (0 = now)."""
+        if now < self.blocked_until:
+            return self.blocked_until - now
+        self._trim(now)
+
+        wait = 0.0
+        if self.rpm and len(self._window) >= self.rpm:
+            wait = max(wait, self._window[0][0] + WINDOW_SECONDS - now)
+        if self.tpm and self._window and self._window_tokens + tokens > self.tpm:
+            # Wait until enough of the window has expired to fit this request
+            excess = self._window_tokens + tokens - self.tpm
+            for admitted_at, spent in self._window:
+                excess -= spent
+                if excess <= 0:
+                    wait = max(wait, admitted_at + WINDOW_SECONDS - now)
+                    break
+        if self._server_requests is not None:
+            remaining, resets_at = self._server_requests
+            if now < resets_at and remaining < 1:
+                wait = max(wait, resets_at - now)
+        if self._server_tokens is not None:
+            remaining, resets_at = self._server_tokens
+            if now < resets_at and remaining < tokens:
+                wait = max(wait, resets_at - now)
+        return wait
+
+    def admit(self, tokens: int, now: float) -> list:
+        entry = [now, tokens]
+        self._window.append(entry)
+        self._window_tokens += tokens
+        if self._server_requests is not None:
+            remaining, resets_at = self._server_requests
+            self._server_requests = (remaining - 1, resets_at)
+        if self._server_tokens is not None:
+            remaining, resets_at = self._server_tokens
+            self._server_tokens = (remaining - tokens, resets_at)
+        return entry
+
+    def settle(self, entry: list, tokens: int) -> None:
+        """Replace an admission's estimated cost with what it actually used."""
+        if entry in self._window:
+            self._window_tokens += tokens - entry[1]
+        entry[1] = tokens
+
+    def observe(self, headers: Mapping[str, str], now: float) -> None:
+        """Adopt the remaining budget reported by Groq."""
+        for kind in ("requests", "tokens"):
+            remaining = headers.get(f"x-ratelimit-remaining-{kind}")
+            reset = parse_duration(headers.get(f"x-ratelimit-reset-{kind}"))
+            if remaining is None or reset is None:
+                continue
+            try:
+                state = (int(remaining), now + reset)
+            except ValueError:
+                continue
+            if kind == "requests":
+                self._server_requests = state
+            else:
+                self._server_tokens = state
+
+    def stats(self, now: float) -> dict:
+        self._trim(now)
+        return {
+            "requests_last_minute": len(self._window),
+            "tokens_last_minute": self._window_tokens,
+            "server_remaining_requests": (
+                self._server_requests[0]
+                if self._server_requests and now < self._server_requests[1] else None
+            ),
+            "server_remaining_tokens": (
+                self._server_tokens[0]
+                if self._server_tokens and now < self._server_tokens[1] else None
+            ),
+            "blocked_for_seconds": round(max(0.0, self.blocked_until - now), 2),
+        }
+
+
+# ── Scheduler ────────────────────────────────────────────────────────
+
+
+class Ticket:
+    """An admitted request; report the response back through it."""
+
+    __slots__ = ("model", "tokens", "_scheduler", "_entry")
+
+    def __init__(self, scheduler: "LLMScheduler", model: str, tokens: int, entry: list):
+        self._scheduler = scheduler
+        self._entry = entry
+        self.model = model
+        self.tokens = tokens
+
+    def observe(self, headers: Mapping[str, str]) -> None:
+        self._scheduler.budget(self.model).observe(headers, time.monotonic())
+
+    def settle(self, tokens: int) -> None:
+        self._scheduler.budget(self.model).settle(self._entry, tokens)
+
+    def rate_limited(self, headers: Mapping[str, str]) -> None:
+        """Hold back every queued request for this model after a 429."""
+        self._scheduler.penalize(self.model, headers)
+
+
+class _Waiter:
+    __slots__ = ("priority", "seq", "model", "tokens", "future", "queued_at")
+
+    def __init__(self, priority: int, seq: int, model: str, tokens: int, future: asyncio.Future):
+        self.priority = priority
+        self.seq = seq
+        self.model = model
+        self.tokens = tokens
+        self.future = future
+        self.queued_at = time.monotonic()
+
+    def __lt__(self, other: "_Waiter") -> bool:
+        return (self.priority, self.seq) < (other.priority, other.seq)
+
+
+class LLMScheduler:
+    """Priority admission queue in front of the Groq API.
+
+    At most ``max_concurrency`` calls are in flight. Waiters are admitted in
+    priority order, FIFO within a priority; a waiter whose model is out of
+    budget blocks only lower-priority waiters for that same model, and a
+    timer re-runs admission when the budget frees up. Budgets are per worker.
+    """
+
+    # Back off this long after a 429 that carries no retry-after header
+    DEFAULT_PENALTY_SECONDS = 1.0
+
+    def __init__(self, max_concurrency: int, requests_per_minute: int = 0, tokens_per_minute: int = 0):
+        self._max_concurrency = max(1, max_concurrency)
+        self._rpm = requests_per_minute
+        self._tpm = tokens_per_minute
+        self._budgets: dict[str, ModelBudget] = {}
+        self._heap: list[_Waiter] = []
+        self._seq = itertools.count()
+        self._running = 0
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+        self.admitted = 0
+        self.throttled = 0  # admissions that had to wait for budget or a slot
+        self.rate_limited = 0
+        self.wait_seconds = 0.0
+
+    def budget(self, model: str) -> ModelBudget:
+        budget = self._budgets.get(model)
+        if budget is None:
+            budget = self._budgets[model] = ModelBudget(self._rpm, self._tpm)
+        return budget
+
+    @asynccontextmanager
+    async def slot(self, model: str, tokens: int, priority: int = PRIORITY_TURN) -> AsyncIterator[Ticket]:
+        """Wait for admission, hold a concurrency slot for the block's duration."""
+        ticket = await self._acquire(model, tokens, priority)
+        try:
+            yield ticket
+        finally:
+            self._release()
+
+    def has_capacity(self, model: str, tokens: int) -> bool:
+        """True if a call could be admitted right now without queueing."""
+        return (
+            not self._heap
+            and self._running < self._max_concurrency
+            and self.budget(model).wait_time(tokens, time.monotonic()) == 0
+        )
+
+    async def _acquire(self, model: str, tokens: int, priority: int) -> Ticket:
+        if self.has_capacity(model, tokens):
+            return self._admit(model, tokens, time.monotonic())
+
+        future = asyncio.get_running_loop().create_future()
+        waiter = _Waiter(priority, next(self._seq), model, tokens, future)
+        heapq.heappush(self._heap, waiter)
+        self.throttled += 1
+        self._dispatch()
+        try:
+            return await future
+        except asyncio.CancelledError:
+            # Admitted just as the caller went away — give the slot back
+            if future.done() and not future.cancelled():
+                self._release()
+            raise
+
+    def _admit(self, model: str, tokens: int, now: float) -> Ticket:
+        entry = self.budget(model).admit(tokens, now)
+        self._running += 1
+        self.admitted += 1
+        return Ticket(self, model, tokens, entry)
+
+    def _release(self) -> None:
+        self._running -= 1
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        """Admit as many queued waiters as slots and budgets allow."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        now = time.monotonic()
+        blocked: set[str] = set()
+        deferred: list[_Waiter] = []
+        next_wake: Optional[float] = None
+        while self._heap and self._running < self._max_concurrency:
+            waiter = heapq.heappop(self._heap)
+            if waiter.future.done():
+                continue  # caller cancelled while queued
+            if waiter.model in blocked:
+                deferred.append(waiter)
+                continue
+            wait = self.budget(waiter.model).wait_time(waiter.tokens, now)
+            if wait > 0:
+                blocked.add(waiter.model)
+                deferred.append(waiter)
+                next_wake = wait if next_wake is None else min(next_wake, wait)
+                continue
+            self.wait_seconds += now - waiter.queued_at
+            waiter.future.set_result(self._admit(waiter.model, waiter.tokens, now))
+
+        for waiter in deferred:
+            heapq.heappush(self._heap, waiter)
+        if next_wake is not None:
+            self._timer = asyncio.get_running_loop().call_later(next_wake, self._dispatch)
+
+    def penalize(self, model: str, headers: Mapping[str, str]) -> None:
+        now = time.monotonic()
+        budget = self.budget(model)
+        budget.observe(headers, now)
+        retry_after = parse_duration(headers.get("retry-after")) or self.DEFAULT_PENALTY_SECONDS
+        budget.blocked_until = max(budget.blocked_until, now + retry_after)
+        self.rate_limited += 1
+        logger.warning(f"⏳ {model} rate limited, holding its queue for {retry_after:.1f}s")
+
+    def stats(self) -> dict:
+        now = time.monotonic()
+        return {
+            "running": self._running,
+            "max_concurrency": self._max_concurrency,
+            "queued": sum(1 for w in self._heap if not w.future.done()),
+            "admitted": self.admitted,
+            "throttled": self.throttled,
+            "rate_limited": self.rate_limited,
+            "avg_wait_ms": round(self.wait_seconds / self.throttled * 1000, 1) if self.throttled else 0.0,
+            "models": {model: budget.stats(now) for model, budget in self._budgets.items()},
+        }
@@ -11,25 +11,28 @@ from fastapi import HTTPException, status
 from app.database import get_db
 from app.models.user import UserProfileUpdate, UserResponse
 from app.services.auth import _row_to_user_response
+from app.services.user_cache import invalidate_user, user_cache
 
 
 async def get_profile(user_id: str) -> UserResponse:
     """Get full user profile."""
-    db = await get_db()
-    try:
+    cached = user_cache.get(user_id)
+    if cached is not None:
+        return cached
+
+    async with get_db() as db:
         cursor = await db.execute("SELECT * FROM users WHERE id = ?", (user_id,))
         row = await cursor.fetchone()
         if not row:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
-        return _row_to_user_response(row)
-    finally:
-        await db.close()
+        user = _row_to_user_response(row)
+    user_cache.put(user_id, user)
+    return user
 
 
 async def update_profile(user_id: str, data: UserProfileUpdate) -> UserResponse:
     """Update user profile fields (partial update)."""
-    db = await get_db()
-    try:
+    async with get_db() as db:
         # Build dynamic SET clause from non-None fields
         updates: dict = {}
         update_data = data.model_dump(exclude_none=True)
@@ -60,23 +63,26 @@ async def update_profile(user_id: str, data: UserProfileUpdate) -> UserResponse:
         if result.rowcount == 0:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
 
-        return await get_profile(user_id)
-    finally:
-        await db.close()
+        # Re-read on the same connection rather than borrowing a second one
+        cursor = await db.execute("SELECT * FROM users WHERE id = ?", (user_id,))
+        row = await cursor.fetchone()
+        user = _row_to_user_response(row)
+    user_cache.put(user_id, user)
+    return user
 
 
 async def delete_account(user_id: str) -> dict:
-    """Delete a user account and all their gap reports."""
-    db = await get_db()
-    try:
+    """Delete a user account, their gap reports and their debate transcripts."""
+    async with get_db() as db:
         # Delete gap reports first (FK constraint)
         await db.execute("DELETE FROM gap_reports WHERE user_id = ?", (user_id,))
+        # debate_sessions has no FK to users; its messages go by ON DELETE CASCADE
+        await db.execute("DELETE FROM debate_sessions WHERE user_id = ?", (user_id,))
         result = await db.execute("DELETE FROM users WHERE id = ?", (user_id,))
         await db.commit()
+        invalidate_user(user_id)
 
         if result.rowcount == 0:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
 
         return {"detail": "Account deleted successfully"}
-    finally:
-        await db.close()
@@ -0,0 +1,78 @@
+"""
+Interned system prompts for SocraticCanvas agents.
+Each distinct prompt is built once per worker and carries a stable hash that
+the LLM layer uses as its prefix-cache key.
+"""
+
+import hashlib
+import logging
+from typing import Callable, Hashable
+
+logger = logging.getLogger(__name__)
+
+
+class SystemPrompt(str):
+    """A built system prompt.
+
+    Still a ``str``, so it can go anywhere a prompt string goes, plus:
+      * ``key`` — first 16 hex digits of the text's SHA-256, stable across
+        workers and restarts for the same content;
+      * ``message`` — the ready-made ``{"role": "system", ...}`` chat message.
+    """
+
+    def __new__(cls, text: str) -> "SystemPrompt":
+        prompt = super().__new__(cls, text)
+        prompt.key = hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+        prompt.message = {"role": "system", "content": prompt}
+        return prompt
+
+
+class PromptRegistry:
+    """Builds each system prompt once and hands out the same object afterwards.
+
+    Prompts are looked up by a caller-chosen key such as
+    ``("debater", persona_id, resolution, opponent_name)``; identical texts
+    reached through different keys share one SystemPrompt.
+    """
+
+    def __init__(self):
+        self._by_key: dict[Hashable, SystemPrompt] = {}
+        self._by_hash: dict[str, SystemPrompt] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, build: Callable[[], str]) -> SystemPrompt:
+        prompt = self._by_key.get(key)
+        if prompt is not None:
+            self.hits += 1
+            return prompt
+        self.misses += 1
+        built = SystemPrompt(build())
+        prompt = self._by_hash.setdefault(built.key, built)
+        self._by_key[key] = prompt
+        return prompt
+
+    def clear(self) -> None:
+        """Forget every prompt, e.g. after the persona content was reloaded."""
+        self._by_key.clear()
+        self._by_hash.clear()
+
+    def stats(self) -> dict:
+        return {
+            "prompts": len(self._by_hash),
+            "keys": len(self._by_key),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+# Singleton instance
+_registry: PromptRegistry | None = None
+
+
+def get_prompt_registry() -> PromptRegistry:
+    """Get or create the singleton prompt registry."""
+    global _registry
+    if _registry is None:
+        _registry = PromptRegistry()
+    return _registry
@@ -0,0 +1,130 @@
+"""
+Bounded in-memory session store for SocraticCanvas.
+LRU ordering with an idle TTL, plus a background sweeper that frees
+abandoned debates so a worker's memory stays flat under sustained traffic.
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Generic, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class SessionStore(Generic[T]):
+    """LRU + idle-TTL store with hit/miss/eviction counters."""
+
+    def __init__(self, max_sessions: int, ttl_seconds: float):
+        self._items: OrderedDict[str, tuple[T, float]] = OrderedDict()
+        self._max_sessions = max_sessions
+        self._ttl = ttl_seconds
+        self._sweeper: asyncio.Task | None = None
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0  # dropped to respect max_sessions
+        self.expirations = 0  # dropped after sitting idle past the TTL
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._items
+
+    def _is_expired(self, last_access: float, now: float) -> bool:
+        return self._ttl > 0 and now - last_access > self._ttl
+
+    def get(self, key: str) -> T | None:
+        """Return the item and mark it as most recently used."""
+        entry = self._items.get(key)
+        now = time.monotonic()
+        if entry is None:
+            self.misses += 1
+            return None
+        value, last_access = entry
+        if self._is_expired(last_access, now):
+            del self._items[key]
+            self.expirations += 1
+            self.misses += 1
+            return None
+        self._items[key] = (value, now)
+        self._items.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: str, value: T) -> None:
+        """Insert or refresh an item, evicting the least recently used if full."""
+        self._items[key] = (value, time.monotonic())
+        self._items.move_to_end(key)
+        while self._max_sessions > 0 and len(self._items) > self._max_sessions:
+            evicted_key, _ = self._items.popitem(last=False)
+            self.evictions += 1
+            logger.info(f"Session store full, evicted session {evicted_key}")
+
+    def pop(self, key: str) -> T | None:
+        """Remove an item without counting it as an eviction."""
+        entry = self._items.pop(key, None)
+        return entry[0] if entry else None
+
+    def sweep(self) -> int:
+        """Drop every item idle for longer than the TTL. Returns the count removed."""
+        if self._ttl <= 0:
+            return 0
+        now = time.monotonic()
+        # Items are in access order, so stop at the first one still fresh
+        expired = []
+        for key, (_, last_access) in self._items.items():
+            if not self._is_expired(last_access, now):
+                break
+            expired.append(key)
+        for key in expired:
+            del self._items[key]
+        self.expirations += len(expired)
+        return len(expired)
+
+    def stats(self) -> dict:
+        """Counters for sizing workers from real traffic."""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._items),
+            "max_sessions": self._max_sessions,
+            "ttl_seconds": self._ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+    # ── Background Sweeper ────────────────────────────────────────────
+
+    def start_sweeper(self, interval_seconds: float) -> None:
+        """Start the periodic TTL sweep on the running event loop."""
+        if self._sweeper is not None or interval_seconds <= 0 or self._ttl <= 0:
+            return
+        self._sweeper = asyncio.create_task(self._sweep_loop(interval_seconds))
+
+    async def stop_sweeper(self) -> None:
+        """Cancel the sweeper task and wait for it to exit."""
+        if self._sweeper is None:
+            return
+        self._sweeper.cancel()
+        try:
+            await self._sweeper
+        except asyncio.CancelledError:
+            pass
+        self._sweeper = None
+
+    async def _sweep_loop(self, interval_seconds: float) -> None:
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                removed = self.sweep()
+                if removed:
+                    logger.info(f"Session sweeper expired {removed} idle session(s)")
+            except Exception as e:
+                logger.error(f"Session sweep error: {e}")
@@ -0,0 +1,275 @@
+"""
+Two-tier audio cache for Kokoro TTS in SocraticCanvas.
+A byte-budgeted in-memory LRU in front of a content-addressed disk cache that
+survives restarts and is shared safely by every worker on the host.
+"""
+
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+try:
+    import fcntl  # POSIX only — eviction runs unlocked elsewhere
+except ImportError:
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+
+def audio_cache_key(
+    text: str, voice: str, speed: float, model_version: str, variant: str = ""
+) -> str:
+    """Content address for a synthesized clip (``variant``: encoding, sample rate)."""
+    material = f"{model_version}\x00{voice}\x00{speed:g}\x00{variant}\x00{text}"
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+# ── Memory Tier ──────────────────────────────────────────────────────
+
+
+class MemoryAudioCache:
+    """Thread-safe LRU bounded by the total size of the stored clips."""
+
+    def __init__(self, max_bytes: int):
+        self._items: OrderedDict[str, bytes] = OrderedDict()
+        self._max_bytes = max_bytes
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            audio = self._items.get(key)
+            if audio is None:
+                self.misses += 1
+                return None
+            self._items.move_to_end(key)
+            self.hits += 1
+            return audio
+
+    def put(self, key: str, audio: bytes) -> None:
+        # A single clip larger than the whole budget would just flush everything
+        if len(audio) > self._max_bytes:
+            return
+        with self._lock:
+            previous = self._items.pop(key, None)
+            if previous is not None:
+                self._bytes -= len(previous)
+            self._items[key] = audio
+            self._bytes += len(audio)
+            while self._bytes > self._max_bytes:
+                _, evicted = self._items.popitem(last=False)
+                self._bytes -= len(evicted)
+                self.evictions += 1
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "items": len(self._items),
+            "bytes": self._bytes,
+            "max_bytes": self._max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+        }
+
+
+# ── Disk Tier ────────────────────────────────────────────────────────
+
+
+class DiskAudioCache:
+    """Content-addressed clip store with size-based LRU eviction.
+
+    Files are written to a temp name and renamed into place, so readers in
+    other workers never see partial clips. A read refreshes the file's mtime,
+    which is what eviction orders by; eviction itself takes an exclusive
+    ``flock`` so only one worker scans and deletes at a time.
+    """
+
+    # Re-scan the directory after this many local writes to pick up the
+    # bytes other workers have added in the meantime
+    RESCAN_EVERY_WRITES = 64
+    # Evict down to this fraction of the budget to avoid evicting on every write
+    LOW_WATER = 0.9
+
+    def __init__(self, directory: str, max_bytes: int, suffix: str = ".audio"):
+        self._dir = directory
+        self._max_bytes = max_bytes
+        self._suffix = suffix
+        self._lock = threading.Lock()
+        self._approx_bytes: int | None = None  # unknown until first scan
+        self._writes_since_scan = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+        self.errors = 0
+
+        os.makedirs(self._dir, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self._dir, key[:2], key + self._suffix)
+
+    def get(self, key: str) -> Optional[bytes]:
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                audio = f.read()
+            os.utime(path)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except OSError as e:
+            self.errors += 1
+            self.misses += 1
+            logger.warning(f"TTS disk cache read failed for {key}: {e}")
+            return None
+        self.hits += 1
+        return audio
+
+    def put(self, key: str, audio: bytes) -> None:
+        path = self._path(key)
+        if os.path.exists(path):
+            return
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(audio)
+                os.replace(tmp_path, path)
+            except BaseException:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+                raise
+        except OSError as e:
+            self.errors += 1
+            logger.warning(f"TTS disk cache write failed for {key}: {e}")
+            return
+
+        self.writes += 1
+        with self._lock:
+            if self._approx_bytes is not None:
+                self._approx_bytes += len(audio)
+            self._writes_since_scan += 1
+            needs_check = (
+                self._approx_bytes is None
+                or self._approx_bytes > self._max_bytes
+                or self._writes_since_scan >= self.RESCAN_EVERY_WRITES
+            )
+        if needs_check:
+            self._evict_if_needed()
+
+    def _scan(self) -> list[tuple[float, int, str]]:
+        """Return (mtime, size, path) for every cached clip."""
+        entries = []
+        for shard in os.scandir(self._dir):
+            if not shard.is_dir():
+                continue
+            for entry in os.scandir(shard.path):
+                if not entry.name.endswith(self._suffix):
+                    continue
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue  # evicted by another worker mid-scan
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        return entries
+
+    def _evict_if_needed(self) -> None:
+        lock_file = None
+        try:
+            if fcntl is not None:
+                lock_file = open(os.path.join(self._dir, ".evict.lock"), "a")
+                try:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    return  # another worker is already evicting
+
+            entries = self._scan()
+            total = sum(size for _, size, _ in entries)
+            if total > self._max_bytes:
+                target = int(self._max_bytes * self.LOW_WATER)
+                entries.sort()  # oldest mtime first
+                removed = 0
+                for _, size, path in entries:
+                    if total <= target:
+                        break
+                    try:
+                        os.remove(path)
+                    except FileNotFoundError:
+                        pass
+                    total -= size
+                    removed += 1
+                self.evictions += removed
+                logger.info(f"🔊 TTS disk cache evicted {removed} clip(s)")
+
+            with self._lock:
+                self._approx_bytes = total
+                self._writes_since_scan = 0
+        except OSError as e:
+            self.errors += 1
+            logger.warning(f"TTS disk cache eviction failed: {e}")
+        finally:
+            if lock_file is not None:
+                lock_file.close()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "directory": self._dir,
+            "bytes": self._approx_bytes,
+            "max_bytes": self._max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "writes": self.writes,
+            "evictions": self.evictions,
+            "errors": self.errors,
+        }
+
+
+# ── Tiered Cache ─────────────────────────────────────────────────────
+
+
+class TieredAudioCache:
+    """Memory tier first, then disk; disk hits are promoted into memory."""
+
+    def __init__(self, memory: MemoryAudioCache, disk: Optional[DiskAudioCache] = None):
+        self.memory = memory
+        self.disk = disk
+
+    def get(self, key: str, tier: Optional[str] = None) -> Optional[bytes]:
+        """Look up both tiers, or only ``tier`` ("memory" or "disk")."""
+        if tier != "disk":
+            audio = self.memory.get(key)
+            if audio is not None or tier == "memory" or self.disk is None:
+                return audio
+        elif self.disk is None:
+            return None
+        audio = self.disk.get(key)
+        if audio is not None:
+            self.memory.put(key, audio)
+        return audio
+
+    def put(self, key: str, audio: bytes, memory_only: bool = False) -> None:
+        self.memory.put(key, audio)
+        if self.disk is not None and not memory_only:
+            self.disk.put(key, audio)
+
+    def stats(self) -> dict:
+        return {
+            "memory": self.memory.stats(),
+            "disk": self.disk.stats() if self.disk is not None else None,
+        }
@@ -0,0 +1,443 @@
+"""
+TTS execution engine for SocraticCanvas.
+Runs CPU-bound Kokoro synthesis on a thread or process pool behind a bounded
+priority queue, so audio work never stalls the event loop or live debate SSE
+streams, and speculative prefetch never delays a listener's request.
+"""
+
+import asyncio
+import itertools
+import logging
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import AsyncIterator, Optional
+
+from fastapi import HTTPException, status
+
+from app.config import get_settings
+from app.services.kokoro_tts import (
+    DEFAULT_FORMAT,
+    get_tts_service,
+    resolve_format,
+    split_client_sentences,
+)
+
+logger = logging.getLogger(__name__)
+
+# Lower value runs first
+PRIORITY_INTERACTIVE = 0
+PRIORITY_PREFETCH = 1
+
+
+def _synthesize_job(text: str, role: str, persona_name: str, fmt: str) -> bytes:
+    """Pool entry point — must stay module-level so process pools can pickle it."""
+    # The engine already missed both cache tiers before queueing this job
+    return get_tts_service().synthesize(
+        text=text, role=role, persona_name=persona_name, fmt=fmt, check_cache=False
+    )
+
+
+def _warm_up_job() -> float:
+    """Pool entry point for loading the model ahead of the first request."""
+    return get_tts_service().warm_up()
+
+
+class _Job:
+    """One queued synthesis, shared by every request for the same clip."""
+
+    __slots__ = ("key", "priority", "args", "future", "waiters", "started")
+
+    def __init__(self, key: str, priority: int, args: tuple, future: asyncio.Future):
+        self.key = key
+        self.priority = priority
+        self.args = args
+        self.future = future
+        self.waiters = 0
+        self.started = False
+
+
+class TTSEngine:
+    """Bounded priority queue drained by a fixed number of pool workers.
+
+    Each worker task takes one job at a time and awaits it on the executor, so
+    at most ``workers`` syntheses run at once. Interactive requests always
+    dequeue ahead of prefetch jobs; at most ``queue_size`` of them wait, and
+    anything beyond that is rejected with 503 instead of piling up. Prefetch
+    jobs have their own (silently dropping) bound, and identical clips that
+    are already queued or running are shared rather than synthesized twice.
+    """
+
+    def __init__(
+        self,
+        workers: int,
+        queue_size: int,
+        executor_kind: str = "thread",
+        prefetch_queue_size: int = 0,
+    ):
+        self._workers = max(1, workers)
+        self._queue_size = max(0, queue_size)
+        self._prefetch_queue_size = max(0, prefetch_queue_size)
+        self._executor_kind = executor_kind
+        self._executor: Executor | None = None
+        self._queue: asyncio.PriorityQueue | None = None
+        self._tasks: list[asyncio.Task] = []
+        self._inflight: dict[str, _Job] = {}
+        self._seq = itertools.count()  # FIFO within a priority level
+
+        self.pending = 0  # interactive jobs queued + running
+        self.prefetch_pending = 0
+        self.running = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.shared = 0  # requests served by a job that was already in flight
+        self.prefetch_queued = 0
+        self.prefetch_dropped = 0
+
+        self._warm_task: asyncio.Task | None = None
+        self.warmup_status = "cold"  # cold → warming → ready | failed
+        self.warmup_seconds: float | None = None
+        self.warmup_error: str | None = None
+
+    def _create_executor(self) -> Executor:
+        if self._executor_kind == "process":
+            # spawn: forking a process that already runs pool threads is unsafe
+            return ProcessPoolExecutor(
+                max_workers=self._workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return ThreadPoolExecutor(max_workers=self._workers, thread_name_prefix="tts")
+
+    def _ensure_started(self) -> None:
+        if self._tasks:
+            return
+        self._executor = self._create_executor()
+        # Admission is bounded by the pending counters, not the queue itself
+        self._queue = asyncio.PriorityQueue()
+        self._tasks = [
+            asyncio.create_task(self._worker_loop()) for _ in range(self._workers)
+        ]
+        logger.info(
+            f"🔊 TTS engine started ({self._workers} {self._executor_kind} worker(s), "
+            f"queue size {self._queue_size})"
+        )
+
+    async def _worker_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            _, _, job = await self._queue.get()
+            try:
+                # Every waiter gave up (e.g. client disconnected) before we got here
+                if job.future.done():
+                    continue
+                if job.priority == PRIORITY_PREFETCH:
+                    # prefetch() only checked the memory tier; disk reads block
+                    cached = await asyncio.to_thread(
+                        get_tts_service().get_cached, *job.args, tier="disk"
+                    )
+                    if cached is not None:
+                        if not job.future.done():
+                            job.future.set_result(cached)
+                        continue
+                job.started = True
+                self.running += 1
+                try:
+                    result = await loop.run_in_executor(self._executor, _synthesize_job, *job.args)
+                except asyncio.CancelledError:
+                    # Engine shutting down — don't leave the caller waiting forever
+                    job.future.cancel()
+                    raise
+                except Exception as e:
+                    self.failed += 1
+                    if not job.future.done():
+                        job.future.set_exception(e)
+                else:
+                    self.completed += 1
+                    if not job.future.done():
+                        job.future.set_result(result)
+                finally:
+                    self.running -= 1
+            finally:
+                self._queue.task_done()
+
+    def _enqueue(self, key: str, priority: int, args: tuple) -> _Job:
+        """Queue a job (caller has checked admission) and track it as in flight."""
+        self._ensure_started()
+        job = _Job(key, priority, args, asyncio.get_running_loop().create_future())
+        interactive = priority == PRIORITY_INTERACTIVE
+        if interactive:
+            self.pending += 1
+        else:
+            self.prefetch_pending += 1
+
+        def _on_done(future: asyncio.Future) -> None:
+            if interactive:
+                self.pending -= 1
+            else:
+                self.prefetch_pending -= 1
+            if self._inflight.get(key) is job:
+                del self._inflight[key]
+            if not future.cancelled():
+                future.exception()  # prefetch jobs have no awaiter to retrieve it
+
+        job.future.add_done_callback(_on_done)
+        self._inflight[key] = job
+        self._queue.put_nowait((priority, next(self._seq), job))
+        return job
+
+    # ── Warm-up & Readiness ───────────────────────────────────────────
+
+    def start_warm_up(self) -> None:
+        """Load the model and JIT the ONNX graph in the background (lifespan)."""
+        if self._warm_task is None:
+            self._warm_task = asyncio.create_task(self._warm_up())
+
+    async def _warm_up(self) -> None:
+        self._ensure_started()
+        self.warmup_status = "warming"
+        logger.info("🔊 Warming up Kokoro TTS in the background...")
+        loop = asyncio.get_running_loop()
+        # Process pools hold one model per process, so warm every worker; the
+        # jobs block for seconds, which spreads them across the processes
+        jobs = self._workers if self._executor_kind == "process" else 1
+        try:
+            timings = await asyncio.gather(
+                *(loop.run_in_executor(self._executor, _warm_up_job) for _ in range(jobs))
+            )
+        except Exception as e:
+            self.warmup_status = "failed"
+            self.warmup_error = str(e)
+            logger.error(f"❌ Kokoro TTS warm-up failed: {e}")
+            return
+        self.warmup_status = "ready"
+        self.warmup_seconds = round(max(timings), 2)
+        logger.info(f"🔊 Kokoro TTS warm in {self.warmup_seconds}s")
+
+    @property
+    def ready(self) -> bool:
+        """True when synthesis won't pay the model load on its first call."""
+        if self.warmup_status == "ready":
+            return True
+        # Without an explicit warm-up a thread pool shares this process's model
+        return self._executor_kind == "thread" and get_tts_service().is_ready
+
+    # ── Interactive Requests ──────────────────────────────────────────
+
+    def _live_job(self, key: str) -> Optional[_Job]:
+        job = self._inflight.get(key)
+        # A cancelled job stays mapped until its done callback runs
+        return job if job is not None and not job.future.done() else None
+
+    @staticmethod
+    def _can_share(job: Optional[_Job]) -> bool:
+        return job is not None and (job.started or job.priority == PRIORITY_INTERACTIVE)
+
+    def _admit(self, new_jobs: int) -> None:
+        """Reject with 503 unless ``new_jobs`` more interactive jobs fit."""
+        if new_jobs and self.pending + new_jobs > self._workers + self._queue_size:
+            self.rejected += 1
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="TTS service is busy — try again shortly.",
+                headers={"Retry-After": "1"},
+            )
+
+    def _claim(self, key: str, args: tuple) -> _Job:
+        """Join the in-flight job for ``key`` or queue a new interactive one."""
+        job = self._live_job(key)
+        if self._can_share(job):
+            self.shared += 1
+        else:
+            if job is not None:
+                # Still-queued prefetch of this clip — replace it with an interactive job
+                job.future.cancel()
+            job = self._enqueue(key, PRIORITY_INTERACTIVE, args)
+        job.waiters += 1
+        return job
+
+    @staticmethod
+    def _release(job: _Job) -> None:
+        """Drop one waiter; a job nobody waits for is cancelled if not started."""
+        job.waiters -= 1
+        if job.waiters == 0 and not job.started and not job.future.done():
+            job.future.cancel()
+
+    async def _wait(self, job: _Job) -> bytes:
+        try:
+            # Shielded: one listener disconnecting must not cancel a shared job
+            audio = await asyncio.shield(job.future)
+        finally:
+            self._release(job)
+        if self._executor_kind == "process":
+            # Workers cache in their own memory; keep a copy for this process too
+            get_tts_service().store_cached(*job.args, audio)
+        return audio
+
+    async def synthesize(
+        self,
+        text: str,
+        role: str = "moderator",
+        persona_name: str = "",
+        fmt: str = DEFAULT_FORMAT,
+    ) -> bytes:
+        """Synthesize speech off the event loop at interactive priority.
+
+        Cache hits skip the queue; raises 503 when the queue is full.
+        """
+        tts = get_tts_service()
+        args = (text, role, persona_name, fmt)
+        cached = tts.get_cached(*args, tier="memory")
+        if cached is None:
+            # Disk tier reads are blocking file I/O, but never CPU-heavy
+            cached = await asyncio.to_thread(tts.get_cached, *args, tier="disk")
+        if cached is not None:
+            return cached
+
+        key = tts.cache_key(*args)
+        if not self._can_share(self._live_job(key)):
+            self._admit(1)
+        return await self._wait(self._claim(key, args))
+
+    async def synthesize_batch(
+        self, segments: list[tuple[str, str, str]], fmt: str = DEFAULT_FORMAT
+    ) -> AsyncIterator[tuple[int, bytes | Exception]]:
+        """Schedule every (text, role, persona_name) segment in one pass.
+
+        Identical segments are synthesized once, cache hits skip the queue and
+        admission is all-or-nothing, so a batch either gets a 503 up front or
+        is fully queued. Returns an iterator of ``(index, result)`` in request
+        order, where ``result`` is the audio or the exception that segment hit.
+        """
+        tts = get_tts_service()
+        segments = [(*segment, fmt) for segment in segments]
+        keys = [tts.cache_key(*segment) for segment in segments]
+        unique = dict(zip(keys, segments))
+
+        ready: dict[str, bytes | Exception] = {}
+        for key, segment in unique.items():
+            audio = tts.get_cached(*segment, tier="memory")
+            if audio is not None:
+                ready[key] = audio
+        missing = [key for key in unique if key not in ready]
+        if missing:
+            from_disk = await asyncio.to_thread(
+                lambda: {key: tts.get_cached(*unique[key], tier="disk") for key in missing}
+            )
+            ready.update({key: audio for key, audio in from_disk.items() if audio is not None})
+
+        to_queue = [key for key in unique if key not in ready]
+        self._admit(sum(1 for key in to_queue if not self._can_share(self._live_job(key))))
+        jobs = {key: self._claim(key, unique[key]) for key in to_queue}
+        return self._drain_batch(keys, ready, jobs)
+
+    async def _drain_batch(
+        self, keys: list[str], ready: dict[str, bytes | Exception], jobs: dict[str, _Job]
+    ) -> AsyncIterator[tuple[int, bytes | Exception]]:
+        waiting = dict(jobs)
+        try:
+            for index, key in enumerate(keys):
+                if key not in ready:
+                    try:
+                        ready[key] = await self._wait(waiting.pop(key))
+                    except Exception as e:
+                        ready[key] = e
+                yield index, ready[key]
+        finally:
+            # Client went away — release the segments we never waited on
+            for job in waiting.values():
+                self._release(job)
+
+    def prefetch(
+        self,
+        text: str,
+        role: str = "moderator",
+        persona_name: str = "",
+        fmt: Optional[str] = None,
+    ) -> int:
+        """Queue low-priority synthesis of each sentence of ``text``.
+
+        Sentences are split the same way the debate page splits them and
+        encoded in ``fmt`` — the format the client negotiated for this debate,
+        else ``tts_prefetch_format`` — so later playback requests hit the
+        cache. Returns the number of jobs queued; sentences beyond the
+        prefetch queue bound are dropped, never rejected.
+        """
+        tts = get_tts_service()
+        fmt = fmt or resolve_format(get_settings().tts_prefetch_format) or DEFAULT_FORMAT
+        queued = 0
+        for sentence in split_client_sentences(text):
+            args = (sentence, role, persona_name, fmt)
+            if tts.get_cached(*args, tier="memory") is not None:
+                continue
+            key = tts.cache_key(*args)
+            job = self._inflight.get(key)
+            if job is not None and not job.future.done():
+                continue
+            if self.prefetch_pending >= self._prefetch_queue_size:
+                self.prefetch_dropped += 1
+                continue
+            # The worker loop checks the disk tier before synthesizing
+            self._enqueue(key, PRIORITY_PREFETCH, args)
+            queued += 1
+        self.prefetch_queued += queued
+        return queued
+
+    async def shutdown(self) -> None:
+        """Stop the workers and the pool (called from the app lifespan)."""
+        if self._warm_task is not None:
+            self._warm_task.cancel()
+            await asyncio.gather(self._warm_task, return_exceptions=True)
+            self._warm_task = None
+        for task in self._tasks:
+            task.cancel()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        for job in list(self._inflight.values()):
+            job.future.cancel()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        self._queue = None
+
+    def stats(self) -> dict:
+        return {
+            "ready": self.ready,
+            "warmup": {
+                "status": self.warmup_status,
+                "seconds": self.warmup_seconds,
+                "error": self.warmup_error,
+            },
+            "executor": self._executor_kind,
+            "workers": self._workers,
+            "queue_size": self._queue_size,
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "running": self.running,
+            "completed": self.completed,
+            "failed": self.failed,
+            "rejected": self.rejected,
+            "shared": self.shared,
+            "prefetch": {
+                "pending": self.prefetch_pending,
+                "queued": self.prefetch_queued,
+                "dropped": self.prefetch_dropped,
+            },
+            "cache": get_tts_service().cache_stats(),
+        }
+
+
+_engine: Optional[TTSEngine] = None
+
+
+def get_tts_engine() -> TTSEngine:
+    """Get the singleton TTS engine, sized from Settings."""
+    global _engine
+    if _engine is None:
+        settings = get_settings()
+        _engine = TTSEngine(
+            workers=settings.tts_workers,
+            queue_size=settings.tts_queue_size,
+            executor_kind=settings.tts_executor,
+            prefetch_queue_size=settings.tts_prefetch_queue_size,
+        )
+    return _engine
@@ -0,0 +1,93 @@
+"""
+In-process caches for authenticated requests in SocraticCanvas.
+Keeps decoded JWTs, user rows and gap report listings in memory for a short
+TTL so hot dashboard endpoints don't hit SQLite on every call.
+
+Caches are per worker: a write on another worker becomes visible here once
+the entry expires, so keep the TTLs short.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Generic, TypeVar
+
+from app.config import get_settings
+from app.models.user import GapReportListItem, UserResponse
+
+T = TypeVar("T")
+
+
+class TTLCache(Generic[T]):
+    """LRU cache with an absolute per-entry TTL and hit/miss counters."""
+
+    def __init__(self, max_items: int, ttl_seconds: float):
+        self._items: OrderedDict[str, tuple[T, float]] = OrderedDict()
+        self._max_items = max_items
+        self._ttl = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> T | None:
+        entry = self._items.get(key)
+        if entry is None or entry[1] <= time.monotonic():
+            if entry is not None:
+                del self._items[key]
+            self.misses += 1
+            return None
+        self._items.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def put(self, key: str, value: T, ttl_seconds: float | None = None) -> None:
+        if self._max_items <= 0:
+            return
+        ttl = self._ttl if ttl_seconds is None else min(ttl_seconds, self._ttl)
+        if ttl <= 0:
+            return
+        self._items[key] = (value, time.monotonic() + ttl)
+        self._items.move_to_end(key)
+        while len(self._items) > self._max_items:
+            self._items.popitem(last=False)
+
+    def invalidate(self, key: str) -> None:
+        self._items.pop(key, None)
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._items),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+_settings = get_settings()
+
+# token -> user_id (entries never outlive the token's own expiry)
+token_cache: TTLCache[str] = TTLCache(
+    _settings.token_cache_max_entries, _settings.token_cache_ttl_seconds
+)
+# user_id -> UserResponse
+user_cache: TTLCache[UserResponse] = TTLCache(
+    _settings.user_cache_max_entries, _settings.user_cache_ttl_seconds
+)
+# user_id -> gap report listing
+gap_report_list_cache: TTLCache[list[GapReportListItem]] = TTLCache(
+    _settings.user_cache_max_entries, _settings.user_cache_ttl_seconds
+)
+
+
+def invalidate_user(user_id: str) -> None:
+    """Drop everything cached for a user (profile change or account deletion)."""
+    user_cache.invalidate(user_id)
+    gap_report_list_cache.invalidate(user_id)
+
+
+def cache_stats() -> dict:
+    """Hit rates for /api/health."""
+    return {
+        "tokens": token_cache.stats(),
+        "users": user_cache.stats(),
+        "gap_report_lists": gap_report_list_cache.stats(),
+    }
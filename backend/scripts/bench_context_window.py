@@ -0,0 +1,98 @@
+"""
+Debater context window benchmark — full history vs. ContextWindow.
+
+Plays debates of increasing length (moderator prompt, student question and
+both debaters' replies per round) and, for every debater turn, measures the
+prompt history tokens that would be sent with the full history and with
+ContextWindow. Rolling summaries are generated by the fake Groq server, so
+the time turns spend waiting on a summary is measured too.
+
+Usage (from backend/):
+    python scripts/bench_context_window.py --rounds 3,10,30 --turn-seconds 0.2
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("GROQ_API_KEY", "bench")
+os.environ.setdefault("JWT_SECRET_KEY", "bench")
+
+from app.config import get_settings  # noqa: E402
+from app.models.enums import AgentRole  # noqa: E402
+from app.services.context_window import ContextWindow, count_message_tokens  # noqa: E402
+from app.services.debate_manager import DebateSession  # noqa: E402
+from app.services.llm_client import LLMClient  # noqa: E402
+from fake_groq import serve_in_subprocess  # noqa: E402
+
+REPLY = (
+    "I would argue that the evidence points the other way, and that my opponent "
+    "has overlooked who actually bears the cost of this policy over the long run. "
+) * 6
+QUESTION = "But who pays for it, and why should my generation accept that trade-off?"
+
+
+async def _run(client: LLMClient, rounds: int, turn_seconds: float) -> dict:
+    settings = get_settings()
+    session = DebateSession("bench", "climate-policy")
+    windows = {
+        role: ContextWindow(
+            client,
+            name,
+            recent_turns=settings.context_recent_turns,
+            max_tokens=settings.context_max_tokens,
+            summary_max_tokens=settings.context_summary_max_tokens,
+            refresh_turns=settings.context_summary_refresh_turns,
+        )
+        for role, name in ((AgentRole.DEBATER_A, "Debater A"), (AgentRole.DEBATER_B, "Debater B"))
+    }
+    full_max = window_max = 0
+    waited = 0.0
+    for _ in range(rounds):
+        session.add_message(AgentRole.MODERATOR, "Moderator", "Let us hear from the student.")
+        session.add_message(AgentRole.STUDENT, "Student", QUESTION)
+        for role, window in windows.items():
+            history = session.get_debate_history_for_agent(role)
+            start = time.perf_counter()
+            await window.build(history)
+            waited += time.perf_counter() - start
+            full_max = max(full_max, sum(count_message_tokens(m) for m in history))
+            window_max = max(window_max, window.last_prompt_tokens)
+            session.add_message(role, window.persona_name, REPLY)
+            await asyncio.sleep(turn_seconds)  # the reply being generated
+
+    for window in windows.values():
+        if window._refresh is not None:
+            await window._refresh
+    return {
+        "messages": len(session.messages),
+        "full": full_max,
+        "window": window_max,
+        "summaries": sum(w.summaries for w in windows.values()),
+        "wait_ms": waited / (rounds * 2) * 1000,
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rounds", default="3,10,30", help="comma-separated debate lengths in rounds")
+    parser.add_argument("--latency", type=float, default=0.05, help="fake server seconds to first token")
+    parser.add_argument("--turn-seconds", type=float, default=0.2, help="simulated time to generate each reply")
+    args = parser.parse_args()
+
+    async with serve_in_subprocess("--latency", str(args.latency), "--tokens-per-second", "2000") as url:
+        get_settings().groq_base_url = url
+        client = LLMClient()
+        print(f"{'rounds':>6} {'messages':>8} {'full max tokens':>16} {'window max tokens':>18} "
+              f"{'summaries':>10} {'avg wait ms/turn':>17}")
+        for rounds in (int(v) for v in args.rounds.split(",") if v.strip()):
+            r = await _run(client, rounds, args.turn_seconds)
+            print(f"{rounds:>6} {r['messages']:>8} {r['full']:>16} {r['window']:>18} "
+                  f"{r['summaries']:>10} {r['wait_ms']:>17.1f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
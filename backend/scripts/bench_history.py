@@ -0,0 +1,97 @@
+"""
+Debate history microbenchmark — rebuild-per-turn vs. incremental views.
+
+Simulates long debates (moderator, debater and student messages in rotation)
+and measures the per-turn cost of recording a message and producing both
+debaters' prompt histories, plus building the judge transcript, with the
+original rebuild-everything implementation and with DebateSession's
+incremental views.
+
+Usage (from backend/):
+    python scripts/bench_history.py --messages 50,200,1000,5000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("GROQ_API_KEY", "bench")
+os.environ.setdefault("JWT_SECRET_KEY", "bench")
+
+from app.models.enums import AgentRole  # noqa: E402
+from app.services.debate_manager import DebateSession  # noqa: E402
+
+SPEAKERS = [
+    (AgentRole.MODERATOR, "Moderator"),
+    (AgentRole.DEBATER_A, "Debater A"),
+    (AgentRole.DEBATER_B, "Debater B"),
+    (AgentRole.STUDENT, "Student"),
+]
+CONTENT = (
+    "I would argue that the evidence points the other way, and that my opponent "
+    "has overlooked who actually bears the cost of this policy over the long run. "
+) * 4
+
+
+def _rebuild_history(messages, agent_role: AgentRole) -> list[dict[str, str]]:
+    """The original per-turn history builder, for comparison."""
+    history = []
+    for msg in messages:
+        if msg.role == agent_role:
+            history.append({"role": "assistant", "content": msg.content})
+        elif msg.role == AgentRole.STUDENT:
+            history.append({"role": "user", "content": f"[Student says]: {msg.content}"})
+        elif msg.role == AgentRole.MODERATOR:
+            history.append({"role": "user", "content": f"[Moderator]: {msg.content}"})
+        else:
+            history.append({"role": "user", "content": f"[{msg.persona_name}]: {msg.content}"})
+    return history
+
+
+def _rebuild_transcript(messages) -> str:
+    """The original transcript builder, for comparison."""
+    return "\n\n".join(f"[{msg.persona_name or msg.role.value}]: {msg.content}" for msg in messages)
+
+
+def _run(count: int, incremental: bool) -> tuple[float, float]:
+    """Return (mean µs per turn, µs for the final transcript)."""
+    session = DebateSession("bench", "climate-policy")
+    start = time.perf_counter()
+    for i in range(count):
+        role, name = SPEAKERS[i % len(SPEAKERS)]
+        session.add_message(role, name, CONTENT)
+        if incremental:
+            session.get_debate_history_for_agent(AgentRole.DEBATER_A)
+            session.get_debate_history_for_agent(AgentRole.DEBATER_B)
+        else:
+            _rebuild_history(session.messages, AgentRole.DEBATER_A)
+            _rebuild_history(session.messages, AgentRole.DEBATER_B)
+    per_turn = (time.perf_counter() - start) / count * 1e6
+
+    start = time.perf_counter()
+    if incremental:
+        session.get_full_transcript()
+    else:
+        _rebuild_transcript(session.messages)
+    transcript = (time.perf_counter() - start) * 1e6
+    return per_turn, transcript
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", default="50,200,1000,5000", help="comma-separated debate lengths")
+    args = parser.parse_args()
+
+    print(f"{'messages':>8} {'rebuild µs/turn':>16} {'incremental µs/turn':>20} {'speedup':>8} "
+          f"{'rebuild transcript µs':>22} {'incremental transcript µs':>26}")
+    for count in (int(v) for v in args.messages.split(",") if v.strip()):
+        rebuild_turn, rebuild_transcript = _run(count, incremental=False)
+        incremental_turn, cached_transcript = _run(count, incremental=True)
+        print(f"{count:>8} {rebuild_turn:>16.1f} {incremental_turn:>20.1f} "
+              f"{rebuild_turn / incremental_turn:>7.1f}x {rebuild_transcript:>22.1f} {cached_transcript:>26.1f}")
+
+
+if __name__ == "__main__":
+    main()
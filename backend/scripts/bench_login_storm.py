@@ -0,0 +1,108 @@
+"""
+Login-storm benchmark — SSE latency while bcrypt runs inline vs. on the hash pool.
+
+Fires a burst of concurrent logins at the app while a probe repeatedly hits a
+debate SSE endpoint, and reports the probe's latency with bcrypt running on the
+event loop (the old behaviour) and on the dedicated password hashing pool.
+
+Usage (from backend/):
+    python scripts/bench_login_storm.py --logins 40 --rounds 12
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("GROQ_API_KEY", "bench")
+os.environ.setdefault("JWT_SECRET_KEY", "bench")
+
+import httpx  # noqa: E402
+
+from app import database  # noqa: E402
+from app.config import get_settings  # noqa: E402
+from app.main import app  # noqa: E402
+from app.services import auth  # noqa: E402
+
+EMAIL = "storm@example.com"
+PASSWORD = "bench-password"
+
+
+async def _inline_verify(plain: str, hashed: str) -> bool:
+    """Pre-pool behaviour: bcrypt on the event loop."""
+    return auth.verify_password(plain, hashed)
+
+
+async def _probe(client: httpx.AsyncClient, session_id: str, stop: asyncio.Event, latencies: list[float]):
+    while not stop.is_set():
+        start = time.perf_counter()
+        response = await client.get(f"/api/debates/{session_id}/stream")
+        response.raise_for_status()
+        latencies.append(time.perf_counter() - start)
+        await asyncio.sleep(0.01)
+
+
+async def _run(client: httpx.AsyncClient, session_id: str, logins: int) -> list[float]:
+    latencies: list[float] = []
+    stop = asyncio.Event()
+    probe = asyncio.create_task(_probe(client, session_id, stop, latencies))
+    await asyncio.sleep(0.2)  # idle baseline samples
+    results = await asyncio.gather(
+        *(client.post("/api/auth/login", json={"email": EMAIL, "password": PASSWORD}) for _ in range(logins))
+    )
+    assert all(r.status_code == 200 for r in results), "login failed"
+    stop.set()
+    await probe
+    return latencies
+
+
+def _summary(name: str, latencies: list[float]) -> str:
+    latencies = sorted(latencies)
+    p50 = statistics.median(latencies) * 1000
+    p99 = latencies[int(len(latencies) * 0.99)] * 1000
+    worst = latencies[-1] * 1000
+    return f"{name:<28} {len(latencies):>8} {p50:>9.1f}ms {p99:>9.1f}ms {worst:>9.1f}ms"
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--logins", type=int, default=40)
+    parser.add_argument("--rounds", type=int, default=get_settings().bcrypt_rounds)
+    args = parser.parse_args()
+    get_settings().bcrypt_rounds = args.rounds
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database.DATABASE_PATH = os.path.join(tmp, "bench.db")
+        await database.init_db()
+        transport = httpx.ASGITransport(app=app)
+        try:
+            async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+                response = await client.post(
+                    "/api/auth/register",
+                    json={"email": EMAIL, "username": "storm", "password": PASSWORD},
+                )
+                response.raise_for_status()
+                response = await client.post("/api/debates", json={"topic_id": "climate-policy"})
+                session_id = response.json()["id"]
+
+                pooled_verify = auth.averify_password
+                auth.averify_password = _inline_verify
+                inline = await _run(client, session_id, args.logins)
+                auth.averify_password = pooled_verify
+                pooled = await _run(client, session_id, args.logins)
+        finally:
+            await database.close_pool()
+            auth.shutdown_hash_executor()
+
+    print(f"\n{args.logins} concurrent logins, bcrypt cost {args.rounds}\n")
+    print(f"{'SSE probe latency':<28} {'samples':>8} {'p50':>11} {'p99':>11} {'max':>11}")
+    print(_summary("bcrypt on event loop", inline))
+    print(_summary("bcrypt on hash pool", pooled))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,141 @@
+"""
+SQLite throughput benchmark — default rollback journal vs. the tuned PRAGMA profile.
+
+Runs concurrent readers (user lookups + gap report listings) against concurrent
+gap-report writers through the app's ConnectionPool and reports throughput
+and read latency for each profile.
+
+Usage (from backend/):
+    python scripts/bench_sqlite.py --readers 16 --writers 4 --seconds 10
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("GROQ_API_KEY", "bench")
+os.environ.setdefault("JWT_SECRET_KEY", "bench")
+
+import aiosqlite  # noqa: E402
+
+from app.database import ConnectionPool, _apply_migrations, pragma_statements  # noqa: E402
+
+BASELINE_PROFILE = ("DELETE", ["PRAGMA busy_timeout = 5000", "PRAGMA synchronous = FULL"])
+TUNED_PROFILE = ("WAL", pragma_statements())
+
+USER_COUNT = 200
+
+
+async def _prepare(path: str, journal_mode: str) -> list[str]:
+    """Create the schema and seed users so readers have something to find."""
+    async with aiosqlite.connect(path) as db:
+        await db.execute(f"PRAGMA journal_mode = {journal_mode}")
+        await _apply_migrations(db)
+        now = datetime.now(timezone.utc).isoformat()
+        user_ids = [uuid.uuid4().hex[:16] for _ in range(USER_COUNT)]
+        await db.executemany(
+            """INSERT INTO users (id, email, username, hashed_password, created_at, updated_at)
+               VALUES (?, ?, ?, ?, ?, ?)""",
+            [(uid, f"{uid}@bench.local", "bench", "x", now, now) for uid in user_ids],
+        )
+        await db.commit()
+    return user_ids
+
+
+async def _reader(pool: ConnectionPool, user_ids: list[str], deadline: float, latencies: list[float]):
+    i = 0
+    while time.perf_counter() < deadline:
+        uid = user_ids[i % len(user_ids)]
+        i += 1
+        start = time.perf_counter()
+        async with pool.connection() as db:
+            cursor = await db.execute("SELECT * FROM users WHERE id = ?", (uid,))
+            await cursor.fetchone()
+            cursor = await db.execute(
+                """SELECT id, topic_title, overall_summary, created_at FROM gap_reports
+                   WHERE user_id = ? ORDER BY created_at DESC""",
+                (uid,),
+            )
+            await cursor.fetchall()
+        latencies.append(time.perf_counter() - start)
+
+
+async def _writer(pool: ConnectionPool, user_ids: list[str], deadline: float, counter: list[int]):
+    i = 0
+    payload = json.dumps(["point one", "point two", "point three"])
+    while time.perf_counter() < deadline:
+        uid = user_ids[i % len(user_ids)]
+        i += 1
+        async with pool.connection() as db:
+            await db.execute(
+                """INSERT INTO gap_reports
+                   (id, user_id, debate_session_id, topic_title, reasoning_blind_spots,
+                    evidence_gaps, overall_summary, created_at)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+                (uuid.uuid4().hex[:16], uid, uuid.uuid4().hex, "Bench", payload, payload,
+                 "summary " * 40, datetime.now(timezone.utc).isoformat()),
+            )
+            await db.commit()
+        counter[0] += 1
+
+
+async def run_profile(name: str, journal_mode: str, pragmas: list[str], args) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.db")
+        user_ids = await _prepare(path, journal_mode)
+        pool = ConnectionPool(
+            path,
+            max_size=args.readers + args.writers,
+            health_check_seconds=60,
+            pragmas=pragmas,
+        )
+        latencies: list[float] = []
+        writes = [0]
+        deadline = time.perf_counter() + args.seconds
+        await asyncio.gather(
+            *(_reader(pool, user_ids, deadline, latencies) for _ in range(args.readers)),
+            *(_writer(pool, user_ids, deadline, writes) for _ in range(args.writers)),
+        )
+        await pool.close()
+
+    latencies.sort()
+    return {
+        "profile": name,
+        "reads_per_s": len(latencies) / args.seconds,
+        "writes_per_s": writes[0] / args.seconds,
+        "read_p50_ms": statistics.median(latencies) * 1000 if latencies else 0.0,
+        "read_p95_ms": latencies[int(len(latencies) * 0.95)] * 1000 if latencies else 0.0,
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--readers", type=int, default=16)
+    parser.add_argument("--writers", type=int, default=4)
+    parser.add_argument("--seconds", type=float, default=10.0)
+    args = parser.parse_args()
+
+    results = [
+        await run_profile("baseline (DELETE, synchronous=FULL)", *BASELINE_PROFILE, args),
+        await run_profile("tuned (WAL + PRAGMA profile)", *TUNED_PROFILE, args),
+    ]
+
+    print(f"\n{args.readers} readers / {args.writers} writers, {args.seconds:.0f}s per profile\n")
+    print(f"{'profile':<38} {'reads/s':>10} {'writes/s':>10} {'read p50':>10} {'read p95':>10}")
+    for r in results:
+        print(
+            f"{r['profile']:<38} {r['reads_per_s']:>10.0f} {r['writes_per_s']:>10.0f} "
+            f"{r['read_p50_ms']:>8.2f}ms {r['read_p95_ms']:>8.2f}ms"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,130 @@
+"""
+Kokoro TTS benchmark — sweeps ONNX Runtime session options and replica counts.
+
+For every combination of replicas, intra-op threads, inter-op threads, graph
+optimization level and execution mode, loads that many Kokoro replicas, warms
+them, synthesizes a fixed set of debate sentences with one thread per replica,
+and reports the real-time factor (wall time / audio time, lower is better) and
+sentences per second.
+
+Requires the TTS dependencies and model files (see README "TTS Setup").
+
+Usage (from backend/):
+    python scripts/bench_tts.py --replicas 1,2,4 --intra 0,1,2,4 --sentences 24
+"""
+
+import argparse
+import itertools
+import os
+import queue
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("GROQ_API_KEY", "bench")
+os.environ.setdefault("JWT_SECRET_KEY", "bench")
+
+from app.services.kokoro_tts import (  # noqa: E402
+    DEFAULT_SPEED,
+    OnnxOptions,
+    create_kokoro,
+    get_tts_service,
+)
+
+SENTENCES = [
+    "Welcome to today's debate on the future of work.",
+    "I would argue that automation creates more jobs than it destroys.",
+    "History shows that every industrial revolution displaced workers before it lifted wages.",
+    "But the pace of this transition is unlike anything we have seen before.",
+    "Can you point to evidence that retraining programs actually work at scale?",
+    "Several longitudinal studies suggest modest but real gains for participants.",
+    "Let's pause here and invite our student to weigh in.",
+    "The strongest counterargument concerns who captures the productivity gains.",
+]
+
+
+def _ints(value: str) -> list[int]:
+    return [int(v) for v in value.split(",") if v.strip()]
+
+
+def _strs(value: str) -> list[str]:
+    return [v.strip() for v in value.split(",") if v.strip()]
+
+
+def _run(options: OnnxOptions, sentences: list[str], voice: str) -> dict:
+    load_start = time.perf_counter()
+    replicas = [create_kokoro(options) for _ in range(options.replicas)]
+    load_seconds = time.perf_counter() - load_start
+
+    for replica in replicas:
+        replica.create("Warming up.", voice=voice, speed=DEFAULT_SPEED, lang="en-us")
+
+    idle: queue.Queue = queue.Queue()
+    for replica in replicas:
+        idle.put(replica)
+
+    def synthesize(text: str) -> tuple[float, float]:
+        kokoro = idle.get()
+        try:
+            start = time.perf_counter()
+            samples, sample_rate = kokoro.create(text, voice=voice, speed=DEFAULT_SPEED, lang="en-us")
+            return time.perf_counter() - start, len(samples) / sample_rate
+        finally:
+            idle.put(kokoro)
+
+    wall_start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=options.replicas) as pool:
+        results = list(pool.map(synthesize, sentences))
+    wall = time.perf_counter() - wall_start
+
+    latencies = [latency for latency, _ in results]
+    audio_seconds = sum(duration for _, duration in results)
+    return {
+        "load_s": load_seconds,
+        "rtf": wall / audio_seconds,
+        "sent_per_s": len(sentences) / wall,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "max_ms": max(latencies) * 1000,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--replicas", type=_ints, default=[1, 2], help="comma-separated replica counts")
+    parser.add_argument("--intra", type=_ints, default=[0], help="intra-op threads per replica (0 = cores / replicas)")
+    parser.add_argument("--inter", type=_ints, default=[0], help="inter-op threads (0 = ORT default)")
+    parser.add_argument("--opt", type=_strs, default=["all"], help="graph optimization: disable,basic,extended,all")
+    parser.add_argument("--mode", type=_strs, default=["sequential"], help="execution mode: sequential,parallel")
+    parser.add_argument("--sentences", type=int, default=24, help="sentences per configuration")
+    parser.add_argument("--voice", default="am_adam")
+    args = parser.parse_args()
+
+    # Make sure the model files exist (downloads them on first run)
+    get_tts_service()._download_model_files()
+
+    cores = os.cpu_count() or 1
+    sentences = list(itertools.islice(itertools.cycle(SENTENCES), args.sentences))
+    print(f"{cores} cores, {len(sentences)} sentences per run\n")
+    print(f"{'replicas':>8} {'intra':>5} {'inter':>5} {'opt':>9} {'mode':>10} "
+          f"{'load s':>7} {'RTF':>6} {'sent/s':>7} {'p50 ms':>7} {'max ms':>7}")
+
+    for replicas, intra, inter, opt, mode in itertools.product(
+        args.replicas, args.intra, args.inter, args.opt, args.mode
+    ):
+        if intra <= 0:
+            intra = max(1, cores // replicas)
+        options = OnnxOptions(intra, inter, opt, mode, replicas)
+        try:
+            r = _run(options, sentences, args.voice)
+        except Exception as e:
+            print(f"{replicas:>8} {intra:>5} {inter:>5} {opt:>9} {mode:>10}  failed: {e}")
+            continue
+        print(f"{replicas:>8} {intra:>5} {inter:>5} {opt:>9} {mode:>10} "
+              f"{r['load_s']:>7.2f} {r['rtf']:>6.3f} {r['sent_per_s']:>7.2f} "
+              f"{r['p50_ms']:>7.0f} {r['max_ms']:>7.0f}")
+
+
+if __name__ == "__main__":
+    main()
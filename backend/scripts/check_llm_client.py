@@ -0,0 +1,162 @@
+"""
+LLM client checks — runs LLMClient against the fake Groq server.
+
+Verifies that:
+  * concurrent agenerate / agenerate_stream calls never stall the event loop
+    (a 10 ms ticker measures loop lag while they run);
+  * generate() refuses to run on a running event loop and works without one;
+  * temperature / max_tokens are forwarded identically by all three methods,
+    including an explicit temperature of 0.0.
+
+Exits non-zero if any check fails.
+
+Usage (from backend/):
+    python scripts/check_llm_client.py --calls 40 --latency 0.3
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("GROQ_API_KEY", "bench")
+os.environ.setdefault("JWT_SECRET_KEY", "bench")
+
+import httpx  # noqa: E402
+
+from app.config import get_settings  # noqa: E402
+from app.services.llm_client import LLMClient  # noqa: E402
+from fake_groq import serve_in_subprocess  # noqa: E402
+
+SYSTEM = "You are a debater."
+MESSAGES = [{"role": "user", "content": "Make your opening statement."}]
+
+failures: list[str] = []
+
+
+def check(name: str, ok: bool, detail: str = "") -> None:
+    print(f"{'PASS' if ok else 'FAIL'}  {name}{f'  ({detail})' if detail else ''}")
+    if not ok:
+        failures.append(name)
+
+
+async def _max_loop_lag(work, interval: float = 0.01) -> float:
+    """Run ``work`` while a ticker records the worst event-loop lag."""
+    worst = 0.0
+    done = asyncio.Event()
+
+    async def ticker():
+        nonlocal worst
+        while not done.is_set():
+            start = time.perf_counter()
+            await asyncio.sleep(interval)
+            worst = max(worst, time.perf_counter() - start - interval)
+
+    task = asyncio.create_task(ticker())
+    try:
+        await work
+    finally:
+        done.set()
+        await task
+    return worst
+
+
+async def _last_requests(url: str, n: int) -> list[dict]:
+    async with httpx.AsyncClient() as client:
+        return (await client.get(f"{url}/requests")).json()[-n:]
+
+
+async def check_loop_not_blocked(client: LLMClient, calls: int, max_lag_ms: float) -> None:
+    async def stream() -> str:
+        return "".join([t async for t in client.agenerate_stream(SYSTEM, MESSAGES, max_tokens=80)])
+
+    async def work():
+        results = await asyncio.gather(*(
+            client.agenerate(SYSTEM, MESSAGES, max_tokens=80) if i % 2 else stream()
+            for i in range(calls)
+        ))
+        check("concurrent calls return text", all(results), f"{calls} calls")
+
+    # The first call pays one-off SDK setup (connection pool, response models)
+    await client.agenerate(SYSTEM, MESSAGES, max_tokens=10)
+    await stream()
+
+    start = time.perf_counter()
+    lag = await _max_loop_lag(work())
+    elapsed = time.perf_counter() - start
+    check("event loop never stalls", lag * 1000 < max_lag_ms,
+          f"max lag {lag * 1000:.1f} ms over {elapsed:.2f}s, limit {max_lag_ms:.0f} ms")
+
+
+async def check_generate_refuses_running_loop(client: LLMClient) -> None:
+    try:
+        client.generate(SYSTEM, MESSAGES)
+    except RuntimeError:
+        check("generate() raises on a running loop", True)
+    else:
+        check("generate() raises on a running loop", False, "returned instead of raising")
+
+
+async def check_parameters(client: LLMClient, url: str) -> None:
+    await client.agenerate(SYSTEM, MESSAGES, temperature=0.0, max_tokens=50)
+    async for _ in client.agenerate_stream(SYSTEM, MESSAGES, temperature=0.0, max_tokens=50):
+        pass
+    # generate() needs a thread with no running loop
+    await asyncio.to_thread(client.generate, SYSTEM, MESSAGES, 0.0, 50)
+    explicit = await _last_requests(url, 3)
+    check("explicit temperature=0.0 is kept",
+          [r["temperature"] for r in explicit] == [0.0, 0.0, 0.0], str(explicit))
+    check("explicit max_tokens is kept",
+          [r["max_tokens"] for r in explicit] == [50, 50, 50], str(explicit))
+
+    await client.agenerate(SYSTEM, MESSAGES)
+    async for _ in client.agenerate_stream(SYSTEM, MESSAGES):
+        pass
+    await asyncio.to_thread(client.generate, SYSTEM, MESSAGES)
+    defaults = await _last_requests(url, 3)
+    expected = [(client.temperature, client.max_tokens)] * 3
+    check("defaults are applied consistently",
+          [(r["temperature"], r["max_tokens"]) for r in defaults] == expected, str(defaults))
+
+
+def check_generate_without_loop() -> None:
+    result: dict = {}
+
+    def run():
+        try:
+            result["text"] = LLMClient().generate(SYSTEM, MESSAGES, max_tokens=40)
+        except Exception as e:
+            result["error"] = e
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    thread.join()
+    check("generate() works without an event loop", bool(result.get("text")), repr(result.get("error", "")))
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=40, help="concurrent calls in the loop-lag check")
+    parser.add_argument("--latency", type=float, default=0.3, help="fake server seconds to first token")
+    parser.add_argument("--max-lag-ms", type=float, default=50.0)
+    args = parser.parse_args()
+
+    async with serve_in_subprocess("--latency", str(args.latency), "--tokens-per-second", "400") as url:
+        get_settings().groq_base_url = url
+        client = LLMClient()
+        await check_loop_not_blocked(client, args.calls, args.max_lag_ms)
+        await check_generate_refuses_running_loop(client)
+        await check_parameters(client, url)
+        await asyncio.to_thread(check_generate_without_loop)
+
+    if failures:
+        print(f"\n{len(failures)} check(s) failed")
+        sys.exit(1)
+    print("\nAll checks passed")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
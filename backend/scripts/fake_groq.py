@@ -0,0 +1,360 @@
+"""
+Fake Groq server — a local stand-in for the Groq chat-completions API.
+
+Speaks the OpenAI/Groq ``POST /openai/v1/chat/completions`` protocol, both
+plain JSON and ``stream=true`` server-sent events, so the real Groq SDK (and
+therefore the whole debate pipeline) can run against it. Replies are canned:
+judge and gap-report prompts get their "EXACT format" template filled in with
+scores and filler, everything else gets persona-style debate prose.
+
+Latency, generation speed and rate limiting are configurable, including the
+``x-ratelimit-*`` headers and 429 responses Groq sends, as are injected 5xx
+errors and slow-tail replies for exercising retries and hedging. Repeated
+system prompts are reported as cached prompt tokens, like Groq's prompt cache.
+
+Usage (from backend/):
+    python scripts/fake_groq.py --port 8090 --latency 0.3 --tokens-per-second 250
+    GROQ_BASE_URL=http://127.0.0.1:8090 uvicorn app.main:app
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import random
+import re
+import socket
+import subprocess
+import sys
+import time
+import uuid
+from collections import defaultdict, deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+import httpx
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+PERSONA_SENTENCES = [
+    "Let me begin with the evidence, because intuition alone will not settle this.",
+    "My opponent raises a fair point, but it rests on an assumption that does not hold.",
+    "History offers a useful parallel here, though not a perfect one.",
+    "Consider what happens to the people who bear the costs of this policy.",
+    "The data we have is incomplete, and I think we should say so openly.",
+    "If we follow that argument to its conclusion, we end up somewhere neither of us wants to be.",
+    "I would ask the student to weigh the long-term consequences, not just the immediate ones.",
+    "There is a real trade-off between efficiency and fairness in this question.",
+    "That claim sounds persuasive, yet the strongest studies point the other way.",
+    "So the question is not whether to act, but how and on whose terms.",
+]
+
+FILLER = [
+    "Grounds the argument in concrete examples",
+    "Relies on an unstated assumption about incentives",
+    "Could engage more directly with the opposing evidence",
+    "Identifies the central trade-off clearly",
+    "Would benefit from a counterexample",
+]
+
+# Placeholders in the judge / gap report templates, e.g. "[score]" or "[one sentence]"
+_PLACEHOLDER = re.compile(r"\[([^\]]+)\]")
+_SCORE = re.compile(r"\[score\]\s*/\s*(\d+)")
+
+
+# ── Canned Replies ───────────────────────────────────────────────────
+
+
+def _fill_template(template: str, rng: random.Random) -> str:
+    """Fill a prompt's EXACT-format template with plausible values."""
+
+    def score(match: re.Match) -> str:
+        scale = int(match.group(1))
+        return f"{rng.randint(max(1, scale // 2), scale)}/{scale}"
+
+    text = _SCORE.sub(score, template)
+    return _PLACEHOLDER.sub(lambda _: rng.choice(FILLER), text)
+
+
+def canned_reply(messages: list[dict], max_tokens: int, rng: random.Random) -> str:
+    """Pick a reply that the app's parsers will accept for this prompt."""
+    system = next((m.get("content") or "" for m in messages if m.get("role") == "system"), "")
+    if "EXACT format" in system:
+        template = system.split("EXACT format:", 1)[1]
+        # Drop the trailing style guidance after the template
+        template = template.split("\n\nFormat as", 1)[0].strip()
+        return _fill_template(template, rng)
+
+    # Roughly 1.3 tokens per word; leave some headroom below max_tokens
+    budget = max(8, int(min(max_tokens, 400) * 0.6))
+    words: list[str] = []
+    for sentence in itertools.cycle(rng.sample(PERSONA_SENTENCES, len(PERSONA_SENTENCES))):
+        if len(words) >= budget:
+            break
+        words.extend(sentence.split())
+    return " ".join(words)
+
+
+def _tokenize(text: str) -> list[str]:
+    """Split into word-ish tokens that concatenate back to ``text``."""
+    return re.findall(r"\S+\s*|\s+", text)
+
+
+def _count_prompt_tokens(messages: list[dict]) -> int:
+    return sum(len((m.get("content") or "")) for m in messages) // 4
+
+
+# ── Rate Limiting ────────────────────────────────────────────────────
+
+
+class RateLimiter:
+    """Per-model sliding one-minute windows for requests and tokens."""
+
+    WINDOW = 60.0
+
+    def __init__(self, rpm: int, tpm: int):
+        self.rpm = rpm
+        self.tpm = tpm
+        self._requests: dict[str, deque[float]] = defaultdict(deque)
+        self._tokens: dict[str, deque[tuple[float, int]]] = defaultdict(deque)
+
+    def _trim(self, model: str, now: float) -> None:
+        requests, tokens = self._requests[model], self._tokens[model]
+        while requests and requests[0] <= now - self.WINDOW:
+            requests.popleft()
+        while tokens and tokens[0][0] <= now - self.WINDOW:
+            tokens.popleft()
+
+    def admit(self, model: str, tokens: int) -> tuple[bool, float, dict]:
+        """Return (allowed, retry_after_seconds, x-ratelimit headers)."""
+        now = time.monotonic()
+        self._trim(model, now)
+        requests, used = self._requests[model], self._tokens[model]
+        used_tokens = sum(n for _, n in used)
+
+        retry_after = 0.0
+        if self.rpm and len(requests) >= self.rpm:
+            retry_after = max(retry_after, requests[0] + self.WINDOW - now)
+        if self.tpm and used_tokens + tokens > self.tpm and used:
+            retry_after = max(retry_after, used[0][0] + self.WINDOW - now)
+
+        allowed = retry_after == 0.0
+        if allowed:
+            requests.append(now)
+            used.append((now, tokens))
+            used_tokens += tokens
+
+        headers = {}
+        if self.rpm:
+            reset = requests[0] + self.WINDOW - now if requests else 0.0
+            headers["x-ratelimit-limit-requests"] = str(self.rpm)
+            headers["x-ratelimit-remaining-requests"] = str(max(0, self.rpm - len(requests)))
+            headers["x-ratelimit-reset-requests"] = f"{reset:.2f}s"
+        if self.tpm:
+            reset = used[0][0] + self.WINDOW - now if used else 0.0
+            headers["x-ratelimit-limit-tokens"] = str(self.tpm)
+            headers["x-ratelimit-remaining-tokens"] = str(max(0, self.tpm - used_tokens))
+            headers["x-ratelimit-reset-tokens"] = f"{reset:.2f}s"
+        return allowed, retry_after, headers
+
+
+# ── App ──────────────────────────────────────────────────────────────
+
+
+def create_app(
+    latency: float = 0.2,
+    jitter: float = 0.1,
+    tokens_per_second: float = 200.0,
+    error_rate: float = 0.0,
+    server_error_rate: float = 0.0,
+    slow_rate: float = 0.0,
+    slow_latency: float = 5.0,
+    rpm: int = 0,
+    tpm: int = 0,
+    seed: int | None = None,
+) -> FastAPI:
+    """Build the fake server; all timing knobs are in seconds."""
+    app = FastAPI(title="Fake Groq")
+    rng = random.Random(seed)
+    limiter = RateLimiter(rpm, tpm)
+    stats = {"requests": 0, "streams": 0, "rate_limited": 0, "injected_errors": 0, "server_errors": 0,
+             "slow_replies": 0, "completion_tokens": 0, "cached_prompt_tokens": 0}
+    seen_prefixes: set[tuple[str, str]] = set()  # (model, system prompt) already served
+    recent: deque[dict] = deque(maxlen=100)  # sampling parameters of the latest requests
+
+    def rate_limited(retry_after: float, headers: dict, message: str) -> JSONResponse:
+        stats["rate_limited"] += 1
+        headers = {**headers, "retry-after": f"{max(retry_after, 0.05):.2f}"}
+        body = {"error": {"message": message, "type": "tokens", "code": "rate_limit_exceeded"}}
+        return JSONResponse(body, status_code=429, headers=headers)
+
+    @app.post("/openai/v1/chat/completions")
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        body = await request.json()
+        model = body.get("model", "fake-model")
+        messages = body.get("messages", [])
+        max_tokens = body.get("max_tokens") or body.get("max_completion_tokens") or 1024
+        stats["requests"] += 1
+        recent.append({
+            "model": model,
+            "temperature": body.get("temperature"),
+            "max_tokens": body.get("max_tokens"),
+            "stream": bool(body.get("stream")),
+        })
+
+        prompt_tokens = _count_prompt_tokens(messages)
+        allowed, retry_after, headers = limiter.admit(model, prompt_tokens + max_tokens)
+        if not allowed:
+            return rate_limited(
+                retry_after, headers,
+                f"Rate limit reached for model `{model}`. Please try again in {retry_after:.2f}s.",
+            )
+        if error_rate and rng.random() < error_rate:
+            stats["injected_errors"] += 1
+            return rate_limited(0.2, headers, f"Rate limit reached for model `{model}` (injected).")
+        if server_error_rate and rng.random() < server_error_rate:
+            stats["server_errors"] += 1
+            body = {"error": {"message": "Internal server error (injected)", "type": "internal_server_error"}}
+            return JSONResponse(body, status_code=500, headers=headers)
+
+        tokens = _tokenize(canned_reply(messages, max_tokens, rng))[:max_tokens]
+        stats["completion_tokens"] += len(tokens)
+        completion_id = f"chatcmpl-{uuid.uuid4().hex[:24]}"
+        created = int(time.time())
+        cached_tokens = 0
+        if messages and messages[0].get("role") == "system":
+            prefix = (model, messages[0].get("content") or "")
+            if prefix in seen_prefixes:
+                cached_tokens = _count_prompt_tokens(messages[:1])
+            seen_prefixes.add(prefix)
+        stats["cached_prompt_tokens"] += cached_tokens
+        usage = {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": len(tokens),
+            "total_tokens": prompt_tokens + len(tokens),
+            "prompt_tokens_details": {"cached_tokens": cached_tokens},
+        }
+        first_token_delay = max(0.0, latency + rng.uniform(-jitter, jitter))
+        if slow_rate and rng.random() < slow_rate:
+            stats["slow_replies"] += 1
+            first_token_delay = slow_latency
+
+        if not body.get("stream"):
+            await asyncio.sleep(first_token_delay + len(tokens) / tokens_per_second)
+            return JSONResponse(
+                {
+                    "id": completion_id,
+                    "object": "chat.completion",
+                    "created": created,
+                    "model": model,
+                    "choices": [{
+                        "index": 0,
+                        "message": {"role": "assistant", "content": "".join(tokens)},
+                        "finish_reason": "stop",
+                        "logprobs": None,
+                    }],
+                    "usage": usage,
+                },
+                headers=headers,
+            )
+
+        stats["streams"] += 1
+
+        def chunk(delta: dict, finish_reason: str | None = None, **extra) -> str:
+            payload = {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": created,
+                "model": model,
+                "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason, "logprobs": None}],
+                **extra,
+            }
+            return f"data: {json.dumps(payload)}\n\n"
+
+        async def events():
+            await asyncio.sleep(first_token_delay)
+            yield chunk({"role": "assistant", "content": ""})
+            interval = 1.0 / tokens_per_second
+            started = time.monotonic()
+            for i, token in enumerate(tokens):
+                # Pace against the wall clock so per-chunk overhead doesn't slow generation
+                delay = started + i * interval - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                yield chunk({"content": token})
+            yield chunk({}, "stop", x_groq={"id": completion_id, "usage": usage})
+            yield "data: [DONE]\n\n"
+
+        return StreamingResponse(events(), media_type="text/event-stream", headers=headers)
+
+    @app.get("/stats")
+    async def get_stats():
+        return stats
+
+    @app.get("/requests")
+    async def get_requests():
+        return list(recent)
+
+    return app
+
+
+@asynccontextmanager
+async def serve_in_subprocess(*cli_args: str) -> AsyncIterator[str]:
+    """Run this server in a subprocess with ``cli_args`` and yield its base URL."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    proc = subprocess.Popen([sys.executable, os.path.abspath(__file__), "--port", str(port), *cli_args])
+    url = f"http://127.0.0.1:{port}"
+    try:
+        async with httpx.AsyncClient() as client:
+            for _ in range(100):
+                try:
+                    await client.get(f"{url}/stats")
+                    break
+                except httpx.TransportError:
+                    await asyncio.sleep(0.1)
+            else:
+                raise RuntimeError("fake Groq server did not start")
+        yield url
+    finally:
+        proc.terminate()
+        proc.wait()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8090)
+    parser.add_argument("--latency", type=float, default=0.2, help="seconds to first token")
+    parser.add_argument("--jitter", type=float, default=0.1, help="± seconds added to --latency")
+    parser.add_argument("--tokens-per-second", type=float, default=200.0, help="generation speed")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests answered with 429")
+    parser.add_argument("--server-error-rate", type=float, default=0.0, help="fraction answered with 500")
+    parser.add_argument("--slow-rate", type=float, default=0.0, help="fraction of replies delayed by --slow-latency")
+    parser.add_argument("--slow-latency", type=float, default=5.0, help="seconds to first token for slow replies")
+    parser.add_argument("--rpm", type=int, default=0, help="requests per minute per model (0 = unlimited)")
+    parser.add_argument("--tpm", type=int, default=0, help="tokens per minute per model (0 = unlimited)")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    app = create_app(
+        latency=args.latency,
+        jitter=args.jitter,
+        tokens_per_second=args.tokens_per_second,
+        error_rate=args.error_rate,
+        server_error_rate=args.server_error_rate,
+        slow_rate=args.slow_rate,
+        slow_latency=args.slow_latency,
+        rpm=args.rpm,
+        tpm=args.tpm,
+        seed=args.seed,
+    )
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
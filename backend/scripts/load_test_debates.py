@@ -0,0 +1,249 @@
+"""
+Debate load test — drives many concurrent full debates through the API.
+
+Each simulated student creates a debate, starts it, submits three
+interventions and runs the judges, consuming every SSE stream to the end.
+Reports p50/p95/p99 per phase (and time to the first SSE event for the
+streaming phases) so changes to the LLM path can be compared end to end.
+
+By default the app runs in-process on a real uvicorn server with a throwaway
+database, and a fake Groq server (scripts/fake_groq.py) is started as a
+subprocess so no real API calls are made. Point --llm-url at an already
+running fake server, or --app-url at an already running app, to skip either.
+
+Usage (from backend/):
+    python scripts/load_test_debates.py --debates 50 --latency 0.3 --tokens-per-second 150
+    python scripts/load_test_debates.py --debates 20 --rpm 300 --error-rate 0.05
+    python scripts/load_test_debates.py --debates 20 --slow-rate 0.05 --server-error-rate 0.05 --hedge
+"""
+
+import argparse
+import asyncio
+import logging
+import math
+import os
+import socket
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from contextlib import AsyncExitStack, asynccontextmanager
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("GROQ_API_KEY", "bench")
+os.environ.setdefault("JWT_SECRET_KEY", "bench")
+
+import httpx  # noqa: E402
+import uvicorn  # noqa: E402
+
+from app import database  # noqa: E402
+from app.config import get_settings  # noqa: E402
+from app.main import app  # noqa: E402
+from fake_groq import serve_in_subprocess  # noqa: E402
+
+INTERVENTIONS = [
+    "What evidence would change your mind on this?",
+    "Isn't that argument ignoring who actually pays the costs?",
+    "How would your position hold up over the next fifty years?",
+]
+
+STREAMING_PHASES = ("start", "intervene", "judge")
+PHASES = ("create",) + STREAMING_PHASES + ("debate",)
+
+
+class Results:
+    """Per-phase latencies, time to first SSE event, and failures."""
+
+    def __init__(self):
+        self.latencies: dict[str, list[float]] = defaultdict(list)
+        self.first_event: dict[str, list[float]] = defaultdict(list)
+        self.errors: dict[str, int] = defaultdict(int)
+        self.messages: list[str] = []
+
+    def fail(self, phase: str, message: str) -> None:
+        self.errors[phase] += 1
+        if len(self.messages) < 5:
+            self.messages.append(f"{phase}: {message}")
+
+
+def _percentile(values: list[float], p: float) -> float:
+    """Nearest-rank percentile of ``values`` (0 < p <= 100)."""
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(p / 100 * len(ordered)) - 1)]
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+# ── Servers ──────────────────────────────────────────────────────────
+
+
+@asynccontextmanager
+async def _local_app(llm_url: str):
+    """Serve the app in-process on a throwaway database and yield its URL."""
+    get_settings().groq_base_url = llm_url
+    with tempfile.TemporaryDirectory() as tmp:
+        database.DATABASE_PATH = os.path.join(tmp, "loadtest.db")
+        port = _free_port()
+        config = uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning")
+        server = uvicorn.Server(config)
+        task = asyncio.create_task(server.serve())
+        while not server.started:
+            if task.done():
+                task.result()
+            await asyncio.sleep(0.05)
+        try:
+            yield f"http://127.0.0.1:{port}"
+        finally:
+            server.should_exit = True
+            await task
+
+
+# ── Debate Driver ────────────────────────────────────────────────────
+
+
+async def _sse_phase(client: httpx.AsyncClient, results: Results, phase: str, url: str, body=None) -> bool:
+    """POST to an SSE endpoint and read it to the end; False on any error event."""
+    start = time.perf_counter()
+    first_event = None
+    error = None
+    try:
+        async with client.stream("POST", url, json=body) as response:
+            if response.status_code >= 400:
+                await response.aread()
+                error = f"HTTP {response.status_code} {response.text[:120]}"
+            else:
+                event = None
+                async for line in response.aiter_lines():
+                    if line.startswith("event:"):
+                        event = line[6:].strip()
+                        if first_event is None:
+                            first_event = time.perf_counter() - start
+                    elif line.startswith("data:") and event == "error" and error is None:
+                        error = line[5:].strip()
+    except httpx.HTTPError as e:
+        error = f"{type(e).__name__}: {e}"
+
+    if error is not None:
+        results.fail(phase, error)
+        return False
+    results.latencies[phase].append(time.perf_counter() - start)
+    if first_event is not None:
+        results.first_event[phase].append(first_event)
+    return True
+
+
+async def _debate(client: httpx.AsyncClient, results: Results, topic_id: str) -> None:
+    debate_start = time.perf_counter()
+
+    start = time.perf_counter()
+    try:
+        response = await client.post("/api/debates", json={"topic_id": topic_id})
+        response.raise_for_status()
+    except httpx.HTTPError as e:
+        results.fail("create", f"{type(e).__name__}: {e}")
+        return
+    results.latencies["create"].append(time.perf_counter() - start)
+    session_id = response.json()["id"]
+
+    if not await _sse_phase(client, results, "start", f"/api/debates/{session_id}/start"):
+        return
+    for content in INTERVENTIONS:
+        if not await _sse_phase(
+            client, results, "intervene", f"/api/debates/{session_id}/intervene", {"content": content}
+        ):
+            return
+    if not await _sse_phase(client, results, "judge", f"/api/debates/{session_id}/judge"):
+        return
+
+    results.latencies["debate"].append(time.perf_counter() - debate_start)
+
+
+async def _run(app_url: str, args) -> tuple[Results, float]:
+    results = Results()
+    semaphore = asyncio.Semaphore(args.concurrency or args.debates)
+    limits = httpx.Limits(max_connections=None, max_keepalive_connections=None)
+
+    async def one(client: httpx.AsyncClient) -> None:
+        async with semaphore:
+            await _debate(client, results, args.topic)
+
+    async with httpx.AsyncClient(base_url=app_url, timeout=args.timeout, limits=limits) as client:
+        wall_start = time.perf_counter()
+        await asyncio.gather(*(one(client) for _ in range(args.debates)))
+        wall = time.perf_counter() - wall_start
+    return results, wall
+
+
+def _report(results: Results, wall: float, args) -> None:
+    print(f"\n{args.debates} debates, concurrency {args.concurrency or args.debates}, "
+          f"{wall:.1f}s wall, {len(results.latencies['debate']) / wall * 60:.1f} debates/min\n")
+    print(f"{'phase':<24} {'ok':>5} {'err':>5} {'p50':>9} {'p95':>9} {'p99':>9} {'max':>9}")
+
+    def row(name: str, values: list[float], errors: int) -> None:
+        if not values:
+            print(f"{name:<24} {0:>5} {errors:>5}")
+            return
+        p50, p95, p99 = (_percentile(values, p) * 1000 for p in (50, 95, 99))
+        print(f"{name:<24} {len(values):>5} {errors:>5} {p50:>7.0f}ms {p95:>7.0f}ms "
+              f"{p99:>7.0f}ms {max(values) * 1000:>7.0f}ms")
+
+    for phase in PHASES:
+        row(phase, results.latencies[phase], results.errors[phase])
+    for phase in STREAMING_PHASES:
+        row(f"{phase} (first event)", results.first_event[phase], 0)
+
+    if results.messages:
+        print("\nFirst errors:")
+        for message in results.messages:
+            print(f"  {message}")
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--debates", type=int, default=20, help="debates to run")
+    parser.add_argument("--concurrency", type=int, default=0, help="debates in flight at once (0 = all)")
+    parser.add_argument("--topic", default="climate-policy")
+    parser.add_argument("--timeout", type=float, default=300.0, help="per-request timeout in seconds")
+    parser.add_argument("--app-url", help="use a running app instead of serving one in-process")
+    parser.add_argument("--llm-url", help="use a running fake Groq server instead of starting one")
+    parser.add_argument("--hedge", action="store_true", help="enable hedged Groq requests in the in-process app")
+    fake = parser.add_argument_group("fake Groq server (ignored with --llm-url)")
+    fake.add_argument("--latency", type=float, default=0.2, help="seconds to first token")
+    fake.add_argument("--tokens-per-second", type=float, default=200.0)
+    fake.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests answered with 429")
+    fake.add_argument("--server-error-rate", type=float, default=0.0, help="fraction answered with 500")
+    fake.add_argument("--slow-rate", type=float, default=0.0, help="fraction of replies delayed by --slow-latency")
+    fake.add_argument("--slow-latency", type=float, default=5.0, help="seconds to first token for slow replies")
+    fake.add_argument("--rpm", type=int, default=0, help="requests per minute per model (0 = unlimited)")
+    fake.add_argument("--tpm", type=int, default=0, help="tokens per minute per model (0 = unlimited)")
+    args = parser.parse_args()
+    get_settings().llm_hedge = args.hedge
+    # One INFO line per Groq call would drown the report
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    async with AsyncExitStack() as stack:
+        if args.app_url:
+            app_url = args.app_url
+        else:
+            llm_url = args.llm_url or await stack.enter_async_context(serve_in_subprocess(
+                "--latency", str(args.latency),
+                "--tokens-per-second", str(args.tokens_per_second),
+                "--error-rate", str(args.error_rate),
+                "--server-error-rate", str(args.server_error_rate),
+                "--slow-rate", str(args.slow_rate),
+                "--slow-latency", str(args.slow_latency),
+                "--rpm", str(args.rpm),
+                "--tpm", str(args.tpm),
+            ))
+            app_url = await stack.enter_async_context(_local_app(llm_url))
+        results, wall = await _run(app_url, args)
+
+    _report(results, wall, args)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -3,7 +3,7 @@
 import { useEffect, useState, useRef, useCallback } from "react";
 import { useParams, useRouter } from "next/navigation";
 import { DebateSessionResponse, DebateMessage, DebatePhase, AgentRole } from "@/lib/types";
-import { fetchDebate, connectSSE, fetchTTSAudio } from "@/lib/api";
+import { fetchDebate, connectSSE, streamTTSBatch } from "@/lib/api";
 import { useSpeechRecognition } from "@/hooks/useSpeechRecognition";
 import ChatMessage from "@/components/ChatMessage";
 import PhaseIndicator from "@/components/PhaseIndicator";
@@ -53,6 +53,8 @@ export default function DebateArenaPage() {
   const messagesEndRef = useRef<HTMLDivElement>(null);
   const controllerRef = useRef<AbortController | null>(null);
   const newMessageIdsRef = useRef<Set<string>>(new Set());
+  // Streamed drafts whose final `message` event hasn't arrived yet
+  const draftIdsRef = useRef<Set<string>>(new Set());
 
   // Track which message IDs already existed to identify new ones
   const existingIdsRef = useRef<Set<string>>(new Set());
@@ -97,9 +99,9 @@ export default function DebateArenaPage() {
   }, []);
 
   // ── TTS playback with sentence-level pipelining ──────────────────
-  // Splits text into sentences, plays each sequentially.
-  // The first sentence plays almost instantly; the rest synthesize
-  // in the background while earlier sentences are still playing.
+  // Splits text into sentences and requests them all in one batch.
+  // The first sentence plays as soon as it arrives; the rest stream
+  // in while earlier sentences are still playing.
   const playTTS = useCallback(
     async (text: string, role: string, personaName: string, messageId?: string) => {
       // Stop any current playback first
@@ -120,23 +122,19 @@ export default function DebateArenaPage() {
       setTtsLoading(true);
 
       try {
-        // Pipeline: prefetch next sentence while current one plays
-        for (let i = 0; i < sentences.length; i++) {
-          if (abort.signal.aborted) break;
-
-          // Start fetching this sentence
-          const blobPromise = fetchTTSAudio(sentences[i], role, personaName);
-
-          // Also prefetch the NEXT sentence in parallel (warm the cache)
-          if (i + 1 < sentences.length) {
-            fetchTTSAudio(sentences[i + 1], role, personaName).catch(() => {});
-          }
+        const segments = sentences.map((text) => ({ text, role, persona_name: personaName }));
+        let first = true;
 
-          const blob = await blobPromise;
+        for await (const { audio: blob } of streamTTSBatch(segments, abort.signal)) {
           if (abort.signal.aborted) break;
 
           // First sentence arrived — hide the loading spinner
-          if (i === 0) setTtsLoading(false);
+          if (first) {
+            setTtsLoading(false);
+            first = false;
+          }
+          // Segment failed on the server — skip it rather than stop playback
+          if (blob.size === 0) continue;
 
           const url = URL.createObjectURL(blob);
 
@@ -207,15 +205,61 @@ export default function DebateArenaPage() {
     (data: Record<string, unknown>) => {
       const msg = data as unknown as DebateMessage;
       newMessageIdsRef.current.add(msg.id);
+      draftIdsRef.current.delete(msg.id);
       setMessages((prev) => {
-        // Avoid duplicates
-        if (prev.some((m) => m.id === msg.id)) return prev;
+        // Replace the streamed draft (same id) with the final content
+        if (prev.some((m) => m.id === msg.id)) {
+          return prev.map((m) => (m.id === msg.id ? msg : m));
+        }
         return [...prev, msg];
       });
     },
     [playTTS]
   );
 
+  const handleSSEMessageDelta = useCallback(
+    (data: Record<string, unknown>) => {
+      const id = data.id as string;
+      const delta = data.delta as string;
+      newMessageIdsRef.current.add(id);
+      draftIdsRef.current.add(id);
+      setMessages((prev) => {
+        if (prev.some((m) => m.id === id)) {
+          return prev.map((m) =>
+            m.id === id ? { ...m, content: m.content + delta } : m
+          );
+        }
+        return [
+          ...prev,
+          {
+            id,
+            role: data.role as AgentRole,
+            persona_name: data.persona_name as string,
+            content: delta,
+          },
+        ];
+      });
+    },
+    []
+  );
+
+  // Drop drafts the server never recorded (the turn failed mid-stream)
+  const discardDrafts = useCallback((ids: Set<string>) => {
+    if (ids.size === 0) return;
+    ids.forEach((id) => {
+      draftIdsRef.current.delete(id);
+      newMessageIdsRef.current.delete(id);
+    });
+    setMessages((prev) => prev.filter((m) => !ids.has(m.id)));
+  }, []);
+
+  const handleMessageDiscard = useCallback(
+    (data: Record<string, unknown>) => {
+      discardDrafts(new Set([data.id as string]));
+    },
+    [discardDrafts]
+  );
+
   const handlePhaseChange = useCallback(
     (data: Record<string, unknown>) => {
       if (data.phase) setPhase(data.phase as string);
@@ -230,10 +274,14 @@ export default function DebateArenaPage() {
     setStatusMessage(msg);
   }, []);
 
-  const handleError = useCallback((err: string) => {
-    setIsStreaming(false);
-    setError(err);
-  }, []);
+  const handleError = useCallback(
+    (err: string) => {
+      setIsStreaming(false);
+      setError(err);
+      discardDrafts(new Set(draftIdsRef.current));
+    },
+    [discardDrafts]
+  );
 
   // Start debate
   function startDebate() {
@@ -245,6 +293,8 @@ export default function DebateArenaPage() {
       `/debates/${sessionId}/start`,
       {
         onMessage: handleSSEMessage,
+        onMessageDelta: handleSSEMessageDelta,
+        onMessageDiscard: handleMessageDiscard,
         onPhaseChange: handlePhaseChange,
         onDone: handleDone,
         onError: handleError,
@@ -273,6 +323,8 @@ export default function DebateArenaPage() {
       `/debates/${sessionId}/intervene`,
       {
         onMessage: handleSSEMessage,
+        onMessageDelta: handleSSEMessageDelta,
+        onMessageDiscard: handleMessageDiscard,
         onPhaseChange: handlePhaseChange,
         onDone: handleDone,
         onError: handleError,
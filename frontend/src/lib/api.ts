@@ -177,7 +177,8 @@ export async function createDebate(
   const res = await fetch(`${API_BASE}/debates`, {
     method: "POST",
     headers,
-    body: JSON.stringify({ topic_id: topicId }),
+    // Lets the server prefetch speech in the format playback will request
+    body: JSON.stringify({ topic_id: topicId, audio_format: preferredTTSFormats() }),
   });
   if (!res.ok) throw new Error("Failed to create debate");
   return res.json();
@@ -220,10 +221,92 @@ export async function fetchTTSAudio(
   return res.blob();
 }
 
+const TTS_MEDIA_TYPES: Record<string, string> = {
+  wav: "audio/wav",
+  flac: "audio/flac",
+  ogg: "audio/ogg",
+  opus: "audio/ogg; codecs=opus",
+};
+
+let ttsFormatPreference: string | null = null;
+
+/**
+ * Comma-separated TTS formats this browser can play, smallest first.
+ * The server picks the first one it can encode.
+ */
+export function preferredTTSFormats(): string {
+  if (ttsFormatPreference === null) {
+    const probe = typeof Audio !== "undefined" ? new Audio() : null;
+    const formats = ["opus", "flac"].filter(
+      (format) => probe && probe.canPlayType(TTS_MEDIA_TYPES[format]) !== ""
+    );
+    ttsFormatPreference = [...formats, "wav"].join(",");
+  }
+  return ttsFormatPreference;
+}
+
+export interface TTSSegment {
+  text: string;
+  role: string;
+  persona_name?: string;
+}
+
+/**
+ * Synthesize many segments with one request to /api/tts/batch.
+ * Yields each segment's audio (in the most compact format both sides
+ * support) in order as soon as it arrives; an empty Blob means that
+ * segment failed on the server.
+ */
+export async function* streamTTSBatch(
+  segments: TTSSegment[],
+  signal?: AbortSignal
+): AsyncGenerator<{ index: number; audio: Blob }> {
+  const res = await fetch(`${API_BASE}/tts/batch`, {
+    method: "POST",
+    headers: { "Content-Type": "application/json" },
+    body: JSON.stringify({ segments, format: preferredTTSFormats() }),
+    signal,
+  });
+  if (!res.ok || !res.body) {
+    const err = await res.json().catch(() => ({ detail: "TTS failed" }));
+    throw new Error(err.detail || "TTS synthesis failed");
+  }
+  const mediaType = TTS_MEDIA_TYPES[res.headers.get("X-TTS-Format") || "wav"] || "audio/wav";
+
+  // Frames: 4-byte index, 4-byte length (big-endian), then the encoded audio
+  // in the negotiated format (X-TTS-Format)
+  const reader = res.body.getReader();
+  let buffer = new Uint8Array(0);
+  try {
+    while (true) {
+      const { done, value } = await reader.read();
+      if (done) break;
+
+      const merged = new Uint8Array(buffer.length + value.length);
+      merged.set(buffer);
+      merged.set(value, buffer.length);
+      buffer = merged;
+
+      while (buffer.length >= 8) {
+        const view = new DataView(buffer.buffer, buffer.byteOffset, 8);
+        const index = view.getUint32(0);
+        const length = view.getUint32(4);
+        if (buffer.length < 8 + length) break;
+        yield { index, audio: new Blob([buffer.slice(8, 8 + length)], { type: mediaType }) };
+        buffer = buffer.slice(8 + length);
+      }
+    }
+  } finally {
+    reader.releaseLock();
+  }
+}
+
 // ── SSE helper for POST-based EventSource ────────────────────────────
 
 export interface SSECallbacks {
   onMessage?: (data: Record<string, unknown>) => void;
+  onMessageDelta?: (data: Record<string, unknown>) => void;
+  onMessageDiscard?: (data: Record<string, unknown>) => void;
   onPhaseChange?: (data: Record<string, unknown>) => void;
   onJudgeResult?: (data: Record<string, unknown>) => void;
   onReport?: (data: Record<string, unknown>) => void;
@@ -303,6 +386,12 @@ export function connectSSE(
                 case "message":
                   callbacks.onMessage?.(parsed);
                   break;
+                case "message_delta":
+                  callbacks.onMessageDelta?.(parsed);
+                  break;
+                case "message_discard":
+                  callbacks.onMessageDiscard?.(parsed);
+                  break;
                 case "phase_change":
                   callbacks.onPhaseChange?.(parsed);
                   break;